@@ -0,0 +1,118 @@
+"""
+Banco de animações compartilhado do jogo SWITCH BACK.
+
+Cada `Jogador` e cada `Monstro` montava, no próprio `__init__`, uma cópia
+invertida (flip vertical) de todos os frames. Aqui cada variante de uma folha
+de animação — (folha, direções, invertida, escala) — é montada uma única vez
+por processo e compartilhada por referência entre todas as sprites.
+
+Os frames de uma variante ficam num único atlas (uma linha por direção) e são
+entregues como subsuperfícies dele, então criar novas sprites não aloca
+nenhuma superfície.
+"""
+
+from constantes import *
+
+
+class BancoAnimacoes:
+    """Guarda as folhas de animação e as variantes já montadas.
+
+    Attributes:
+        folhas (dict): Mapeia o nome de cada folha para {direção: [frames]} no tamanho base.
+        variantes (dict): Mapeia (folha, direções, invertida, escala) para {direção: [frames]}.
+        atlas (dict): Mapeia (folha, invertida, escala) para a superfície do atlas.
+    """
+
+    def __init__(self):
+        self.folhas = {}
+        self.variantes = {}
+        self.atlas = {}
+
+    def __contains__(self, nome):
+        return nome in self.folhas
+
+    def registrar(self, nome, frames_por_direcao):
+        """Registra (ou substitui) uma folha de animação.
+
+        Args:
+            nome (str): Nome da folha (ex.: 'jogador_mapa').
+            frames_por_direcao (dict): Mapeia cada direção para a lista de frames, já
+                no formato da tela.
+        """
+        self.folhas[nome] = {direcao: list(frames) for direcao, frames in frames_por_direcao.items()}
+        for chave in [chave for chave in self.variantes if chave[0] == nome]:
+            del self.variantes[chave]
+        for chave in [chave for chave in self.atlas if chave[0] == nome]:
+            del self.atlas[chave]
+
+    def obter(self, nome, direcoes=None, invertida=False, escala=1):
+        """Retorna uma variante da folha, montando-a na primeira vez.
+
+        Chamadas com os mesmos argumentos retornam o mesmo dicionário, cujas
+        listas de frames não devem ser modificadas.
+
+        Args:
+            nome (str): Nome da folha registrada.
+            direcoes (tuple[str] | None): Direções incluídas (None = todas).
+            invertida (bool): Se True, os frames são virados de cabeça para baixo.
+            escala (float): Fator de escala aplicado aos frames base.
+
+        Returns:
+            dict: Mapeia cada direção para a lista de frames.
+        """
+        folha = self.folhas[nome]
+        direcoes = tuple(folha) if direcoes is None else tuple(direcoes)
+        chave = (nome, direcoes, invertida, escala)
+        variante = self.variantes.get(chave)
+        if variante is None:
+            completa = self._montar(nome, invertida, escala)
+            variante = {direcao: completa[direcao] for direcao in direcoes}
+            self.variantes[chave] = variante
+        return variante
+
+    def _montar(self, nome, invertida, escala):
+        """Monta o atlas de todas as direções de uma folha e retorna os frames como subsuperfícies."""
+        chave = (nome, tuple(self.folhas[nome]), invertida, escala)
+        if chave in self.variantes:
+            return self.variantes[chave]
+
+        transformados = {}
+        for direcao, frames in self.folhas[nome].items():
+            lista = []
+            for frame in frames:
+                if escala != 1:
+                    frame = pygame.transform.scale_by(frame, escala)
+                if invertida:
+                    frame = pygame.transform.flip(frame, False, True)
+                lista.append(frame)
+            transformados[direcao] = lista
+
+        # uma linha por direção, frames lado a lado
+        largura = max((sum(f.get_width() for f in frames) for frames in transformados.values()), default=0)
+        altura = sum(max((f.get_height() for f in frames), default=0) for frames in transformados.values())
+        modelo = next((frames[0] for frames in transformados.values() if frames), None)
+        if modelo is None:
+            return {direcao: [] for direcao in transformados}
+        atlas = pygame.Surface((max(largura, 1), max(altura, 1)), modelo.get_flags() & pygame.SRCALPHA, modelo)
+        if modelo.get_colorkey() is not None:
+            atlas.set_colorkey(modelo.get_colorkey())
+
+        completa = {}
+        y = 0
+        for direcao, frames in transformados.items():
+            x = 0
+            completa[direcao] = []
+            for frame in frames:
+                # BLEND_RGBA_MAX sobre o atlas zerado copia os pixels (inclusive o alpha) sem misturar
+                atlas.blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+                completa[direcao].append(atlas.subsurface((x, y), frame.get_size()))
+                x += frame.get_width()
+            y += max((f.get_height() for f in frames), default=0)
+
+        self.atlas[(nome, invertida, escala)] = atlas
+        self.variantes[chave] = completa
+        return completa
+
+
+# banco único do processo, compartilhado por todas as telas e sprites
+BANCO_ANIMACOES = BancoAnimacoes()
@@ -0,0 +1,146 @@
+"""
+Cache em disco de imagens já decodificadas e redimensionadas (SWITCH BACK).
+
+Decodificar os PNGs grandes e redimensioná-los é a maior parte do tempo de
+inicialização, e o resultado é sempre o mesmo enquanto o arquivo não muda.
+Aqui os pixels finais de cada (arquivo, tamanho) são gravados crus em
+`PASTA_CACHE/pixels` (na pasta do jogo, ver `utils.caminho_cache`) e, nas
+próximas execuções, lidos por `mmap` e copiados para uma superfície, sem
+decodificar nem escalar nada.
+
+A chave de cada entrada junta um hash do caminho e do tamanho final (a origem)
+e um hash (sha1) do conteúdo do arquivo, então a entrada deixa de ser usada
+automaticamente quando o asset muda. Ao gravar a entrada nova, as antigas da
+mesma origem são apagadas.
+
+Formato de cada entrada (little-endian):
+    cabeçalho  `FORMATO_CABECALHO` (assinatura, largura, altura, formato de pixel)
+    pixels     largura x altura pixels no formato indicado ('RGB' ou 'RGBA')
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+import pygame
+from constantes import *
+from utils import caminho_cache
+
+ASSINATURA = b'SBPX'
+VERSAO_FORMATO = 1
+FORMATO_CABECALHO = '<4sII4s'
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+
+PASTA_PIXELS = caminho_cache('pixels')
+
+
+def chave_pixels(caminho_relativo, dados, tamanho):
+    """Calcula a chave de cache de uma imagem: '<origem>-<conteúdo>'.
+
+    A origem identifica o arquivo e o tamanho final; o conteúdo, os bytes do
+    arquivo (e a versão do formato). Entradas com a mesma origem e outro
+    conteúdo estão desatualizadas.
+
+    Args:
+        caminho_relativo (str): Caminho do arquivo de origem, relativo à raiz do jogo.
+        dados (bytes | memoryview): Conteúdo do arquivo de origem.
+        tamanho (tuple[int, int] | None): Tamanho final (None = tamanho original).
+
+    Returns:
+        str: Chave em hexadecimal (usada como nome do arquivo de cache).
+    """
+    origem = hashlib.sha1(f"{caminho_relativo}:{tamanho}".encode()).hexdigest()[:16]
+    sha = hashlib.sha1(f"{VERSAO_FORMATO}:".encode())
+    sha.update(dados)
+    return f"{origem}-{sha.hexdigest()}"
+
+
+def caminho_pixels(chave):
+    """Retorna o caminho do arquivo de cache de uma chave."""
+    return os.path.join(PASTA_PIXELS, f"{chave}.px")
+
+
+def ler_pixels(chave):
+    """Abre uma entrada do cache como superfície, via mmap.
+
+    Os pixels são copiados da memória mapeada para a superfície e o mapa é
+    fechado antes de retornar.
+
+    Args:
+        chave (str): Chave da imagem (ver `chave_pixels`).
+
+    Returns:
+        pygame.Surface | None: Superfície, ou None se a entrada não existir ou for inválida.
+    """
+    try:
+        with open(caminho_pixels(chave), 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            if len(mapa) < TAMANHO_CABECALHO:
+                return None
+            assinatura, largura, altura, formato = struct.unpack_from(FORMATO_CABECALHO, mapa)
+            formato = formato.rstrip(b'\0').decode('ascii', 'replace')
+            if assinatura != ASSINATURA or formato not in ('RGB', 'RGBA'):
+                return None
+            if len(mapa) != TAMANHO_CABECALHO + largura * altura * len(formato):
+                return None
+
+            # a cópia solta a superfície da memória mapeada, que pode então ser fechada
+            with memoryview(mapa)[TAMANHO_CABECALHO:] as pixels:
+                return pygame.image.frombuffer(pixels, (largura, altura), formato).copy()
+    except (OSError, ValueError):
+        return None
+
+
+def gravar_pixels(chave, superficie):
+    """Grava os pixels de uma superfície no cache e apaga as entradas antigas da mesma origem.
+
+    Superfícies com colorkey não são gravadas: a transparência por colorkey
+    não sobrevive aos pixels crus.
+
+    Args:
+        chave (str): Chave da imagem (ver `chave_pixels`).
+        superficie (pygame.Surface): Superfície já redimensionada, ainda não convertida.
+    """
+    if superficie.get_colorkey() is not None:
+        return
+    formato = 'RGBA' if superficie.get_flags() & pygame.SRCALPHA else 'RGB'
+    largura, altura = superficie.get_size()
+    cabecalho = struct.pack(FORMATO_CABECALHO, ASSINATURA, largura, altura, formato.encode('ascii'))
+
+    caminho = caminho_pixels(chave)
+    temporario = f"{caminho}.{os.getpid()}.{id(superficie)}.tmp"
+    try:
+        os.makedirs(PASTA_PIXELS, exist_ok=True)
+        with open(temporario, 'wb') as f:
+            f.write(cabecalho)
+            f.write(pygame.image.tobytes(superficie, formato))
+        os.replace(temporario, caminho)
+    except OSError as e:
+        print(f"[ASSETS] Não foi possível gravar o cache de pixels {caminho}: {e}")
+        return
+    remover_desatualizadas(chave)
+
+
+def remover_desatualizadas(chave):
+    """Apaga as entradas com a mesma origem de `chave` e outro conteúdo.
+
+    Também apaga as entradas sem origem, gravadas por versões anteriores do cache.
+
+    Args:
+        chave (str): Chave da entrada atual (ver `chave_pixels`).
+    """
+    origem = chave.split('-')[0]
+    try:
+        nomes = os.listdir(PASTA_PIXELS)
+    except OSError:
+        return
+    for nome in nomes:
+        base, extensao = os.path.splitext(nome)
+        if extensao != '.px' or base == chave:
+            continue
+        if base.startswith(origem + '-') or '-' not in base:
+            try:
+                os.remove(os.path.join(PASTA_PIXELS, nome))
+            except OSError:
+                pass
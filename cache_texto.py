@@ -0,0 +1,117 @@
+"""
+Cache de textos renderizados do jogo SWITCH BACK.
+
+Rasterizar texto com `font.render` a cada frame pesa principalmente nas telas
+de menu, que desenham os mesmos textos frame após frame. Aqui cada superfície
+de texto é guardada por (fonte, texto, cor, antialias) numa cache LRU de
+tamanho limitado (`CAPACIDADE_CACHE_TEXTO`).
+
+As superfícies retornadas são compartilhadas: quem precisar alterá-las (ex.:
+`set_alpha`) deve fazer isso a cada uso, antes do blit.
+"""
+
+from collections import OrderedDict
+
+from constantes import *
+
+
+class CacheTexto:
+    """Cache LRU de superfícies de texto.
+
+    Attributes:
+        capacidade (int): Número máximo de textos guardados.
+        acertos (int): Renderizações evitadas.
+        falhas (int): Textos que precisaram ser renderizados.
+    """
+
+    def __init__(self, capacidade=CAPACIDADE_CACHE_TEXTO):
+        """Cria a cache vazia.
+
+        Args:
+            capacidade (int): Número máximo de textos guardados.
+        """
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._textos = OrderedDict()
+
+    def __len__(self):
+        return len(self._textos)
+
+    def render(self, fonte, texto, antialias, cor):
+        """Retorna o texto renderizado, como `fonte.render(texto, antialias, cor)`.
+
+        Args:
+            fonte (pygame.font.Font): Fonte usada.
+            texto (str): Texto a renderizar.
+            antialias (bool): Suavização das bordas.
+            cor (tuple | str): Cor do texto.
+
+        Returns:
+            pygame.Surface: Superfície compartilhada com o texto.
+        """
+        chave = (fonte, texto, cor, antialias)
+        superficie = self._textos.get(chave)
+        if superficie is not None:
+            self._textos.move_to_end(chave)
+            self.acertos += 1
+            return superficie
+
+        self.falhas += 1
+        superficie = fonte.render(texto, antialias, cor)
+        self._textos[chave] = superficie
+        if len(self._textos) > self.capacidade:
+            self._textos.popitem(last=False)
+        return superficie
+
+    def limpar(self):
+        """Descarta todos os textos guardados."""
+        self._textos.clear()
+
+
+# cache única, compartilhada por todas as telas
+CACHE_TEXTO = CacheTexto()
+
+
+def renderizar_texto(fonte, texto, antialias, cor):
+    """Renderiza um texto usando a cache compartilhada (ver `CacheTexto.render`)."""
+    return CACHE_TEXTO.render(fonte, texto, antialias, cor)
+
+
+class RotuloTexto:
+    """Texto de HUD que só é renderizado de novo quando o valor exibido muda.
+
+    Attributes:
+        fonte (pygame.font.Font): Fonte do rótulo.
+        cor (tuple | str): Cor do texto.
+        texto (str | None): Texto exibido no momento.
+        superficie (pygame.Surface | None): Superfície do texto exibido.
+    """
+
+    def __init__(self, fonte, cor, antialias=True):
+        """Cria o rótulo sem texto.
+
+        Args:
+            fonte (pygame.font.Font): Fonte do rótulo.
+            cor (tuple | str): Cor do texto.
+            antialias (bool): Suavização das bordas.
+        """
+        self.fonte = fonte
+        self.cor = cor
+        self.antialias = antialias
+        self.texto = None
+        self.superficie = None
+
+    def definir(self, texto):
+        """Atualiza o texto exibido e retorna a superfície correspondente.
+
+        Args:
+            texto (str): Novo texto; se for igual ao atual, nada é renderizado.
+
+        Returns:
+            pygame.Surface: Superfície do texto.
+        """
+        if texto != self.texto:
+            self.texto = texto
+            self.superficie = renderizar_texto(self.fonte, texto, self.antialias, self.cor)
+        return self.superficie
@@ -0,0 +1,92 @@
+"""
+Cache de superfícies de tiles para o jogo SWITCH BACK.
+
+Cada tile do mapa TMX é desenhada com `SCALE_FACTOR` vezes o tamanho original.
+Em vez de escalar a imagem de novo para cada sprite, o cache escala e converte
+para o formato da tela cada tile distinta (GID + flags de flip) uma única vez
+e compartilha a mesma superfície entre todas as sprites que a usam.
+
+Com `converter=False` as tiles são apenas escaladas, sem criar superfícies no
+formato da tela (uso do compilador de níveis, que roda fora da thread principal).
+"""
+
+import pygame
+from constantes import *
+
+
+class CacheTiles:
+    """Superfícies de tiles escaladas e convertidas, compartilhadas por GID e flip.
+
+    Attributes:
+        tmx_mapa (pytmx.TiledMap): Mapa carregado com `load_pygame`.
+        escala (int): Fator de escala aplicado às tiles.
+        converter (bool): Se True, as tiles são convertidas para o formato da tela.
+        superficies (dict): Mapeia (gid do Tiled, flags de flip) para a superfície pronta.
+    """
+
+    def __init__(self, tmx_mapa, escala=SCALE_FACTOR, converter=True):
+        """Inicializa o cache para um mapa.
+
+        Args:
+            tmx_mapa (pytmx.TiledMap): Mapa TMX já carregado.
+            escala (int): Fator de escala das tiles (padrão: `SCALE_FACTOR`).
+            converter (bool): Se False, as tiles são só escaladas (não exige janela aberta).
+        """
+        self.tmx_mapa = tmx_mapa
+        self.escala = escala
+        self.converter = converter
+        self.superficies = {}
+
+        # o pytmx cria um gid interno para cada combinação (gid do Tiled, flags);
+        # aqui voltamos para essa chave original
+        self._chave_por_gid = {}
+        for gid_tiled, pares in tmx_mapa.gidmap.items():
+            for gid, flags in pares:
+                self._chave_por_gid[gid] = (gid_tiled, tuple(bool(f) for f in flags))
+
+    def __len__(self):
+        return len(self.superficies)
+
+    def chave(self, gid):
+        """Retorna a chave (gid do Tiled, flags de flip) de um gid interno do pytmx."""
+        return self._chave_por_gid.get(gid, (gid, (False, False, False)))
+
+    def superficie(self, gid):
+        """Retorna a superfície escalada (e convertida, se `converter`) de um gid (ou None se não houver imagem).
+
+        Args:
+            gid (int): Gid interno do pytmx (ex.: `objeto.gid` ou vindo de `iter_data`).
+
+        Returns:
+            pygame.Surface | None: Superfície compartilhada da tile.
+        """
+        chave = self.chave(gid)
+        superficie = self.superficies.get(chave)
+        if superficie is None:
+            original = self.tmx_mapa.get_tile_image_by_gid(gid)
+            if original is None:
+                return None
+            superficie = pygame.transform.scale_by(original, self.escala)
+            if self.converter:
+                if superficie.get_flags() & pygame.SRCALPHA:
+                    superficie = superficie.convert_alpha()
+                else:
+                    superficie = superficie.convert()
+            self.superficies[chave] = superficie
+        return superficie
+
+    def tiles(self, nome_camada):
+        """Percorre as tiles de uma camada, como `TiledTileLayer.tiles()`.
+
+        Args:
+            nome_camada (str): Nome da camada de tiles no TMX.
+
+        Yields:
+            tuple[int, int, pygame.Surface]: Coluna, linha e superfície já escalada.
+        """
+        camada = self.tmx_mapa.get_layer_by_name(nome_camada)
+        for x, y, gid in camada.iter_data():
+            if gid:
+                superficie = self.superficie(gid)
+                if superficie is not None:
+                    yield x, y, superficie
@@ -0,0 +1,152 @@
+"""
+Camada estática pré-renderizada em chunks para o jogo SWITCH BACK.
+
+As tiles do mapa não se movem, então em vez de desenhar centenas de sprites
+a cada frame elas são compostas ("assadas") uma única vez em superfícies
+quadradas (chunks). A câmera só precisa desenhar os poucos chunks que tocam a
+tela. Quando uma sprite estática entra ou sai da camada, apenas os chunks que
+ela ocupa são invalidados e reconstruídos na próxima vez que forem desenhados.
+"""
+
+import pygame
+from constantes import *
+from grade_espacial import GradeEspacial
+
+
+class CamadaEstatica:
+    """Conjunto de chunks com as sprites estáticas já compostas.
+
+    Attributes:
+        tamanho_chunk (int): Lado de cada chunk, em pixels.
+        grade (GradeEspacial): Índice das sprites estáticas, com células do tamanho do chunk.
+        chunks (dict): Mapeia (cx, cy) para a superfície já composta do chunk.
+        sujos (set): Chunks que precisam ser reconstruídos antes do próximo desenho.
+    """
+
+    def __init__(self, tamanho_chunk=TAMANHO_CHUNK):
+        """Inicializa uma camada vazia.
+
+        Args:
+            tamanho_chunk (int): Lado dos chunks em pixels (padrão: `TAMANHO_CHUNK`).
+        """
+        self.tamanho_chunk = tamanho_chunk
+        self.grade = GradeEspacial(tamanho_chunk)
+        self.chunks = {}
+        self.sujos = set()
+        self._ordem = {}
+
+    def __len__(self):
+        return len(self.grade)
+
+    def adicionar(self, sprite, ordem=0):
+        """Adiciona uma sprite estática e invalida os chunks que ela ocupa.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com `image` e `rect` definidos.
+            ordem (int): Desempate da ordenação por profundidade (ordem de inserção).
+        """
+        self._ordem[sprite] = ordem
+        self.grade.adicionar(sprite)
+        self.sujos.update(self.grade.celulas_por_sprite[sprite])
+
+    def remover(self, sprite):
+        """Remove uma sprite da camada e invalida os chunks que ela ocupava.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite a remover (ignorada se não estiver na camada).
+        """
+        celulas = self.grade.celulas_por_sprite.get(sprite)
+        if celulas is None:
+            return
+        self.sujos.update(celulas)
+        self.grade.remover(sprite)
+        self._ordem.pop(sprite, None)
+
+        # chunks que ficaram vazios (ex.: região descarregada do mapa) liberam a superfície já
+        for celula in celulas:
+            if celula not in self.grade.celulas:
+                self.chunks.pop(celula, None)
+                self.sujos.discard(celula)
+
+    def invalidar(self, area=None):
+        """Marca chunks para reconstrução.
+
+        Útil quando a imagem de uma sprite estática é alterada sem que ela
+        saia da camada.
+
+        Args:
+            area (pygame.Rect | None): Área do mundo afetada. Se None, invalida todos os chunks.
+        """
+        if area is None:
+            self.sujos.update(self.chunks)
+            self.sujos.update(self.grade.celulas)
+        else:
+            self.sujos.update(self.grade.celulas_do_rect(area))
+
+    def assar(self):
+        """Reconstrói imediatamente todos os chunks sujos.
+
+        Chamado após o carregamento do nível, para que o primeiro frame não
+        pague o custo de composição.
+        """
+        for _ in self.etapas_assar():
+            pass
+
+    def etapas_assar(self):
+        """Reconstrói os chunks sujos um a um, devolvendo o controle após cada chunk.
+
+        Permite distribuir a composição entre frames (ex.: tela de carregamento).
+        """
+        for celula in list(self.sujos):
+            if celula in self.sujos:
+                self._assar_chunk(celula)
+                self.sujos.discard(celula)
+                yield
+
+    def _assar_chunk(self, celula):
+        """Compõe as sprites de um chunk numa única superfície.
+
+        As sprites são desenhadas na mesma ordem de profundidade usada pela
+        câmera (`rect.centery` e ordem de inserção). Chunks sem sprites são
+        descartados para não ocupar memória.
+
+        Args:
+            celula (tuple[int, int]): Coordenadas (cx, cy) do chunk.
+        """
+        sprites = self.grade.celulas.get(celula)
+        if not sprites:
+            self.chunks.pop(celula, None)
+            return
+
+        lado = self.tamanho_chunk
+        chunk_x, chunk_y = celula[0] * lado, celula[1] * lado
+
+        superficie = self.chunks.get(celula)
+        if superficie is None:
+            superficie = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                superficie = superficie.convert_alpha()
+            self.chunks[celula] = superficie
+        superficie.fill((0, 0, 0, 0))
+
+        ordem = self._ordem
+        for sprite in sorted(sprites, key=lambda sprite: (sprite.rect.centery, ordem[sprite])):
+            superficie.blit(sprite.image, (sprite.rect.x - chunk_x, sprite.rect.y - chunk_y))
+
+    def chunks_visiveis(self, area):
+        """Gera os chunks que tocam `area`, reconstruindo os que estiverem sujos.
+
+        Args:
+            area (pygame.Rect): Área do mundo visível (normalmente a câmera).
+
+        Yields:
+            tuple[pygame.Surface, int, int]: Superfície do chunk e sua posição (x, y) no mundo.
+        """
+        lado = self.tamanho_chunk
+        for celula in self.grade.celulas_do_rect(area):
+            if celula in self.sujos:
+                self._assar_chunk(celula)
+                self.sujos.discard(celula)
+            superficie = self.chunks.get(celula)
+            if superficie is not None:
+                yield superficie, celula[0] * lado, celula[1] * lado
@@ -5,6 +5,8 @@ e efeito de parallax para o jogo SWITCH BACK.
 
 import pygame
 from constantes import *
+from fila_renderizacao import FilaRenderizacao
+from camada_estatica import CamadaEstatica
 
 
 class CameraGroup(pygame.sprite.Group):
@@ -15,6 +17,8 @@ class CameraGroup(pygame.sprite.Group):
         - Limitação da área visível ao tamanho do mundo
         - Efeito de parallax para o fundo
         - Desenho de sprites com base no deslocamento da câmera
+        - Culling por viewport: apenas sprites que tocam a câmera são desenhadas
+        - Camada estática opcional, pré-renderizada em chunks (`assar_camada_estatica`)
 
     Attributes:
         display_surface (pygame.Surface): Superfície principal de exibição do jogo.
@@ -25,6 +29,9 @@ class CameraGroup(pygame.sprite.Group):
         metade_h (int): Metade da altura da tela.
         smooth_factor (float): Fator de suavização da movimentação da câmera.
         parallax_factor (float): Fator de deslocamento aplicado ao fundo (parallax).
+        culling (bool): Se True, desenha apenas as sprites que colidem com o retângulo da câmera.
+        fila (FilaRenderizacao): Sprites desenhadas individualmente, já ordenadas por profundidade.
+        camada_estatica (CamadaEstatica | None): Chunks pré-renderizados das sprites estáticas, se ativada.
     """
 
     def __init__(self, mundo_w, mundo_h): 
@@ -51,6 +58,115 @@ class CameraGroup(pygame.sprite.Group):
         # Fator de parallax para o fundo
         self.parallax_factor = 0.3
 
+        # Fila de desenho já ordenada por profundidade: estáticos ordenados uma
+        # vez, dinâmicos reposicionados apenas quando se movem.
+        self.culling = True
+        self.fila = FilaRenderizacao()
+        self._pendentes = {}
+
+        # Chunks pré-renderizados das tiles (ativados por assar_camada_estatica)
+        self.camada_estatica = None
+
+        # Ordem de inserção, usada como desempate da ordenação por profundidade
+        self._ordem = {}
+        self._contador_ordem = 0
+
+    def add_internal(self, sprite, layer=None):
+        """Registra a sprite no grupo e a deixa pendente para a fila de desenho.
+
+        O `rect` ainda pode não estar definido neste momento (as sprites são
+        adicionadas ao grupo dentro de `Sprite.__init__`), então a sprite só é
+        posicionada na fila (ou na camada estática) no próximo desenho.
+        """
+        super().add_internal(sprite, layer)
+        self._ordem[sprite] = self._contador_ordem
+        self._contador_ordem += 1
+        self._pendentes[sprite] = None
+
+    def remove_internal(self, sprite):
+        """Remove a sprite do grupo, da fila de desenho e da camada estática."""
+        super().remove_internal(sprite)
+        self._ordem.pop(sprite, None)
+        if sprite in self._pendentes:
+            del self._pendentes[sprite]
+            return
+        self.fila.remover(sprite)
+        if self.camada_estatica is not None:
+            self.camada_estatica.remover(sprite)
+
+    def _indexar_pendentes(self):
+        """Posiciona as sprites pendentes na fila de desenho ou na camada estática."""
+        estaticos = []
+        for sprite in self._pendentes:
+            ordem = self._ordem[sprite]
+            if getattr(sprite, 'dinamico', False):
+                self.fila.inserir_dinamico(sprite, ordem)
+            elif self.camada_estatica is not None:
+                self.camada_estatica.adicionar(sprite, ordem)
+            else:
+                estaticos.append((sprite, ordem))
+        if estaticos:
+            self.fila.inserir_estaticos(estaticos)
+        self._pendentes.clear()
+
+    def assar_camada_estatica(self, tamanho_chunk=TAMANHO_CHUNK):
+        """Pré-renderiza todas as sprites estáticas do grupo em chunks.
+
+        A partir daqui a câmera desenha os chunks visíveis e mantém o desenho
+        individual apenas para as sprites dinâmicas. Sprites estáticas
+        adicionadas ou removidas depois invalidam somente os chunks afetados.
+
+        Args:
+            tamanho_chunk (int): Lado dos chunks em pixels.
+        """
+        for _ in self.etapas_assar_camada_estatica(tamanho_chunk):
+            pass
+
+    def etapas_assar_camada_estatica(self, tamanho_chunk=TAMANHO_CHUNK):
+        """Versão em etapas de `assar_camada_estatica`: devolve o controle após cada chunk.
+
+        Args:
+            tamanho_chunk (int): Lado dos chunks em pixels.
+        """
+        self._indexar_pendentes()
+        self.camada_estatica = CamadaEstatica(tamanho_chunk)
+        for sprite in self.fila.retirar_estaticos():
+            self.camada_estatica.adicionar(sprite, self._ordem[sprite])
+        yield from self.camada_estatica.etapas_assar()
+
+    def retangulo_camera(self):
+        """Retorna o retângulo visível do mundo (offset atual + tamanho da janela).
+
+        Returns:
+            pygame.Rect: Área do mundo coberta pela câmera, em pixels.
+        """
+        largura, altura = self.display_surface.get_size()
+        return pygame.Rect(int(self.offset.x), int(self.offset.y), largura, altura)
+
+    def _desenhar_sprites(self, offset_int):
+        """Desenha as sprites do grupo aplicando o offset da câmera.
+
+        Com a camada estática ativa, os chunks visíveis são desenhados primeiro
+        e as sprites dinâmicas por cima deles. Com culling, só as sprites da
+        câmera (consultadas na grade da fila) são ordenadas a cada frame.
+
+        Args:
+            offset_int (tuple[int, int]): Offset da câmera já convertido para inteiros.
+        """
+        ox, oy = offset_int
+        if self._pendentes:
+            self._indexar_pendentes()
+
+        camera = self.retangulo_camera()
+        if self.camada_estatica is not None:
+            for superficie, x, y in self.camada_estatica.chunks_visiveis(camera):
+                self.display_surface.blit(superficie, (x - ox, y - oy))
+
+        blit = self.display_surface.blit
+        for sprite in self.fila.percorrer(camera if self.culling else None):
+            # Posição final do sprite (posição global - offset da câmera)
+            blit(sprite.image, (sprite.rect.x - ox, sprite.rect.y - oy))
+
     def center_alvo_camera(self, alvo):
         """Centraliza suavemente a câmera no alvo (ex: jogador).
 
@@ -85,6 +201,7 @@ class CameraGroup(pygame.sprite.Group):
         Primeiro centraliza a câmera no jogador, depois desenha o fundo
         com efeito de parallax (se fornecido) e por fim todos os sprites
         do grupo, ordenados pela posição vertical (`rect.centery`).
+        Com `culling` ativo, apenas as sprites dentro da câmera são desenhadas.
 
         Args:
             jogador (pygame.sprite.Sprite): Sprite do jogador usado como referência de câmera.
@@ -106,11 +223,9 @@ class CameraGroup(pygame.sprite.Group):
             )
 
         # Desenha os sprites ordenados por profundidade (centro Y)
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            # Posição final do sprite (posição global - offset da câmera)
-            offset_pos = sprite.rect.topleft - pygame.math.Vector2(offset_int)
-            self.display_surface.blit(sprite.image, offset_pos)
-            
+        self._desenhar_sprites(offset_int)
+
+
     def get_offset_pos(self, pos_x, pos_y):
         """Retorna uma posição ajustada pelo deslocamento atual da câmera.
 
@@ -123,24 +238,25 @@ class CameraGroup(pygame.sprite.Group):
         """
         return pos_x - int(self.offset.x), pos_y - int(self.offset.y)
     
-    def draw_mapa_sem_parallax(self, jogador, map_surface):
+    def draw_mapa_sem_parallax(self, jogador, map_surface=None):
         """Desenha o mapa e os sprites sem aplicar o efeito de parallax.
 
         Útil para camadas do mundo que devem acompanhar a câmera rigidamente
-        (ex: o chão ou o mapa base).
+        (ex: o chão ou o mapa base). Com a camada estática ativa, o próprio
+        mapa vem dos chunks pré-renderizados e `map_surface` pode ser omitida.
 
         Args:
             jogador (pygame.sprite.Sprite): Sprite usado para centralizar a câmera.
-            map_surface (pygame.Surface): Imagem do mapa a ser desenhada.
+            map_surface (pygame.Surface, optional): Imagem do mapa a ser desenhada sob os chunks.
         """
         # Calcula o offset normal
         self.center_alvo_camera(jogador) 
         offset_int = (int(self.offset.x), int(self.offset.y))
         
         # Desenha o mapa com rolagem padrão
-        self.display_surface.blit(map_surface, (-offset_int[0], -offset_int[1]))
+        if map_surface:
+            self.display_surface.blit(map_surface, (-offset_int[0], -offset_int[1]))
 
         # Desenha os sprites com offset
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            offset_pos = sprite.rect.topleft - pygame.math.Vector2(offset_int)
-            self.display_surface.blit(sprite.image, offset_pos)
+        self._desenhar_sprites(offset_int)
+
@@ -0,0 +1,210 @@
+"""
+Pipeline de carregamento de imagens do jogo SWITCH BACK.
+
+Centraliza a leitura, o redimensionamento e a conversão das imagens para o
+formato de pixel da tela (`convert()` / `convert_alpha()`). Superfícies que
+não estão no formato da janela são convertidas a cada blit, o que pesa
+principalmente nas imagens de tela cheia. Aqui cada imagem é convertida uma
+única vez, com canal alpha apenas quando ela realmente tem transparência; as
+cargas feitas por um `CarregadorParalelo` ficam registradas no seu
+`relatorio`, com o tempo gasto.
+
+O `CarregadorParalelo` decodifica e redimensiona imagens (e decodifica sons)
+num pool de threads; só a conversão final, que depende da janela, é feita na
+thread principal.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from cache_pixels import chave_pixels, gravar_pixels, ler_pixels
+from pacote_assets import ArquivoPacote
+from utils import abrir_recurso, existe_recurso, ler_recurso
+
+# Threads usadas para decodificar assets em paralelo
+MAX_THREADS_CARREGAMENTO = min(8, os.cpu_count() or 2)
+
+
+def possui_transparencia(superficie):
+    """Retorna True se a superfície tem algum pixel transparente ou colorkey.
+
+    Superfícies sem canal alpha por pixel são opacas; as demais são
+    verificadas com uma máscara dos pixels totalmente opacos.
+
+    Args:
+        superficie (pygame.Surface): Superfície a verificar.
+    """
+    if superficie.get_colorkey() is not None:
+        return True
+    if not superficie.get_flags() & pygame.SRCALPHA:
+        return False
+    largura, altura = superficie.get_size()
+    opacos = pygame.mask.from_surface(superficie, 254).count()
+    return opacos < largura * altura
+
+
+def converter_para_tela(superficie, alpha=None, nome='', ms_decodificacao=0.0, origem='png', relatorio=None):
+    """Converte a superfície para o formato de pixel da janela.
+
+    Args:
+        superficie (pygame.Surface): Superfície carregada.
+        alpha (bool | None): Força (`True`) ou descarta (`False`) o canal alpha.
+                             Se None, usa `possui_transparencia`.
+        nome (str): Identificação usada no relatório de conversão.
+        ms_decodificacao (float): Tempo gasto lendo/redimensionando a imagem (para o relatório).
+        origem (str): De onde vieram os pixels ('png' ou 'cache'), para o relatório.
+        relatorio (list | None): Lista onde a conversão é registrada (ver
+                                 `CarregadorParalelo.relatorio`); None = não registra.
+
+    Returns:
+        pygame.Surface: Nova superfície no formato da tela.
+    """
+    inicio = time.perf_counter()
+    if alpha is None:
+        alpha = possui_transparencia(superficie)
+
+    if alpha:
+        convertida = superficie.convert_alpha()
+        modo = 'convert_alpha'
+    else:
+        convertida = superficie.convert()
+        modo = 'convert'
+
+    if relatorio is not None:
+        ms_conversao = (time.perf_counter() - inicio) * 1000
+        relatorio.append((nome, modo, convertida.get_size(), ms_decodificacao, ms_conversao, origem))
+    return convertida
+
+
+def decodificar_imagem(caminho_relativo, tamanho=None):
+    """Lê e redimensiona uma imagem, sem converter para o formato da tela.
+
+    Usa o cache de pixels em disco (`cache_pixels`) quando há uma entrada para
+    o conteúdo atual do arquivo e o tamanho pedido; senão decodifica o PNG,
+    redimensiona e grava a entrada para a próxima execução. Não depende da
+    janela, então pode rodar fora da thread principal.
+
+    Args:
+        caminho_relativo (str): Caminho relativo à raiz do jogo (lido com `utils.ler_recurso`).
+        tamanho (tuple[int, int] | None): Tamanho final (largura, altura), se houver escala.
+
+    Returns:
+        tuple[pygame.Surface, float, str]: Superfície, tempo gasto em milissegundos e
+                                           origem dos pixels ('cache' ou 'png').
+    """
+    inicio = time.perf_counter()
+    dados = ler_recurso(caminho_relativo)
+    chave = chave_pixels(caminho_relativo, dados, tamanho)
+
+    superficie = ler_pixels(chave)
+    if superficie is not None:
+        return superficie, (time.perf_counter() - inicio) * 1000, 'cache'
+
+    superficie = pygame.image.load(ArquivoPacote(dados, caminho_relativo), caminho_relativo)
+    if tamanho is not None:
+        superficie = pygame.transform.scale(superficie, tamanho)
+    gravar_pixels(chave, superficie)
+    return superficie, (time.perf_counter() - inicio) * 1000, 'png'
+
+
+def decodificar_som(caminho_relativo, volume=None):
+    """Decodifica um efeito sonoro (None se o arquivo não existir).
+
+    Args:
+        caminho_relativo (str): Caminho relativo à raiz do jogo.
+        volume (float | None): Volume aplicado ao som, se fornecido.
+
+    Returns:
+        tuple[pygame.mixer.Sound | None, float]: Som e tempo gasto, em milissegundos.
+    """
+    inicio = time.perf_counter()
+    som = None
+    if existe_recurso(caminho_relativo):
+        som = pygame.mixer.Sound(file=abrir_recurso(caminho_relativo))
+        if volume is not None:
+            som.set_volume(volume)
+    return som, (time.perf_counter() - inicio) * 1000
+
+
+def carregar_imagem(caminho_relativo, tamanho=None, alpha=None):
+    """Carrega uma imagem, redimensiona (opcional) e converte para o formato da tela.
+
+    O teste de transparência é feito já no tamanho final, que é a superfície
+    efetivamente desenhada.
+
+    Args:
+        caminho_relativo (str): Caminho relativo à raiz do jogo (lido com `utils.ler_recurso`).
+        tamanho (tuple[int, int] | None): Tamanho final (largura, altura), se houver escala.
+        alpha (bool | None): Ver `converter_para_tela`.
+
+    Returns:
+        pygame.Surface: Superfície pronta para blit.
+    """
+    superficie, ms, origem = decodificar_imagem(caminho_relativo, tamanho)
+    return converter_para_tela(superficie, alpha, caminho_relativo, ms, origem)
+
+
+class CarregadorParalelo:
+    """Carrega imagens e sons em paralelo, num pool de threads.
+
+    Cada pedido é enviado ao pool assim que registrado; `concluir()` espera
+    os resultados na ordem dos pedidos e converte as imagens para o formato
+    da tela na thread principal. Pedidos repetidos (mesmo arquivo, tamanho e
+    alpha) são decodificados uma única vez e compartilham a superfície.
+
+    Attributes:
+        pedidos (list[tuple]): (chave, tipo, identificador do trabalho), na ordem de registro.
+        relatorio (list[tuple]): Cargas concluídas por este carregador: (nome, modo,
+            (largura, altura) | None, ms de decodificação, ms de conversão, origem).
+    """
+
+    def __init__(self, max_threads=MAX_THREADS_CARREGAMENTO):
+        """Cria o pool de threads.
+
+        Args:
+            max_threads (int): Número de threads de decodificação.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='assets')
+        self._trabalhos = {}
+        self.pedidos = []
+        self.relatorio = []
+
+    def imagem(self, chave, caminho_relativo, tamanho=None, alpha=None):
+        """Pede uma imagem (ver `carregar_imagem`); o resultado fica em `concluir()[chave]`."""
+        trabalho = ('imagem', caminho_relativo, tamanho, alpha)
+        if trabalho not in self._trabalhos:
+            self._trabalhos[trabalho] = self._executor.submit(decodificar_imagem, caminho_relativo, tamanho)
+        self.pedidos.append((chave, trabalho))
+
+    def som(self, chave, caminho_relativo, volume=None):
+        """Pede um efeito sonoro (ver `decodificar_som`); o resultado fica em `concluir()[chave]`."""
+        trabalho = ('som', caminho_relativo, volume)
+        if trabalho not in self._trabalhos:
+            self._trabalhos[trabalho] = self._executor.submit(decodificar_som, caminho_relativo, volume)
+        self.pedidos.append((chave, trabalho))
+
+    def concluir(self):
+        """Espera todos os pedidos e converte as imagens na thread principal.
+
+        Returns:
+            dict: Mapeia a chave de cada pedido para a superfície convertida ou o som.
+        """
+        prontos = {}
+        resultado = {}
+        try:
+            for chave, trabalho in self.pedidos:
+                if trabalho not in prontos:
+                    if trabalho[0] == 'imagem':
+                        superficie, ms, origem = self._trabalhos[trabalho].result()
+                        valor = converter_para_tela(superficie, trabalho[3], trabalho[1], ms, origem,
+                                                    self.relatorio)
+                    else:
+                        valor, ms = self._trabalhos[trabalho].result()
+                        self.relatorio.append((trabalho[1], 'som', None, ms, 0.0, 'mp3'))
+                    prontos[trabalho] = valor
+                resultado[chave] = prontos[trabalho]
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        return resultado
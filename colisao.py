@@ -0,0 +1,239 @@
+"""
+Estruturas de colisão por grade de tiles para o jogo SWITCH BACK.
+
+Em vez de testar o jogador contra todas as tiles sólidas do mapa, a camada
+`Principal` é convertida, no carregamento do nível, numa grade de ocupação
+indexada pelas coordenadas de tile. Uma consulta devolve apenas as tiles das
+células cobertas pela área pedida, então o custo passa a depender do número de
+células tocadas e não do tamanho do mapa.
+
+Na compilação do nível, as tiles sólidas vizinhas também são fundidas em
+retângulos maximais (greedy meshing). As colisões passam a ser testadas contra
+poucos retângulos grandes, o que elimina testes redundantes entre tiles
+adjacentes e as "emendas" em que o jogador podia enroscar.
+
+O `IndiceNivel` reúne, num único objeto por nível compartilhado por todas as
+entidades, a grade sólida e a grade de água, respondendo em tempo constante
+se um retângulo de sonda (probe) toca água ou terreno.
+"""
+
+from constantes import *
+
+
+class GradeOcupacao:
+    """Grade de ocupação binária de um nível, indexada por coordenadas de tile.
+
+    Attributes:
+        largura (int): Largura do mapa, em tiles.
+        altura (int): Altura do mapa, em tiles.
+        tamanho_tile (int): Lado de cada tile, em pixels.
+        celulas (bytearray): 1 para células ocupadas, 0 caso contrário (linha a linha).
+    """
+
+    def __init__(self, largura, altura, tamanho_tile=TILE_SIZE):
+        """Inicializa uma grade vazia.
+
+        Args:
+            largura (int): Largura do mapa em tiles.
+            altura (int): Altura do mapa em tiles.
+            tamanho_tile (int): Lado das tiles em pixels (padrão: `TILE_SIZE`).
+        """
+        self.largura = largura
+        self.altura = altura
+        self.tamanho_tile = tamanho_tile
+        self.celulas = bytearray(largura * altura)
+
+    def __len__(self):
+        return sum(self.celulas)
+
+    def adicionar(self, x, y):
+        """Marca a célula (x, y) como ocupada.
+
+        Args:
+            x (int): Coluna da tile.
+            y (int): Linha da tile.
+        """
+        self.celulas[y * self.largura + x] = 1
+
+    def limites(self, rect):
+        """Converte `rect` no intervalo de células coberto, recortado ao mapa.
+
+        Segue a mesma regra de `Rect.colliderect`: bordas que apenas encostam
+        numa célula não a cobrem.
+
+        Args:
+            rect (pygame.Rect): Área em pixels.
+
+        Returns:
+            tuple[int, int, int, int]: (x0, x1, y0, y1) inclusivos; vazio se x0 > x1 ou y0 > y1.
+        """
+        t = self.tamanho_tile
+        x0 = max(rect.left // t, 0)
+        x1 = min((rect.right - 1) // t, self.largura - 1)
+        y0 = max(rect.top // t, 0)
+        y1 = min((rect.bottom - 1) // t, self.altura - 1)
+        return x0, x1, y0, y1
+
+    def ocupado(self, rect):
+        """Retorna True se `rect` toca alguma célula ocupada.
+
+        Equivale a testar `colliderect` contra cada tile ocupada, mas visita
+        apenas as células cobertas pelo retângulo.
+
+        Args:
+            rect (pygame.Rect): Área em pixels (ex.: sonda à frente de um monstro).
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        x0, x1, y0, y1 = self.limites(rect)
+        if x0 > x1 or y0 > y1:
+            return False
+        celulas = self.celulas
+        for cy in range(y0, y1 + 1):
+            base = cy * self.largura
+            if any(celulas[base + x0:base + x1 + 1]):
+                return True
+        return False
+
+
+class GradeColisao(GradeOcupacao):
+    """Grade de ocupação das tiles sólidas de um nível, com retângulos mesclados.
+
+    Attributes:
+        retangulos (list[pygame.Rect] | None): Retângulos mesclados (None até `mesclar()`).
+        indice_retangulo (list[int]): Para cada célula, 1 + índice do retângulo que a cobre (0 se vazia).
+    """
+
+    def __init__(self, largura, altura, tamanho_tile=TILE_SIZE):
+        """Inicializa uma grade vazia.
+
+        Args:
+            largura (int): Largura do mapa em tiles.
+            altura (int): Altura do mapa em tiles.
+            tamanho_tile (int): Lado das tiles em pixels (padrão: `TILE_SIZE`).
+        """
+        super().__init__(largura, altura, tamanho_tile)
+        self.retangulos = None
+        self.indice_retangulo = [0] * (largura * altura)
+
+    def adicionar(self, x, y):
+        """Marca a célula (x, y) como sólida.
+
+        Invalida os retângulos mesclados, que são recalculados na próxima consulta.
+
+        Args:
+            x (int): Coluna da tile.
+            y (int): Linha da tile.
+        """
+        super().adicionar(x, y)
+        self.retangulos = None
+
+    def mesclar(self):
+        """Funde as tiles sólidas em retângulos maximais (greedy meshing).
+
+        Percorre a grade linha a linha; a cada célula sólida ainda não coberta,
+        estende o retângulo para a direita enquanto houver tiles sólidas livres
+        e depois para baixo enquanto a linha inteira do retângulo for sólida.
+
+        Returns:
+            list[pygame.Rect]: Retângulos mesclados, em pixels.
+        """
+        largura, altura, t = self.largura, self.altura, self.tamanho_tile
+        solido = self.celulas
+        coberto = bytearray(largura * altura)
+        indice_retangulo = [0] * (largura * altura)
+        retangulos = []
+
+        for y in range(altura):
+            for x in range(largura):
+                i = y * largura + x
+                if not solido[i] or coberto[i]:
+                    continue
+
+                w = 1
+                while x + w < largura and solido[i + w] and not coberto[i + w]:
+                    w += 1
+
+                h = 1
+                while y + h < altura:
+                    base = (y + h) * largura + x
+                    if not all(solido[base + k] and not coberto[base + k] for k in range(w)):
+                        break
+                    h += 1
+
+                numero = len(retangulos) + 1
+                for yy in range(y, y + h):
+                    base = yy * largura + x
+                    for k in range(base, base + w):
+                        coberto[k] = 1
+                        indice_retangulo[k] = numero
+                retangulos.append(pygame.Rect(x * t, y * t, w * t, h * t))
+
+        self.retangulos = retangulos
+        self.indice_retangulo = indice_retangulo
+        return retangulos
+
+    def resumo(self):
+        """Retorna a métrica da mesclagem: (tiles sólidas, retângulos gerados)."""
+        if self.retangulos is None:
+            self.mesclar()
+        return sum(self.celulas), len(self.retangulos)
+
+    def consultar(self, rect):
+        """Retorna os retângulos sólidos mesclados que cobrem células de `rect`.
+
+        Os retângulos são devolvidos na ordem em que foram gerados (pelo canto
+        superior esquerdo, linha a linha), sem repetição.
+
+        Args:
+            rect (pygame.Rect): Área de consulta em pixels (ex.: rect varrido do jogador).
+
+        Returns:
+            list[pygame.Rect]: Retângulos sólidos próximos da área.
+        """
+        if self.retangulos is None:
+            self.mesclar()
+
+        x0, x1, y0, y1 = self.limites(rect)
+
+        indice_retangulo = self.indice_retangulo
+        numeros = set()
+        for cy in range(y0, y1 + 1):
+            base = cy * self.largura
+            for indice in range(base + x0, base + x1 + 1):
+                numero = indice_retangulo[indice]
+                if numero:
+                    numeros.add(numero)
+        retangulos = self.retangulos
+        return [retangulos[numero - 1] for numero in sorted(numeros)]
+
+
+class IndiceNivel:
+    """Índice espacial de um nível, compartilhado por todas as entidades.
+
+    Construído uma vez no carregamento do nível a partir das camadas
+    `Principal` e `Agua`. Cada consulta visita apenas as células cobertas pela
+    sonda, então o custo por monstro não depende do tamanho do mapa nem do
+    número de tiles de água.
+
+    Attributes:
+        colisao (GradeColisao): Tiles sólidas e seus retângulos mesclados.
+        agua (GradeOcupacao): Tiles de água.
+    """
+
+    def __init__(self, largura, altura, tamanho_tile=TILE_SIZE):
+        """Inicializa um índice vazio para um mapa de `largura` x `altura` tiles."""
+        self.colisao = GradeColisao(largura, altura, tamanho_tile)
+        self.agua = GradeOcupacao(largura, altura, tamanho_tile)
+
+    def na_agua(self, rect):
+        """Retorna True se `rect` toca alguma tile de água."""
+        return self.agua.ocupado(rect)
+
+    def no_solido(self, rect):
+        """Retorna True se `rect` toca alguma tile sólida."""
+        return self.colisao.ocupado(rect)
+
+    def solidos_proximos(self, rect):
+        """Retorna os retângulos sólidos mesclados que cobrem células de `rect`."""
+        return self.colisao.consultar(rect)
@@ -0,0 +1,396 @@
+"""
+Compilador de níveis do jogo SWITCH BACK.
+
+Ler o TMX com o pytmx, montar os tilesets e escalar cada tile é o passo mais
+lento do carregamento de um nível. O compilador faz esse trabalho uma única
+vez e grava o resultado num artefato binário em `PASTA_CACHE`:
+
+- as grades de tiles de cada camada (um índice do atlas por célula);
+- a tabela de entidades (Player, Monstro, final), com os limites de patrulha;
+- os itens da camada `Items`;
+- o atlas com os pixels das tiles já escaladas.
+
+O artefato é identificado por um hash do TMX, dos tilesets (TSX) e das imagens
+que eles usam, além da versão do formato e do fator de escala. Se alguma fonte
+mudar, o nível é recompilado automaticamente na próxima carga.
+
+Formato do arquivo (little-endian):
+    cabeçalho  `FORMATO_CABECALHO` (assinatura, versão, chave, largura, altura, tamanho do índice)
+    índice     JSON com as camadas, o atlas e as tabelas de entidades e itens
+    grades     uma grade uint16 de largura x altura por camada (0 = sem tile)
+    pixels     pixels das tiles do atlas, em sequência
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ET
+from array import array
+
+import pygame
+from constantes import *
+from pacote_assets import pacote_ativo
+from utils import caminho_cache, resource_path
+
+ASSINATURA = b'SBNV'
+VERSAO_FORMATO = 1
+FORMATO_CABECALHO = '<4sH20sHHI'
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+
+# Camadas de tiles gravadas no artefato
+CAMADAS_TILES = ('Principal', 'Decoracao2', 'Agua', 'Escada')
+
+
+def arquivos_fonte(caminho_tmx):
+    """Lista os arquivos dos quais um nível depende: o TMX, seus TSX e as imagens.
+
+    Args:
+        caminho_tmx (str): Caminho do arquivo TMX.
+
+    Returns:
+        list[str]: Caminhos na ordem em que aparecem no mapa.
+    """
+    pasta = os.path.dirname(caminho_tmx)
+    arquivos = [caminho_tmx]
+
+    for tileset in ET.parse(caminho_tmx).getroot().iter('tileset'):
+        origem = tileset.get('source')
+        if origem:
+            caminho_tsx = os.path.join(pasta, origem)
+            arquivos.append(caminho_tsx)
+            pasta_tsx = os.path.dirname(caminho_tsx)
+            elementos = ET.parse(caminho_tsx).getroot().iter('image')
+        else:
+            pasta_tsx = pasta
+            elementos = tileset.iter('image')
+        for imagem in elementos:
+            arquivos.append(os.path.join(pasta_tsx, imagem.get('source')))
+
+    return arquivos
+
+
+def chave_nivel(caminho_tmx):
+    """Calcula o hash (sha1) que identifica a versão compilada de um nível.
+
+    Args:
+        caminho_tmx (str): Caminho do arquivo TMX.
+
+    Returns:
+        bytes: Digest de 20 bytes.
+    """
+    sha = hashlib.sha1(f"{VERSAO_FORMATO}:{SCALE_FACTOR}:{TILE_SIZE}".encode())
+    for caminho in arquivos_fonte(caminho_tmx):
+        sha.update(os.path.basename(caminho).encode())
+        with open(caminho, 'rb') as f:
+            sha.update(f.read())
+    return sha.digest()
+
+
+def carregador_imagem_bruta(arquivo, colorkey, **kwargs):
+    """Carregador de imagens do pytmx que não converte as tiles para o formato da tela.
+
+    Equivale ao `pygame_image_loader` do pytmx, mas no lugar do
+    `smart_convert` (que chama `convert`/`convert_alpha`) cada tile vira uma
+    superfície RGB ou RGBA comum, escolhida pelo mesmo critério: RGB se houver
+    colorkey ou se todos os pixels forem opacos; RGBA caso contrário. Assim o
+    nível pode ser compilado sem janela, numa thread de carregamento, e o
+    artefato fica idêntico ao gerado com `load_pygame`.
+
+    Args:
+        arquivo (str): Imagem do tileset.
+        colorkey (str | None): Cor transparente definida no Tiled (hex, sem '#').
+
+    Returns:
+        callable: `carregar(rect=None, flags=None)` que retorna a superfície de uma tile.
+    """
+    from pytmx.util_pygame import handle_transformation
+
+    pixelalpha = kwargs.get('pixelalpha', True)
+    imagem = pygame.image.load(arquivo)
+
+    def carregar(rect=None, flags=None):
+        tile = imagem.subsurface(rect) if rect else imagem.copy()
+        if flags:
+            tile = handle_transformation(tile, flags)
+
+        largura, altura = tile.get_size()
+        opaca = pygame.mask.from_surface(tile, 254).count() == largura * altura
+        formato = 'RGB' if colorkey or opaca or not pixelalpha else 'RGBA'
+        return pygame.image.frombytes(pygame.image.tobytes(tile, formato), (largura, altura), formato)
+
+    return carregar
+
+
+def compilar_nivel(caminho_tmx, chave):
+    """Lê o TMX com o pytmx e gera o artefato binário do nível.
+
+    Não cria superfícies no formato da tela (ver `carregador_imagem_bruta`),
+    então pode rodar na thread de carregamento.
+
+    Args:
+        caminho_tmx (str): Caminho do arquivo TMX.
+        chave (bytes): Hash das fontes (ver `chave_nivel`).
+
+    Returns:
+        bytes: Conteúdo do artefato.
+    """
+    import pytmx
+    from cache_tiles import CacheTiles
+
+    tmx_mapa = pytmx.TiledMap(caminho_tmx, image_loader=carregador_imagem_bruta)
+    cache_tiles = CacheTiles(tmx_mapa, converter=False)
+    largura, altura = tmx_mapa.width, tmx_mapa.height
+
+    # atlas: uma entrada por tile distinta (gid do Tiled + flip); índice 0 = sem tile
+    indice_por_chave = {}
+    atlas = []
+    pixels = []
+    deslocamento = 0
+
+    def indice_atlas(gid):
+        if not gid:
+            return 0
+        chave_tile = cache_tiles.chave(gid)
+        indice = indice_por_chave.get(chave_tile)
+        if indice is None:
+            superficie = cache_tiles.superficie(gid)
+            if superficie is None:
+                indice = 0
+            else:
+                formato = 'RGBA' if superficie.get_flags() & pygame.SRCALPHA else 'RGB'
+                dados = pygame.image.tobytes(superficie, formato)
+                nonlocal deslocamento
+                atlas.append([superficie.get_width(), superficie.get_height(), formato, deslocamento, len(dados)])
+                pixels.append(dados)
+                deslocamento += len(dados)
+                indice = len(atlas)
+            indice_por_chave[chave_tile] = indice
+        return indice
+
+    nomes_camadas = [getattr(camada, 'name', None) for camada in tmx_mapa.layers]
+
+    camadas = []
+    grades = []
+    for nome in CAMADAS_TILES:
+        if nome not in nomes_camadas:
+            continue
+        grade = array('H', bytes(2 * largura * altura))
+        for x, y, gid in tmx_mapa.get_layer_by_name(nome).iter_data():
+            grade[y * largura + x] = indice_atlas(gid)
+        camadas.append(nome)
+        grades.append(grade)
+
+    # Entidades, na ordem do mapa; os limites de patrulha são compartilhados por tipo
+    entidades = []
+    limites_por_tipo = {}
+    for objeto in tmx_mapa.get_layer_by_name('Entities'):
+        entidade = {
+            'nome': objeto.name,
+            'x': objeto.x * SCALE_FACTOR,
+            'y': objeto.y * SCALE_FACTOR,
+            'tile': indice_atlas(getattr(objeto, 'gid', 0)),
+        }
+        if objeto.name == 'Monstro':
+            if objeto.name not in limites_por_tipo:
+                x_scaled = objeto.x * SCALE_FACTOR
+                limites_por_tipo[objeto.name] = [x_scaled, x_scaled + objeto.width * SCALE_FACTOR]
+            entidade['limites'] = limites_por_tipo[objeto.name]
+        entidades.append(entidade)
+
+    itens = []
+    if 'Items' in nomes_camadas:
+        for objeto in tmx_mapa.get_layer_by_name('Items'):
+            gid = getattr(objeto, 'gid', None)
+            if gid is None:
+                continue
+            itens.append({
+                'nome': getattr(objeto, 'name', None),
+                'x': objeto.x * SCALE_FACTOR,
+                'y': objeto.y * SCALE_FACTOR,
+                'tile': indice_atlas(gid),
+            })
+
+    indice = json.dumps({
+        'camadas': camadas,
+        'atlas': atlas,
+        'entidades': entidades,
+        'itens': itens,
+    }).encode('utf-8')
+
+    partes = [struct.pack(FORMATO_CABECALHO, ASSINATURA, VERSAO_FORMATO, chave, largura, altura, len(indice)), indice]
+    for grade in grades:
+        if sys.byteorder == 'big':
+            grade.byteswap()
+        partes.append(grade.tobytes())
+    partes.extend(pixels)
+    return b''.join(partes)
+
+
+class NivelCompilado:
+    """Nível carregado a partir do artefato compilado.
+
+    Attributes:
+        largura (int): Largura do mapa, em tiles.
+        altura (int): Altura do mapa, em tiles.
+        grades (dict): Mapeia o nome da camada para sua grade (`array('H')`) de índices do atlas.
+        superficies (list[pygame.Surface]): Tiles do atlas, já convertidas (índice 0 = None).
+        entidades (list[dict]): Objetos da camada `Entities` (nome, x, y, tile e, para monstros, limites).
+        itens (list[dict]): Objetos da camada `Items` (nome, x, y, tile).
+    """
+
+    def __init__(self, dados):
+        """Decodifica o artefato.
+
+        Args:
+            dados (bytes | memoryview): Conteúdo do arquivo compilado.
+
+        Raises:
+            ValueError: Se a assinatura ou a versão do formato não conferirem.
+        """
+        dados = memoryview(dados)
+        assinatura, versao, self.chave, self.largura, self.altura, tamanho_indice = \
+            struct.unpack_from(FORMATO_CABECALHO, dados)
+        if assinatura != ASSINATURA or versao != VERSAO_FORMATO:
+            raise ValueError("artefato de nível inválido ou de outra versão")
+
+        posicao = TAMANHO_CABECALHO
+        indice = json.loads(bytes(dados[posicao:posicao + tamanho_indice]))
+        posicao += tamanho_indice
+
+        tamanho_grade = 2 * self.largura * self.altura
+        self.grades = {}
+        for nome in indice['camadas']:
+            grade = array('H')
+            grade.frombytes(dados[posicao:posicao + tamanho_grade])
+            if sys.byteorder == 'big':
+                grade.byteswap()
+            self.grades[nome] = grade
+            posicao += tamanho_grade
+
+        self.superficies = [None]
+        for largura, altura, formato, deslocamento, tamanho in indice['atlas']:
+            inicio = posicao + deslocamento
+            superficie = pygame.image.frombuffer(dados[inicio:inicio + tamanho], (largura, altura), formato)
+            # converte (copia) para o formato da tela; o buffer do arquivo não precisa ficar vivo
+            if formato == 'RGBA':
+                superficie = superficie.convert_alpha()
+            else:
+                superficie = superficie.convert()
+            self.superficies.append(superficie)
+
+        self.entidades = indice['entidades']
+        self.itens = indice['itens']
+
+    def contar_tiles(self, nome_camada):
+        """Retorna quantas células da camada têm tile (0 se a camada não existir)."""
+        grade = self.grades.get(nome_camada)
+        if grade is None:
+            return 0
+        return len(grade) - grade.count(0)
+
+    def superficie(self, indice):
+        """Retorna a superfície da tile `indice` do atlas (None para 0)."""
+        return self.superficies[indice]
+
+    def tiles(self, nome_camada, area=None):
+        """Percorre as tiles de uma camada, linha a linha, como `CacheTiles.tiles`.
+
+        Args:
+            nome_camada (str): Nome da camada de tiles.
+            area (tuple[int, int, int, int] | None): Se fornecida, (x0, y0, x1, y1) em
+                tiles, com x1 e y1 exclusivos; apenas as tiles dessa região são produzidas.
+
+        Yields:
+            tuple[int, int, pygame.Surface]: Coluna, linha e superfície já escalada.
+        """
+        grade = self.grades.get(nome_camada)
+        if grade is None:
+            return
+        largura = self.largura
+        superficies = self.superficies
+
+        if area is None:
+            for i, indice in enumerate(grade):
+                if indice:
+                    yield i % largura, i // largura, superficies[indice]
+            return
+
+        x0, y0, x1, y1 = area
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, largura), min(y1, self.altura)
+        for y in range(y0, y1):
+            base = y * largura
+            for x in range(x0, x1):
+                indice = grade[base + x]
+                if indice:
+                    yield x, y, superficies[indice]
+
+
+def caminho_artefato(mapa_relativo):
+    """Retorna o caminho do artefato compilado de um mapa dentro de `PASTA_CACHE`.
+
+    O caminho é relativo à pasta do jogo e é também o nome do artefato no
+    pacote de assets; no disco ele fica em `utils.caminho_cache`.
+    """
+    nome = os.path.splitext(os.path.basename(mapa_relativo))[0]
+    return os.path.join(PASTA_CACHE, f"{nome}.nivel")
+
+
+def ler_artefato(mapa_relativo):
+    """Lê o artefato compilado de um mapa, recompilando-o se as fontes tiverem mudado.
+
+    Não cria superfícies para a tela, então pode rodar numa thread de
+    carregamento; a conversão das tiles fica para `NivelCompilado`.
+
+    Args:
+        mapa_relativo (str): Caminho do TMX relativo à raiz do jogo (ex.: 'data/mapa_teste.tmx').
+
+    Returns:
+        bytes | memoryview: Conteúdo do artefato (fatia do pacote de assets, se houver).
+    """
+    nome = caminho_artefato(mapa_relativo)
+
+    # no pacote de assets o nível já vem compilado, junto das fontes de que depende
+    pacote = pacote_ativo()
+    if pacote is not None and nome in pacote:
+        return pacote.dados(nome)
+
+    caminho = caminho_cache(os.path.basename(nome))
+    caminho_tmx = resource_path(mapa_relativo)
+    chave = chave_nivel(caminho_tmx)
+
+    dados = None
+    if os.path.exists(caminho):
+        with open(caminho, 'rb') as f:
+            dados = f.read()
+        cabecalho = dados[:TAMANHO_CABECALHO]
+        if len(cabecalho) < TAMANHO_CABECALHO or struct.unpack(FORMATO_CABECALHO, cabecalho)[:3] != \
+                (ASSINATURA, VERSAO_FORMATO, chave):
+            dados = None
+
+    if dados is None:
+        dados = compilar_nivel(caminho_tmx, chave)
+        try:
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            temporario = caminho + '.tmp'
+            with open(temporario, 'wb') as f:
+                f.write(dados)
+            os.replace(temporario, caminho)
+        except OSError as e:
+            print(f"[NIVEL] Não foi possível gravar {caminho}: {e}")
+
+    return dados
+
+
+def carregar_nivel(mapa_relativo):
+    """Carrega um nível compilado, recompilando-o se as fontes tiverem mudado.
+
+    Args:
+        mapa_relativo (str): Caminho do TMX relativo à raiz do jogo (ex.: 'data/mapa_teste.tmx').
+
+    Returns:
+        NivelCompilado: Nível pronto para instanciar as sprites.
+    """
+    return NivelCompilado(ler_artefato(mapa_relativo))
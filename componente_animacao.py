@@ -0,0 +1,112 @@
+"""
+Componente de animação por frames das sprites do jogo SWITCH BACK.
+
+Antes, `Jogador.update` e `Monstro.animar` buscavam a lista de frames e
+criavam um rect novo (`image.get_rect(center=...)`) a cada frame, mesmo sem
+troca de quadro. O componente guarda as tabelas de frames (normais e
+invertidos) e o tamanho de cada frame já calculados; a imagem da sprite só é
+trocada quando o quadro muda, e o rect é ajustado no próprio objeto apenas se
+o tamanho do novo quadro for diferente. Em regime, avançar a animação não
+aloca nenhum objeto.
+
+As tabelas são montadas uma vez por par de animações (normal, invertida) e
+compartilhadas por todos os componentes que as usam.
+"""
+
+# (id das animações, id das invertidas) -> (animações, invertidas, quadros, tamanhos);
+# as animações ficam guardadas para que os ids não sejam reutilizados
+_TABELAS = {}
+
+
+class ComponenteAnimacao:
+    """Estado e tabelas de uma animação por direção, com variante invertida.
+
+    Attributes:
+        quadros (tuple[dict, dict]): Frames por direção, normais (índice 0) e invertidos (índice 1).
+        tamanhos (tuple[dict, dict]): Tamanho (largura, altura) de cada frame, na mesma organização.
+        velocidade (float): Segundos por quadro.
+        indice (int): Quadro atual.
+        tempo (float): Tempo acumulado no quadro atual, em segundos.
+    """
+
+    __slots__ = ('quadros', 'tamanhos', 'velocidade', 'indice', 'tempo')
+
+    def __init__(self, animacoes, animacoes_invertidas, velocidade):
+        """Monta as tabelas do componente.
+
+        Args:
+            animacoes (dict): Mapeia cada direção para a lista de frames normais.
+            animacoes_invertidas (dict): Mapeia cada direção para a lista de frames invertidos.
+            velocidade (float): Duração de cada quadro, em segundos.
+        """
+        chave = (id(animacoes), id(animacoes_invertidas))
+        tabelas = _TABELAS.get(chave)
+        if tabelas is None:
+            quadros = tuple({direcao: tuple(frames) for direcao, frames in tabela.items()}
+                            for tabela in (animacoes, animacoes_invertidas))
+            tamanhos = tuple({direcao: tuple(frame.get_size() for frame in frames) for direcao, frames in tabela.items()}
+                             for tabela in quadros)
+            tabelas = _TABELAS[chave] = (animacoes, animacoes_invertidas, quadros, tamanhos)
+        self.quadros, self.tamanhos = tabelas[2], tabelas[3]
+        self.velocidade = velocidade
+        self.indice = 0
+        self.tempo = 0.0
+
+    def copy(self):
+        """Retorna um componente com as mesmas tabelas (compartilhadas) e uma cópia do estado."""
+        copia = ComponenteAnimacao.__new__(ComponenteAnimacao)
+        copia.quadros = self.quadros
+        copia.tamanhos = self.tamanhos
+        copia.velocidade = self.velocidade
+        copia.indice = self.indice
+        copia.tempo = self.tempo
+        return copia
+
+    def reiniciar(self):
+        """Volta ao primeiro quadro."""
+        self.indice = 0
+        self.tempo = 0.0
+
+    def quadro_inicial(self, direcao, invertida=False):
+        """Retorna o primeiro frame de uma direção."""
+        return self.quadros[invertida][direcao][0]
+
+    def atualizar(self, sprite, dt, direcao, invertida=False, avancar=True):
+        """Avança a animação e aplica o quadro atual à sprite.
+
+        A imagem da sprite só é trocada quando o quadro muda; o rect é
+        ajustado no lugar (mantendo o centro) apenas se o tamanho mudar.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite que recebe o quadro (`image` e `rect`).
+            dt (float): Delta time em segundos.
+            direcao (str): Direção da animação (ex.: 'left').
+            invertida (bool): Se True, usa os frames invertidos (gravidade invertida).
+            avancar (bool): Se False, a animação fica parada no primeiro quadro.
+        """
+        frames = self.quadros[invertida][direcao]
+        if avancar:
+            self.tempo += dt
+            if self.tempo >= self.velocidade:
+                self.tempo = 0.0
+                self.indice = (self.indice + 1) % len(frames)
+        else:
+            self.indice = 0
+            self.tempo = 0.0
+
+        # garante que o índice está dentro do limite da lista escolhida
+        if self.indice >= len(frames):
+            self.indice = 0
+
+        quadro = frames[self.indice]
+        if quadro is sprite.image:
+            return
+        sprite.image = quadro
+
+        # preserva o centro do rect ao trocar a imagem (evita "pulos")
+        largura, altura = self.tamanhos[invertida][direcao][self.indice]
+        rect = sprite.rect
+        if rect.width != largura or rect.height != altura:
+            centro = rect.center
+            rect.size = (largura, altura)
+            rect.center = centro
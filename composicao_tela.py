@@ -0,0 +1,98 @@
+"""
+Composição das telas estáticas do jogo SWITCH BACK.
+
+As telas de menu (início, instruções, game over, vitória, ranking) desenhavam
+a cada frame o preenchimento, a imagem de fundo e os textos, e o loop
+principal atualizava a janela inteira. Com `ComposicaoTela`, a parte estática
+de uma tela é composta uma única vez numa superfície guardada; a cada frame a
+tela redesenha apenas os elementos que mudam e o `draw()` retorna os
+retângulos alterados ("dirty rects"), que o `Jogo` passa para
+`pygame.display.update(rects)`.
+
+Contrato do `draw()` das telas:
+    None         -> a janela inteira mudou (telas que não usam a composição);
+    list[Rect]   -> só essas áreas mudaram (lista vazia: nada a atualizar).
+
+O `Jogo` chama `invalidar()` ao entrar numa tela e depois de sair dela: a
+composição é descartada (sem ocupar memória enquanto a tela não está
+visível) e o próximo desenho atualiza a janela inteira.
+"""
+
+from constantes import *
+
+
+class ComposicaoTela:
+    """Camada estática de uma tela, composta uma vez e reaproveitada.
+
+    Uso típico no `draw()` de uma tela:
+
+        self.composicao.comecar()                # na 1ª vez, compõe e copia a tela inteira
+        self.composicao.restaurar(area)          # apaga um elemento dinâmico
+        self.composicao.desenhar(imagem, pos)    # desenha o elemento
+        return self.composicao.concluir()        # dirty rects do frame
+
+    Attributes:
+        window (pygame.Surface): Janela do jogo.
+        superficie (pygame.Surface | None): Camada estática composta (None até o próximo `comecar`).
+    """
+
+    def __init__(self, window, compor):
+        """Cria a composição (a camada é montada no primeiro `comecar`).
+
+        Args:
+            window (pygame.Surface): Janela do jogo.
+            compor (callable): `compor(superficie)` desenha a parte estática da tela.
+        """
+        self.window = window
+        self.compor = compor
+        self.superficie = None
+        self._sujos = []
+        self._completo = True
+
+    def invalidar(self):
+        """Descarta a camada estática; o próximo desenho recompõe e atualiza a janela inteira."""
+        self.superficie = None
+        self._completo = True
+
+    def comecar(self):
+        """Inicia o frame: recompõe e copia a camada inteira para a janela, se necessário.
+
+        Returns:
+            bool: True se a janela inteira foi redesenhada neste frame.
+        """
+        self._sujos = []
+        if self.superficie is None:
+            self.superficie = pygame.Surface(self.window.get_size(), 0, self.window)
+            self.compor(self.superficie)
+            self._completo = True
+        if self._completo:
+            self.window.blit(self.superficie, (0, 0))
+        return self._completo
+
+    def restaurar(self, area):
+        """Copia uma área da camada estática de volta para a janela (apaga o que havia por cima)."""
+        area = pygame.Rect(area).clip(self.window.get_rect())
+        if area.width and area.height:
+            self.window.blit(self.superficie, area.topleft, area)
+            self._sujos.append(area)
+
+    def desenhar(self, imagem, posicao):
+        """Desenha um elemento dinâmico na janela e registra a área alterada.
+
+        Returns:
+            pygame.Rect: Área ocupada pelo elemento.
+        """
+        area = self.window.blit(imagem, posicao)
+        self._sujos.append(area)
+        return area
+
+    def concluir(self):
+        """Encerra o frame.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a janela inteira após uma recomposição).
+        """
+        if self._completo:
+            self._completo = False
+            return [self.window.get_rect()]
+        return self._sujos
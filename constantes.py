@@ -28,6 +28,9 @@ BASE_TILE_SIZE = 16      # tamanho base da tile (px)
 SCALE_FACTOR = 4         # fator de escala aplicado ao tamanho base
 TILE_SIZE = BASE_TILE_SIZE * SCALE_FACTOR  # tamanho final da tile (px)
 
+# lado dos chunks em que as camadas estáticas do mapa são pré-renderizadas (px)
+TAMANHO_CHUNK = 512
+
 # cores e outros valores
 PRETO = (0, 0, 0)
 AZUL = '#207bfa'
@@ -44,3 +47,25 @@ velocidade_y_invertido = 20   # velocidade vertical inicial com gravidade invert
 
 # tempo para alternar gravidade (milissegundos)
 tempo_mudanca_gravidade = 12000
+
+# simulação de monstros longe da câmera (distâncias em px além das bordas da câmera)
+RAIO_ATIVACAO_MONSTRO = 512    # até aqui: atualização completa
+RAIO_SONO_MONSTRO = 1536       # além daqui: o monstro dorme (não é atualizado)
+INTERVALO_LOD_MONSTRO = 4      # entre os dois raios: uma atualização simplificada a cada N frames
+
+# pasta (relativa à pasta do jogo, ver utils.caminho_cache) onde ficam os artefatos gerados, como os níveis compilados
+PASTA_CACHE = 'cache'
+
+# streaming do mapa em chunks de TAMANHO_CHUNK (ver mundo_streaming.py)
+TILES_MINIMOS_STREAMING = 10000            # mapas com pelo menos tantas tiles (largura x altura) usam streaming
+MARGEM_STREAMING = RAIO_SONO_MONSTRO       # chunks a até essa distância (px) da câmera/jogador ficam carregados
+CHUNKS_STREAMING_POR_FRAME = 4             # máximo de chunks instanciados por frame durante o jogo
+
+# pacote único com os assets e os níveis compilados (ver pacote_assets.py); usado quando existe junto do jogo
+ARQUIVO_PACOTE = 'assets.pak'
+
+# memória máxima (bytes) das imagens carregadas sob demanda que nenhuma tela ativa usa (ver gerenciador_assets.py)
+ORCAMENTO_MEMORIA_ASSETS = 64 * 1024 * 1024
+
+# número máximo de textos renderizados guardados na cache de texto (ver cache_texto.py)
+CAPACIDADE_CACHE_TEXTO = 256
@@ -0,0 +1,215 @@
+"""
+Fila de renderização por profundidade para o jogo SWITCH BACK.
+
+Mantém as sprites permanentemente ordenadas por `rect.centery` (com a ordem
+de inserção como desempate), separadas em duas camadas:
+
+- estáticos: ordenados uma única vez, quando entram na fila;
+- dinâmicos: apenas as sprites que mudaram de `centery` desde o último frame
+  são reposicionadas, via busca binária.
+
+Assim a câmera percorre sprites já ordenadas, sem montar e ordenar uma lista
+nova a cada frame. O resultado é o mesmo de
+`sorted(sprites, key=lambda s: s.rect.centery)` sobre o grupo.
+
+Para o culling, todas as sprites da fila também ficam numa `GradeEspacial`
+com células do tamanho de uma tile: uma consulta pela câmera visita só as
+células da tela, e apenas as sprites encontradas são ordenadas. O custo
+depende da área da tela, não do tamanho do mapa.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from grade_espacial import GradeEspacial
+
+
+class CamadaOrdenada:
+    """Sequência de sprites ordenada pela chave (centery, ordem de inserção).
+
+    Attributes:
+        chaves (list[tuple[int, int]]): Chaves de ordenação, em ordem crescente.
+        sprites (list): Sprites na mesma posição das respectivas chaves.
+        chave_por_sprite (dict): Última chave registrada para cada sprite.
+    """
+
+    def __init__(self):
+        """Inicializa uma camada vazia."""
+        self.chaves = []
+        self.sprites = []
+        self.chave_por_sprite = {}
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def __contains__(self, sprite):
+        return sprite in self.chave_por_sprite
+
+    def inserir(self, sprite, ordem):
+        """Insere a sprite na posição correta da ordenação.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com `rect` definido.
+            ordem (int): Ordem de inserção no grupo (desempate).
+        """
+        chave = (sprite.rect.centery, ordem)
+        i = bisect_right(self.chaves, chave)
+        self.chaves.insert(i, chave)
+        self.sprites.insert(i, sprite)
+        self.chave_por_sprite[sprite] = chave
+
+    def inserir_varios(self, pares):
+        """Insere várias sprites de uma vez, ordenando a camada uma única vez.
+
+        Args:
+            pares (iterable[tuple]): Pares (sprite, ordem).
+        """
+        itens = list(zip(self.chaves, self.sprites))
+        for sprite, ordem in pares:
+            chave = (sprite.rect.centery, ordem)
+            itens.append((chave, sprite))
+            self.chave_por_sprite[sprite] = chave
+        itens.sort(key=lambda item: item[0])
+        self.chaves = [chave for chave, _ in itens]
+        self.sprites = [sprite for _, sprite in itens]
+
+    def remover(self, sprite):
+        """Remove a sprite da camada (ignora sprites ausentes).
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite a remover.
+        """
+        chave = self.chave_por_sprite.pop(sprite, None)
+        if chave is None:
+            return
+        i = bisect_left(self.chaves, chave)
+        del self.chaves[i]
+        del self.sprites[i]
+
+    def reposicionar_movidos(self):
+        """Reposiciona apenas as sprites cujo `centery` mudou desde a última chamada.
+
+        Sprites paradas não geram nenhuma alocação nem deslocamento na lista.
+        """
+        chaves = self.chaves
+        sprites = self.sprites
+        for sprite, chave in self.chave_por_sprite.items():
+            centery = sprite.rect.centery
+            if centery == chave[0]:
+                continue
+            i = bisect_left(chaves, chave)
+            del chaves[i]
+            del sprites[i]
+            nova = (centery, chave[1])
+            j = bisect_right(chaves, nova)
+            chaves.insert(j, nova)
+            sprites.insert(j, sprite)
+            self.chave_por_sprite[sprite] = nova
+
+    def limpar(self):
+        """Remove todas as sprites da camada."""
+        self.chaves.clear()
+        self.sprites.clear()
+        self.chave_por_sprite.clear()
+
+
+class FilaRenderizacao:
+    """Fila de desenho em duas camadas (estáticos e dinâmicos) já ordenadas.
+
+    Attributes:
+        estaticos (CamadaOrdenada): Sprites que não se movem, ordenadas uma vez.
+        dinamicos (CamadaOrdenada): Sprites reposicionadas quando se movem.
+        grade (GradeEspacial): Índice por tile de todas as sprites da fila, usado no culling.
+    """
+
+    def __init__(self):
+        """Inicializa a fila vazia."""
+        self.estaticos = CamadaOrdenada()
+        self.dinamicos = CamadaOrdenada()
+        self.grade = GradeEspacial()
+        # rect com que cada sprite dinâmica foi indexada na grade
+        self._rect_na_grade = {}
+
+    def __len__(self):
+        return len(self.estaticos) + len(self.dinamicos)
+
+    def inserir_dinamico(self, sprite, ordem):
+        """Insere uma sprite dinâmica (reposicionada e reindexada quando se move)."""
+        self.dinamicos.inserir(sprite, ordem)
+        self.grade.adicionar(sprite)
+        self._rect_na_grade[sprite] = sprite.rect.copy()
+
+    def inserir_estaticos(self, pares):
+        """Insere várias sprites estáticas de uma vez.
+
+        Args:
+            pares (iterable[tuple]): Pares (sprite, ordem).
+        """
+        pares = list(pares)
+        self.estaticos.inserir_varios(pares)
+        for sprite, _ in pares:
+            self.grade.adicionar(sprite)
+
+    def retirar_estaticos(self):
+        """Remove e retorna todas as sprites estáticas, na ordem de desenho."""
+        sprites = list(self.estaticos.sprites)
+        for sprite in sprites:
+            self.grade.remover(sprite)
+        self.estaticos.limpar()
+        return sprites
+
+    def remover(self, sprite):
+        """Remove a sprite de qualquer uma das camadas."""
+        self.estaticos.remover(sprite)
+        self.dinamicos.remover(sprite)
+        self.grade.remover(sprite)
+        self._rect_na_grade.pop(sprite, None)
+
+    def _reindexar_movidos(self):
+        """Atualiza na grade as sprites dinâmicas cujo `rect` mudou desde a última consulta."""
+        for sprite, rect in self._rect_na_grade.items():
+            if sprite.rect != rect:
+                self.grade.adicionar(sprite)
+                rect.update(sprite.rect)
+
+    def percorrer(self, area=None):
+        """Percorre as sprites em ordem de profundidade, intercalando as duas camadas.
+
+        Com `area`, as sprites visíveis vêm da grade (só as células da área
+        são visitadas) e são ordenadas pela mesma chave das camadas; sem
+        `area`, as duas camadas são intercaladas por inteiro.
+
+        Args:
+            area (pygame.Rect | None): Se fornecida, apenas as sprites que colidem
+                                       com ela são produzidas.
+
+        Yields:
+            pygame.sprite.Sprite: Sprites na ordem de desenho.
+        """
+        self.dinamicos.reposicionar_movidos()
+
+        if area is not None:
+            self._reindexar_movidos()
+            chave_est = self.estaticos.chave_por_sprite
+            chave_din = self.dinamicos.chave_por_sprite
+            visiveis = [(chave_din.get(sprite) or chave_est[sprite], sprite) for sprite in self.grade.consultar(area)]
+            visiveis.sort(key=lambda item: item[0])
+            for _, sprite in visiveis:
+                yield sprite
+            return
+
+        est_chaves, est_sprites = self.estaticos.chaves, self.estaticos.sprites
+        din_chaves, din_sprites = self.dinamicos.chaves, self.dinamicos.sprites
+        i, fim = 0, len(est_sprites)
+        j, din_fim = 0, len(din_sprites)
+
+        while i < fim:
+            chave = est_chaves[i]
+            while j < din_fim and din_chaves[j] < chave:
+                yield din_sprites[j]
+                j += 1
+            yield est_sprites[i]
+            i += 1
+
+        while j < din_fim:
+            yield din_sprites[j]
+            j += 1
@@ -0,0 +1,177 @@
+"""
+Gerenciador de assets do jogo SWITCH BACK.
+
+Substitui o dicionário `assets` montado de uma vez em `condicoes_iniciais`.
+As telas continuam pedindo os recursos por chave (`assets['game_over']`),
+mas as imagens registradas com `registrar_imagem` só são carregadas no
+primeiro acesso e podem ser descarregadas depois:
+
+- cada tela que acessa uma imagem passa a referenciá-la enquanto estiver ativa
+  (contagem de referências por tela, ver `trocar_tela`);
+- imagens sem referência ficam numa fila LRU e são descarregadas, das menos
+  usadas para as mais usadas, quando a memória das imagens carregadas passa de
+  `ORCAMENTO_MEMORIA_ASSETS`. Um novo acesso as carrega de novo.
+
+Valores atribuídos diretamente (`assets['fonte'] = ...`) ficam fixos na memória.
+Ao voltar a uma tela, as imagens que ela usou da última vez são recarregadas
+em paralelo (`CarregadorParalelo`) antes do primeiro desenho.
+"""
+
+from collections import Counter, OrderedDict
+from collections.abc import MutableMapping
+
+from carregador_assets import CarregadorParalelo, carregar_imagem
+from constantes import *
+
+
+def tamanho_em_bytes(superficie):
+    """Retorna a memória ocupada pelos pixels de uma superfície."""
+    return superficie.get_pitch() * superficie.get_height()
+
+
+class GerenciadorAssets(MutableMapping):
+    """Dicionário de assets com carga preguiçosa e orçamento de memória.
+
+    Attributes:
+        orcamento_bytes (int): Limite de memória das imagens carregadas sem referência.
+        tela_atual (str | None): Tela ativa, que referencia as imagens que acessa.
+        usos (dict): Mapeia cada tela para o conjunto de chaves de imagem que ela usa.
+        referencias (Counter): Número de telas ativas que referenciam cada chave.
+        bytes_carregados (int): Memória das imagens preguiçosas carregadas no momento.
+        carregamentos (int): Imagens carregadas sob demanda, no primeiro acesso.
+        precarregamentos (int): Imagens carregadas em paralelo por `precarregar`.
+        descargas (int): Imagens descartadas para caber no orçamento.
+    """
+
+    def __init__(self, orcamento_bytes=ORCAMENTO_MEMORIA_ASSETS):
+        """Cria o gerenciador vazio.
+
+        Args:
+            orcamento_bytes (int): Memória máxima das imagens carregadas (em bytes).
+        """
+        self.orcamento_bytes = orcamento_bytes
+        self.tela_atual = None
+        self.usos = {}
+        self.referencias = Counter()
+        self.bytes_carregados = 0
+        self.carregamentos = 0
+        self.precarregamentos = 0
+        self.descargas = 0
+
+        self._fixos = {}
+        self._imagens = {}
+        # chave -> superfície, da menos para a mais recentemente usada
+        self._carregadas = OrderedDict()
+
+    def registrar_imagem(self, chave, caminho_relativo, tamanho=None, alpha=None):
+        """Registra uma imagem carregada apenas no primeiro acesso (ver `carregar_imagem`)."""
+        self._imagens[chave] = (caminho_relativo, tamanho, alpha)
+
+    def __getitem__(self, chave):
+        if chave in self._fixos:
+            return self._fixos[chave]
+
+        superficie = self._carregadas.get(chave)
+        if superficie is None:
+            if chave not in self._imagens:
+                raise KeyError(chave)
+            superficie = carregar_imagem(*self._imagens[chave])
+            self._guardar(chave, superficie)
+            self.carregamentos += 1
+        else:
+            self._carregadas.move_to_end(chave)
+
+        if self.tela_atual is not None and chave not in self.usos.setdefault(self.tela_atual, set()):
+            self.usos[self.tela_atual].add(chave)
+            self.referencias[chave] += 1
+        self._liberar_excesso()
+        return superficie
+
+    def __setitem__(self, chave, valor):
+        self._fixos[chave] = valor
+
+    def __delitem__(self, chave):
+        if chave in self._fixos:
+            del self._fixos[chave]
+        elif chave in self._imagens:
+            self._descarregar(chave)
+            del self._imagens[chave]
+        else:
+            raise KeyError(chave)
+
+    def __iter__(self):
+        yield from self._fixos
+        for chave in self._imagens:
+            if chave not in self._fixos:
+                yield chave
+
+    def __len__(self):
+        return len(self._fixos) + sum(1 for chave in self._imagens if chave not in self._fixos)
+
+    def carregada(self, chave):
+        """Retorna True se o asset está na memória (valores fixos sempre estão)."""
+        return chave in self._fixos or chave in self._carregadas
+
+    def declarar_uso(self, tela, chaves):
+        """Marca `chaves` como usadas pela tela, para serem pré-carregadas ao entrar nela.
+
+        Útil para imagens que a tela só acessa no meio do uso (ex.: o fundo do mundo invertido).
+        """
+        usadas = self.usos.setdefault(tela, set())
+        for chave in chaves:
+            if chave not in usadas:
+                usadas.add(chave)
+                if tela == self.tela_atual:
+                    self.referencias[chave] += 1
+
+    def precarregar(self, chaves):
+        """Carrega em paralelo as imagens de `chaves` que ainda não estão na memória."""
+        faltando = [chave for chave in chaves if chave in self._imagens and not self.carregada(chave)]
+        if not faltando:
+            return
+        carregador = CarregadorParalelo()
+        for chave in faltando:
+            carregador.imagem(chave, *self._imagens[chave])
+        for chave, superficie in carregador.concluir().items():
+            self._guardar(chave, superficie)
+        self.precarregamentos += len(faltando)
+        self._liberar_excesso()
+
+    def trocar_tela(self, tela):
+        """Transfere as referências da tela atual para `tela` e pré-carrega o que ela usa.
+
+        Args:
+            tela (str): Identificador da nova tela ativa (ex.: 'JOGO').
+        """
+        if tela == self.tela_atual:
+            return
+        if self.tela_atual is not None:
+            self.referencias.subtract(self.usos.get(self.tela_atual, ()))
+        self.tela_atual = tela
+        usadas = self.usos.setdefault(tela, set())
+        self.referencias.update(usadas)
+        self.precarregar(usadas)
+        self._liberar_excesso()
+
+    def _guardar(self, chave, superficie):
+        """Registra uma imagem recém-carregada como a mais recentemente usada."""
+        self._carregadas[chave] = superficie
+        self.bytes_carregados += tamanho_em_bytes(superficie)
+
+    def _descarregar(self, chave):
+        """Remove uma imagem da memória (ela volta a ser carregada no próximo acesso)."""
+        superficie = self._carregadas.pop(chave, None)
+        if superficie is not None:
+            self.bytes_carregados -= tamanho_em_bytes(superficie)
+
+    def _liberar_excesso(self):
+        """Descarta as imagens sem referência menos usadas até caber no orçamento."""
+        if self.bytes_carregados <= self.orcamento_bytes:
+            return
+        for chave in list(self._carregadas):
+            if self.bytes_carregados <= self.orcamento_bytes:
+                break
+            if self.referencias[chave] > 0:
+                continue
+            self._descarregar(chave)
+            self.descargas += 1
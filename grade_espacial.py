@@ -0,0 +1,110 @@
+"""
+Índice espacial em grade uniforme para o jogo SWITCH BACK.
+
+Divide o mundo em células quadradas (por padrão do tamanho de uma tile) e
+guarda, para cada célula, as sprites cujo `rect` a ocupa. Assim, consultas
+como "quais sprites aparecem na câmera?" percorrem apenas as células da área
+consultada, e não o mapa inteiro.
+"""
+
+from constantes import *
+
+
+class GradeEspacial:
+    """Grade uniforme que indexa sprites pelas células ocupadas pelo seu `rect`.
+
+    Attributes:
+        tamanho_celula (int): Lado de cada célula, em pixels.
+        celulas (dict): Mapeia (cx, cy) para um dicionário usado como conjunto
+                        ordenado das sprites daquela célula.
+        celulas_por_sprite (dict): Mapeia cada sprite para as células em que foi indexada.
+    """
+
+    def __init__(self, tamanho_celula=TILE_SIZE):
+        """Inicializa uma grade vazia.
+
+        Args:
+            tamanho_celula (int): Lado das células em pixels (padrão: `TILE_SIZE`).
+        """
+        self.tamanho_celula = tamanho_celula
+        self.celulas = {}
+        self.celulas_por_sprite = {}
+
+    def __len__(self):
+        return len(self.celulas_por_sprite)
+
+    def __contains__(self, sprite):
+        return sprite in self.celulas_por_sprite
+
+    def celulas_do_rect(self, rect):
+        """Retorna as coordenadas (cx, cy) de todas as células cobertas por `rect`.
+
+        Um rect sem área não ocupa nenhuma célula, coerente com `Rect.colliderect`.
+
+        Args:
+            rect (pygame.Rect): Área a ser convertida em células.
+
+        Returns:
+            list[tuple[int, int]]: Células cobertas, em ordem de linhas.
+        """
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+        c = self.tamanho_celula
+        cx0, cx1 = rect.left // c, (rect.right - 1) // c
+        cy0, cy1 = rect.top // c, (rect.bottom - 1) // c
+        return [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+
+    def adicionar(self, sprite):
+        """Indexa a sprite em todas as células ocupadas pelo seu `rect`.
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite com `rect` já definido.
+        """
+        if sprite in self.celulas_por_sprite:
+            self.remover(sprite)
+        celulas = self.celulas_do_rect(sprite.rect)
+        for celula in celulas:
+            self.celulas.setdefault(celula, {})[sprite] = None
+        self.celulas_por_sprite[sprite] = celulas
+
+    def remover(self, sprite):
+        """Remove a sprite da grade (ignora sprites não indexadas).
+
+        Args:
+            sprite (pygame.sprite.Sprite): Sprite a remover.
+        """
+        celulas = self.celulas_por_sprite.pop(sprite, None)
+        if not celulas:
+            return
+        for celula in celulas:
+            conteudo = self.celulas.get(celula)
+            if conteudo is None:
+                continue
+            conteudo.pop(sprite, None)
+            if not conteudo:
+                del self.celulas[celula]
+
+    def consultar(self, rect):
+        """Retorna as sprites indexadas que colidem com `rect`.
+
+        Apenas as células cobertas por `rect` são visitadas; o teste final
+        com `colliderect` descarta sprites que só compartilham a célula.
+
+        Args:
+            rect (pygame.Rect): Área de consulta em coordenadas do mundo.
+
+        Returns:
+            set: Conjunto de sprites que colidem com a área.
+        """
+        encontrados = set()
+        celulas = self.celulas
+        for celula in self.celulas_do_rect(rect):
+            conteudo = celulas.get(celula)
+            if conteudo:
+                encontrados.update(conteudo)
+        return {sprite for sprite in encontrados if rect.colliderect(sprite.rect)}
+
+    def limpar(self):
+        """Remove todas as sprites da grade."""
+        self.celulas.clear()
+        self.celulas_por_sprite.clear()
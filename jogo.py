@@ -13,127 +13,96 @@ from tela_input_nome import TelaInputNome
 from tela_ranking import TelaRanking 
 from tela_instrucoes_1 import TelaInstrucoes1
 from tela_instrucoes_2 import TelaInstrucoes2 
+from tela_carregando import TelaCarregando
 from constantes import *
 import os
 # Importação corrigida para evitar circular dependency e usar a função de caminho
-from utils import resource_path
+from utils import abrir_recurso, existe_recurso
+from carregador_assets import CarregadorParalelo
+from gerenciador_assets import GerenciadorAssets
+from banco_animacoes import BANCO_ANIMACOES
 
-# 2. FUNÇÃO UTILITÁRIA CORRIGIDA: AGORA USA resource_path INTERNAMENTE
-def carrega_frames_animacao(arquivo_base_relativo, direcoes, num_frames):
-    """Carrega e escala frames de animação a partir de um diretório.
-    
-    A função foi modificada para usar resource_path no caminho completo do arquivo.
+# 2. FUNÇÕES UTILITÁRIAS DE ANIMAÇÃO
+def pedir_frames_animacao(carregador, chave, arquivo_base_relativo, direcoes, num_frames):
+    """Registra no carregador os frames de uma animação (um pedido por frame).
 
     Args:
+        carregador (CarregadorParalelo): Carregador que receberá os pedidos.
+        chave (str): Prefixo das chaves dos pedidos (ex: 'animacoes_jogador').
         arquivo_base_relativo (str): Caminho base onde estão as pastas de direção (ex: 'assets/jogador_mapa').
         direcoes (list[str]): Lista de nomes de subpastas (direções).
         num_frames (int): Número de frames a carregar por direção.
-
-    Returns:
-        dict: Dicionário onde cada chave é uma direção e o valor é a lista
-              de superfícies Pygame (frames) escaladas.
     """
-    animacoes = {}
-    
-    # A base do path deve ser obtida aqui dentro da função, antes do loop
-    base_path_abs = resource_path(arquivo_base_relativo)
-    
     for direction in direcoes:
-        frames = []
-        path = os.path.join(base_path_abs, direction) # Agora usa a base ABSOLUTA
-        
         for i in range(num_frames):
-            filename = f"{i}.png" 
-            full_path = os.path.join(path, filename)
-            
-            # O caminho 'full_path' já é compatível com PyInstaller
-            image = pygame.transform.scale(pygame.image.load(full_path).convert_alpha(), (50,50))
-            frames.append(image)
-            
-        animacoes[direction] = frames
-    return animacoes
+            full_path = os.path.join(arquivo_base_relativo, direction, f"{i}.png")
+            # escala antes de converter: a conversão é feita só no tamanho final
+            carregador.imagem((chave, direction, i), full_path, (50,50))
 
 
-# 3. FUNÇÃO DE CARREGAMENTO DE ASSETS CORRIGIDA
+def montar_animacao(imagens, chave, direcoes, num_frames):
+    """Agrupa os frames carregados por `pedir_frames_animacao` em listas por direção."""
+    return {direction: [imagens[(chave, direction, i)] for i in range(num_frames)] for direction in direcoes}
+
+
+# 3. FUNÇÃO DE CARREGAMENTO DE ASSETS
 def condicoes_iniciais():
     """Carrega e retorna um dicionário com assets iniciais utilizados pelo jogo.
     
-    Todos os caminhos de assets foram corrigidos para usar resource_path().
+    Todos os assets são lidos com utils.abrir_recurso()/ler_recurso(), do
+    pacote de assets quando ele existe (ver `pacote_assets`). As imagens de
+    tela cheia e os fundos são apenas registrados no `GerenciadorAssets` e
+    carregados quando alguma tela os usa. O resto (animações, sons, fontes) é
+    carregado agora: imagens e sons são decodificados em paralelo
+    (`CarregadorParalelo`) e as imagens convertidas para o formato da tela na
+    thread principal.
 
     Returns:
-        dict: Dicionário `assets` contendo superfícies, fontes, sons e
-              configurações (ex: 'vidas_max').
+        GerenciadorAssets: Assets acessados por chave, contendo superfícies, fontes,
+                           sons e configurações (ex: 'vidas_max').
     """
-    assets = {}
+    assets = GerenciadorAssets()
+    carregador = CarregadorParalelo()
     
     # --- IMAGENS ---
-    caminho_jogador = resource_path(os.path.join('assets', 'jogador_mapa', 'down', '0.png'))
-    assets['jogador_mapa'] = pygame.transform.scale(pygame.image.load(caminho_jogador).convert_alpha(), (100,100))
-    
-    caminho_normal = resource_path(os.path.join('assets', 'fundo_mundonormal.png'))
-    assets['fundo_mundonormal'] = pygame.transform.scale(pygame.image.load(caminho_normal), (3200,1600))
-    
-    caminho_invertido = resource_path(os.path.join('assets', 'fundo_mundoinvertido.png'))
-    assets['fundo_mundoinvertido'] = pygame.transform.scale(pygame.image.load(caminho_invertido), (3200,1600))
-    
-    caminho_inicial = resource_path(os.path.join('assets', 'fundo_inicial.png'))
-    assets['fundo_inicial']=pygame.transform.scale(pygame.image.load(caminho_inicial), (1600,880))
-    
-    caminho_nome = resource_path(os.path.join('assets', 'tela_nome.png'))
-    assets['tela_nome'] = pygame.transform.scale(pygame.image.load(caminho_nome), (1600,880))
-    
-    caminho_go = resource_path(os.path.join('assets', 'game_over.png'))
-    assets['game_over'] = pygame.transform.scale(pygame.image.load(caminho_go), (1600,880))
-    
-    caminho_vitoria = resource_path(os.path.join('assets', 'tela_vitoria.png'))
-    assets['tela_vitoria'] = pygame.transform.scale(pygame.image.load(caminho_vitoria), (1600,880))
-    
-    caminho_ins1 = resource_path(os.path.join('assets', 'tela_instrucoes1.png'))
-    assets['tela_instrucoes1'] = pygame.transform.scale(pygame.image.load(caminho_ins1), (1600,880))
-    
-    caminho_ins2 = resource_path(os.path.join('assets', 'tela_instrucoes2.png'))
-    assets['tela_instrucoes2'] = pygame.transform.scale(pygame.image.load(caminho_ins2), (1600,880))
-    
-    # --- FONTES ---
-    caminho_fonte = resource_path(os.path.join('assets', 'font', 'PressStart2P.ttf'))
-    assets['fonte'] = pygame.font.Font(caminho_fonte, 28)
-    assets['fonte2'] = pygame.font.Font(caminho_fonte, 24)
+    # Todas convertidas para o formato da tela; as telas e fundos são opacos
+    # e só ganham canal alpha se a imagem realmente tiver transparência.
+    # Telas e fundos: carregados sob demanda (e descartáveis quando não estão em uso).
+    assets.registrar_imagem('fundo_mundonormal', os.path.join('assets', 'fundo_mundonormal.png'), (3200,1600))
+    assets.registrar_imagem('fundo_mundoinvertido', os.path.join('assets', 'fundo_mundoinvertido.png'), (3200,1600))
+    assets.registrar_imagem('fundo_inicial', os.path.join('assets', 'fundo_inicial.png'), (1600,880))
+    assets.registrar_imagem('tela_nome', os.path.join('assets', 'tela_nome.png'), (1600,880))
+    assets.registrar_imagem('game_over', os.path.join('assets', 'game_over.png'), (1600,880))
+    assets.registrar_imagem('tela_vitoria', os.path.join('assets', 'tela_vitoria.png'), (1600,880))
+    assets.registrar_imagem('tela_instrucoes1', os.path.join('assets', 'tela_instrucoes1.png'), (1600,880))
+    assets.registrar_imagem('tela_instrucoes2', os.path.join('assets', 'tela_instrucoes2.png'), (1600,880))
+    carregador.imagem('jogador_mapa', os.path.join('assets', 'jogador_mapa', 'down', '0.png'), (100,100))
     
     # --- ANIMAÇÕES ---
-    
-    assets['animacoes_jogador'] = carrega_frames_animacao(
-        arquivo_base_relativo='assets/jogador_mapa',
-        direcoes=['down', 'up', 'left', 'right'],
-        num_frames=4
-    )
-    
-    assets['animacoes_monstro'] = carrega_frames_animacao(
-        arquivo_base_relativo='assets/jogador_mapa', 
-        direcoes=['left', 'right'], 
-        num_frames=4 
-    ) 
-    assets['vidas_max'] = 5
+    # jogador e monstro usam a mesma folha, carregada uma vez e registrada no banco de animações
+    pedir_frames_animacao(carregador, 'jogador_mapa', 'assets/jogador_mapa', ['down', 'up', 'left', 'right'], 4)
     
     # --- SONS ---
+    carregador.som('pickup_sound', os.path.join('assets', 'sound', 'capturaitem.mp3'))
+    carregador.som('footstep_sound', os.path.join('assets', 'sound', 'passo.mp3'), volume=0.3)
+    carregador.som('stomp_sound', os.path.join('assets', 'sound', 'pisando.mp3'))
     
-    caminho_pickup_abs = resource_path(os.path.join('assets', 'sound', 'capturaitem.mp3'))
-    if os.path.exists(caminho_pickup_abs):
-        assets['pickup_sound'] = pygame.mixer.Sound(caminho_pickup_abs)
-    else:
-        assets['pickup_sound'] = None
+    # --- FONTES --- (carregadas enquanto o pool decodifica o resto)
+    caminho_fonte = os.path.join('assets', 'font', 'PressStart2P.ttf')
+    assets['fonte'] = pygame.font.Font(abrir_recurso(caminho_fonte), 28)
+    assets['fonte2'] = pygame.font.Font(abrir_recurso(caminho_fonte), 24)
     
-    caminho_passos_abs = resource_path(os.path.join('assets', 'sound', 'passo.mp3'))
-    if os.path.exists(caminho_passos_abs):
-        assets['footstep_sound'] = pygame.mixer.Sound(caminho_passos_abs)
-        assets['footstep_sound'].set_volume(0.3)
-    else:
-        assets['footstep_sound'] = None
-
-    caminho_pisada_abs = resource_path(os.path.join('assets', 'sound', 'pisando.mp3'))
-    if os.path.exists(caminho_pisada_abs):
-        assets['stomp_sound'] = pygame.mixer.Sound(caminho_pisada_abs)
-    else:
-        assets['stomp_sound'] = None
+    carregados = carregador.concluir()
+    for chave, valor in carregados.items():
+        if isinstance(chave, str):
+            assets[chave] = valor
+    BANCO_ANIMACOES.registrar('jogador_mapa', montar_animacao(carregados, 'jogador_mapa', ['down', 'up', 'left', 'right'], 4))
+    # variantes compartilhadas por todas as sprites (as invertidas são usadas com a gravidade invertida)
+    assets['animacoes_jogador'] = BANCO_ANIMACOES.obter('jogador_mapa')
+    assets['animacoes_jogador_invertidas'] = BANCO_ANIMACOES.obter('jogador_mapa', invertida=True)
+    assets['animacoes_monstro'] = BANCO_ANIMACOES.obter('jogador_mapa', ('left', 'right'))
+    assets['animacoes_monstro_invertidas'] = BANCO_ANIMACOES.obter('jogador_mapa', ('left', 'right'), invertida=True)
+    assets['vidas_max'] = 5
 
     return assets
 
@@ -156,12 +125,12 @@ class Jogo:
 
         self.nome_jogador = "" # Variável para armazenar o nome
         
-        # CORREÇÃO: Usar resource_path para caminhos de música
-        caminho_musica = resource_path(os.path.join('assets', 'sound', 'matue.mp3'))
-        self.theme_music_path = caminho_musica if os.path.exists(caminho_musica) else None
+        # Caminho relativo da música (lida com abrir_recurso, do pacote ou do arquivo solto)
+        caminho_musica = os.path.join('assets', 'sound', 'matue.mp3')
+        self.theme_music_path = caminho_musica if existe_recurso(caminho_musica) else None
         
         if self.theme_music_path:
-            pygame.mixer.music.load(self.theme_music_path)
+            pygame.mixer.music.load(abrir_recurso(self.theme_music_path), self.theme_music_path)
             pygame.mixer.music.set_volume(1)
             pygame.mixer.music.play(-1)
 
@@ -175,13 +144,21 @@ class Jogo:
             'INSTRUCOES1': TelaInstrucoes1(self.window, self.assets),
             'INSTRUCOES2': TelaInstrucoes2(self.window, self.assets)
         }
+        # o nível carrega em segundo plano; se o jogo começar antes, mostra o progresso
+        self.telas['CARREGANDO'] = TelaCarregando(self.window, self.assets, self.telas['JOGO'])
+
+        # os dois fundos do jogo se alternam durante a partida: pré-carregados ao entrar no JOGO
+        self.assets.declarar_uso('JOGO', ('fundo_mundonormal', 'fundo_mundoinvertido'))
 
         # define a tela inicial
         self.tela_atual = 'INICIO'
+        self.assets.trocar_tela(self.tela_atual)
+        # tela que acabou de ser deixada: sua composição é descartada após o próximo desenho
+        self._tela_saindo = None
         
-        # CORREÇÃO: Usar resource_path para caminhos de música (Game Over e Vitória)
-        self.gameover_music_path = resource_path(os.path.join('assets', 'sound', 'gameovertheme.mp3'))
-        self.vitoria_music_path = resource_path(os.path.join('assets', 'sound', 'vitoria_sound.mp3'))
+        # Caminhos relativos das músicas (lidas com abrir_recurso; Game Over e Vitória)
+        self.gameover_music_path = os.path.join('assets', 'sound', 'gameovertheme.mp3')
+        self.vitoria_music_path = os.path.join('assets', 'sound', 'vitoria_sound.mp3')
         
         self.current_music_path = None
         
@@ -225,8 +202,7 @@ class Jogo:
                             self.telas['JOGO'].setup()
                         
                         self.telas['JOGO'].iniciar_tempo_gravidade()
-                        self.tela_atual = 'JOGO'
-                        self._handle_screen_music(self.tela_atual)
+                        self._trocar_tela('JOGO')
                         
                         proximo_estado = None 
                         break 
@@ -262,9 +238,13 @@ class Jogo:
 
                 # se for para VITORIA, salva o ranking ANTES de mudar de tela
                 if proximo_estado == 'VITORIA' and tempo_final_ms is not None:
-                    self.telas['RANKING'].add_result(self.nome_jogador, tempo_final_ms)
+                    self.telas['RANKING'].add_result(self.nome_jogador, tempo_final_ms, self.telas['JOGO'].mapa_relativo)
                     self.telas['VITORIA'].set_tempo_final(tempo_final_ms, self.nome_jogador)
 
+                # nível ainda carregando: passa pela tela de carregamento antes do JOGO
+                if proximo_estado == 'JOGO' and not self.telas['JOGO'].pronto:
+                    proximo_estado = 'CARREGANDO'
+
                 # se for para JOGO (inicio de um novo jogo ou vindo do menu), reinicia o nível e a gravidade.
                 if proximo_estado == 'JOGO':
                     # chama restart() para garantir que o mapa e objetivos sejam zerados
@@ -273,17 +253,44 @@ class Jogo:
                     
                     self.telas['JOGO'].iniciar_tempo_gravidade() # inicia o timer e cronômetro
                     
-                self.tela_atual = proximo_estado
-                self._handle_screen_music(self.tela_atual)
+                self._trocar_tela(proximo_estado)
 
-            # desenha a tela atual
+            # desenha a tela atual; telas compostas retornam só as áreas alteradas
+            rects = None
             if hasattr(tela_ativa, 'draw'):
-                tela_ativa.draw()
-                
-            pygame.display.update()
+                rects = tela_ativa.draw()
+
+            if rects is None:
+                pygame.display.update()
+            elif rects:
+                pygame.display.update(rects)
+
+            # a tela deixada neste frame já foi desenhada pela última vez: libera sua composição
+            if self._tela_saindo is not None:
+                if self._tela_saindo is not self.telas[self.tela_atual] and hasattr(self._tela_saindo, 'invalidar'):
+                    self._tela_saindo.invalidar()
+                self._tela_saindo = None
     
         pygame.quit() 
 
+    def _trocar_tela(self, nome):
+        """Troca a tela ativa, ajustando os assets em uso e a música.
+
+        A nova tela é invalidada para que seu primeiro desenho atualize a
+        janela inteira (telas compostas só reportam as áreas alteradas).
+
+        Args:
+            nome (str): Identificador da nova tela (ex: 'JOGO', 'RANKING').
+        """
+        self._tela_saindo = self.telas[self.tela_atual]
+        self.tela_atual = nome
+        self.assets.trocar_tela(self.tela_atual)
+        self._handle_screen_music(self.tela_atual)
+
+        nova = self.telas[self.tela_atual]
+        if hasattr(nova, 'invalidar'):
+            nova.invalidar()
+
     def _handle_screen_music(self, screen_name):
         """Toca a música apropriada para a tela ativa.
 
@@ -299,28 +306,28 @@ class Jogo:
             screen_name (str): Identificador da tela (ex: 'GAMEOVER', 'VITORIA', ...).
         """
         # GAMEOVER
-        if screen_name == 'GAMEOVER' and os.path.exists(self.gameover_music_path):
+        if screen_name == 'GAMEOVER' and existe_recurso(self.gameover_music_path):
             if self.current_music_path != self.gameover_music_path:
                 pygame.mixer.music.stop()
-                pygame.mixer.music.load(self.gameover_music_path)
+                pygame.mixer.music.load(abrir_recurso(self.gameover_music_path), self.gameover_music_path)
                 pygame.mixer.music.play(-1)
                 self.current_music_path = self.gameover_music_path
             return
 
         # VITORIA
-        if screen_name == 'VITORIA' and os.path.exists(self.vitoria_music_path):
+        if screen_name == 'VITORIA' and existe_recurso(self.vitoria_music_path):
             if self.current_music_path != self.vitoria_music_path:
                 pygame.mixer.music.stop()
-                pygame.mixer.music.load(self.vitoria_music_path)
+                pygame.mixer.music.load(abrir_recurso(self.vitoria_music_path), self.vitoria_music_path)
                 pygame.mixer.music.play(-1)
                 self.current_music_path = self.vitoria_music_path
             return
 
         # TEMA PADRAO
-        if self.theme_music_path and os.path.exists(self.theme_music_path):
+        if self.theme_music_path and existe_recurso(self.theme_music_path):
             if self.current_music_path != self.theme_music_path:
                 pygame.mixer.music.stop()
-                pygame.mixer.music.load(self.theme_music_path)
+                pygame.mixer.music.load(abrir_recurso(self.theme_music_path), self.theme_music_path)
                 pygame.mixer.music.play(-1)
                 self.current_music_path = self.theme_music_path
 
@@ -0,0 +1,214 @@
+"""
+Carregamento do mapa em chunks (streaming) para o jogo SWITCH BACK.
+
+Em mapas grandes, instanciar todas as tiles e entidades de uma vez gasta
+memória proporcional ao tamanho do mapa. No modo streaming o mapa é dividido
+em chunks quadrados (alinhados com os chunks da camada estática da câmera) e
+só existem as sprites dos chunks a até `MARGEM_STREAMING` px da área de foco
+(câmera + jogador). Ao se afastar, os chunks são descarregados.
+
+As grades do nível compilado (colisão e água) continuam inteiras na memória:
+são poucos bytes por tile e a física não depende das sprites. O estado das
+entidades persiste entre descargas:
+
+- itens coletados e monstros mortos não voltam quando o chunk é recarregado;
+- monstros vivos (e o objetivo final) são guardados com todo o seu estado e
+  voltam aos grupos quando o chunk em que estão é recarregado.
+"""
+
+from constantes import *
+
+
+class MundoStreaming:
+    """Controla quais chunks do mapa estão instanciados.
+
+    A criação das sprites fica com quem usa o mundo (a `TelaJogo`), através
+    de callbacks; aqui ficam apenas a escolha dos chunks e o estado persistente.
+
+    Attributes:
+        nivel (NivelCompilado): Nível com as grades e as tabelas de entidades.
+        tamanho_chunk (int): Lado dos chunks, em pixels.
+        carregados (dict): Mapeia (cx, cy) para as sprites de tiles criadas no chunk.
+        objetos (dict): Mapeia o id de cada entidade já criada para a sua sprite.
+        sprites_objetos (set): As sprites de `objetos`, para consultas de pertinência.
+        guardados (dict): Mapeia (cx, cy) para as entidades vivas guardadas ao descarregar o chunk.
+        removidos (set): Ids de itens coletados e monstros mortos.
+    """
+
+    def __init__(self, nivel, criar_tiles, criar_entidade, reativar_entidade=None,
+                 tamanho_chunk=TAMANHO_CHUNK, margem=MARGEM_STREAMING):
+        """Inicializa o mundo sem nenhum chunk carregado.
+
+        Args:
+            nivel (NivelCompilado): Nível carregado.
+            criar_tiles (callable): `criar_tiles(area)` cria as tiles da região
+                (x0, y0, x1, y1), em tiles, e devolve a lista de sprites.
+            criar_entidade (callable): `criar_entidade(tipo, dados)` cria a sprite de
+                uma entidade ('entidade' ou 'item') e a devolve (ou None).
+            reativar_entidade (callable | None): Chamado com a sprite quando uma entidade
+                guardada volta ao mapa (ex.: para aplicar a gravidade atual).
+            tamanho_chunk (int): Lado dos chunks em pixels.
+            margem (int): Distância (px) além da área de foco em que os chunks são carregados.
+        """
+        self.nivel = nivel
+        self.criar_tiles = criar_tiles
+        self.criar_entidade = criar_entidade
+        self.reativar_entidade = reativar_entidade
+        self.tamanho_chunk = tamanho_chunk
+        self.margem = margem
+
+        self.colunas = (nivel.largura * TILE_SIZE + tamanho_chunk - 1) // tamanho_chunk
+        self.linhas = (nivel.altura * TILE_SIZE + tamanho_chunk - 1) // tamanho_chunk
+
+        # entidades de cada chunk pela posição inicial; o jogador não é gerenciado aqui
+        self.entidades_por_chunk = {}
+        for tipo, tabela in (('entidade', nivel.entidades), ('item', nivel.itens)):
+            for indice, dados in enumerate(tabela):
+                if dados['nome'] == 'Player':
+                    continue
+                celula = self.celula_do_ponto(dados['x'], dados['y'])
+                self.entidades_por_chunk.setdefault(celula, []).append(((tipo, indice), tipo, dados))
+
+        self.carregados = {}
+        self.objetos = {}
+        self.sprites_objetos = set()
+        self.guardados = {}
+        self._ids_guardados = set()
+        self.removidos = set()
+
+    def __len__(self):
+        return len(self.carregados)
+
+    def gerencia(self, sprite):
+        """Retorna True se a sprite é uma entidade criada pelo mundo."""
+        return sprite in self.sprites_objetos
+
+    def celula_do_ponto(self, x, y):
+        """Retorna o chunk (cx, cy) que contém o ponto (x, y) em pixels."""
+        lado = self.tamanho_chunk
+        return int(x) // lado, int(y) // lado
+
+    def celulas_da_area(self, area):
+        """Retorna os chunks do mapa que tocam `area` (recortados aos limites do mapa).
+
+        Args:
+            area (pygame.Rect): Área em pixels.
+
+        Returns:
+            list[tuple[int, int]]: Chunks (cx, cy).
+        """
+        lado = self.tamanho_chunk
+        cx0 = max(area.left // lado, 0)
+        cx1 = min((area.right - 1) // lado, self.colunas - 1)
+        cy0 = max(area.top // lado, 0)
+        cy1 = min((area.bottom - 1) // lado, self.linhas - 1)
+        return [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+
+    def atualizar(self, area_foco, limite=CHUNKS_STREAMING_POR_FRAME):
+        """Carrega os chunks próximos da área de foco e descarrega os distantes.
+
+        Chunks são descarregados apenas um chunk além da margem de carga, para
+        evitar carregar e descarregar o mesmo chunk enquanto o jogador anda
+        perto da borda.
+
+        Args:
+            area_foco (pygame.Rect): Área de interesse (câmera + jogador), em pixels.
+            limite (int | None): Máximo de chunks carregados nesta chamada (None = sem limite).
+        """
+        self._registrar_removidos()
+
+        margem_descarga = self.margem + self.tamanho_chunk
+        manter = set(self.celulas_da_area(area_foco.inflate(2 * margem_descarga, 2 * margem_descarga)))
+        for celula in [celula for celula in self.carregados if celula not in manter]:
+            self._descarregar(celula)
+
+        # entidades que andaram até um chunk não carregado também saem do mapa
+        for id_entidade, sprite in self.objetos.items():
+            if id_entidade in self._ids_guardados or not sprite.alive():
+                continue
+            celula = self.celula_do_ponto(*sprite.rect.center)
+            if celula not in self.carregados:
+                self._guardar(id_entidade, sprite, celula)
+
+        faltando = self._faltando(area_foco)
+        if limite is not None:
+            faltando = faltando[:limite]
+        for celula in faltando:
+            self._carregar(celula)
+
+    def etapas_carregar(self, area_foco):
+        """Carrega todos os chunks próximos da área de foco, um por etapa (gerador).
+
+        Args:
+            area_foco (pygame.Rect): Área de interesse, em pixels.
+        """
+        for celula in self._faltando(area_foco):
+            self._carregar(celula)
+            yield
+
+    def reiniciar(self):
+        """Descarta todos os chunks e o estado das entidades (novo jogo)."""
+        for celula in list(self.carregados):
+            self._descarregar(celula)
+        for sprite in self.objetos.values():
+            sprite.kill()
+        self.objetos.clear()
+        self.sprites_objetos.clear()
+        self.guardados.clear()
+        self._ids_guardados.clear()
+        self.removidos.clear()
+
+    def _faltando(self, area_foco):
+        """Chunks dentro da margem que ainda não foram carregados, dos mais próximos aos mais distantes."""
+        lado = self.tamanho_chunk
+        centro_x, centro_y = area_foco.center
+        desejados = self.celulas_da_area(area_foco.inflate(2 * self.margem, 2 * self.margem))
+        faltando = [celula for celula in desejados if celula not in self.carregados]
+        faltando.sort(key=lambda celula: (celula[0] * lado + lado // 2 - centro_x) ** 2 +
+                                         (celula[1] * lado + lado // 2 - centro_y) ** 2)
+        return faltando
+
+    def _registrar_removidos(self):
+        """Marca como removidas as entidades que saíram do jogo (item coletado, monstro morto)."""
+        mortos = [id_entidade for id_entidade, sprite in self.objetos.items()
+                  if id_entidade not in self._ids_guardados and not sprite.alive()]
+        for id_entidade in mortos:
+            self.removidos.add(id_entidade)
+            self.sprites_objetos.discard(self.objetos.pop(id_entidade))
+
+    def _carregar(self, celula):
+        """Cria as tiles do chunk e traz de volta (ou cria) as suas entidades."""
+        passo = self.tamanho_chunk // TILE_SIZE
+        x0, y0 = celula[0] * passo, celula[1] * passo
+        self.carregados[celula] = self.criar_tiles((x0, y0, x0 + passo, y0 + passo))
+
+        for id_entidade, sprite, grupos in self.guardados.pop(celula, ()):
+            self._ids_guardados.discard(id_entidade)
+            sprite.add(*grupos)
+            if self.reativar_entidade is not None:
+                self.reativar_entidade(sprite)
+
+        for id_entidade, tipo, dados in self.entidades_por_chunk.get(celula, ()):
+            if id_entidade in self.removidos or id_entidade in self.objetos:
+                continue
+            sprite = self.criar_entidade(tipo, dados)
+            if sprite is not None:
+                self.objetos[id_entidade] = sprite
+                self.sprites_objetos.add(sprite)
+
+    def _descarregar(self, celula):
+        """Remove as tiles do chunk e guarda as entidades vivas que estão nele."""
+        for sprite in self.carregados.pop(celula):
+            sprite.kill()
+
+        for id_entidade, sprite in self.objetos.items():
+            if id_entidade in self._ids_guardados or not sprite.alive():
+                continue
+            if self.celula_do_ponto(*sprite.rect.center) == celula:
+                self._guardar(id_entidade, sprite, celula)
+
+    def _guardar(self, id_entidade, sprite, celula):
+        """Tira a entidade de todos os grupos, guardando-a para quando `celula` for recarregada."""
+        self.guardados.setdefault(celula, []).append((id_entidade, sprite, tuple(sprite.groups())))
+        self._ids_guardados.add(id_entidade)
+        sprite.kill()
@@ -0,0 +1,243 @@
+"""
+Pacote único de assets do jogo SWITCH BACK.
+
+No executável de arquivo único do PyInstaller, cada arquivo solto de
+`assets/` e `data/` é extraído para uma pasta temporária a cada execução.
+O pacote junta esses arquivos (e os níveis já compilados) num só arquivo
+indexado; em tempo de execução ele é mapeado com `mmap` e cada recurso é
+lido como uma fatia da memória mapeada, sem cópia, por uma API de arquivo
+(`ArquivoPacote`) que o pygame aceita no lugar de um caminho.
+
+Se `ARQUIVO_PACOTE` existir junto do jogo (ver `utils.resource_path`), os
+recursos são lidos dele (`utils.abrir_recurso`); senão, dos arquivos soltos.
+O pacote deve ser gerado de novo sempre que um asset mudar:
+
+    python pacote_assets.py
+
+Formato do arquivo (little-endian):
+    cabeçalho  `FORMATO_CABECALHO` (assinatura, versão, tamanho do índice)
+    índice     JSON que mapeia cada caminho relativo ('/' como separador) para [deslocamento, tamanho]
+    dados      conteúdo dos arquivos, cada um alinhado a `ALINHAMENTO` bytes
+"""
+
+import io
+import json
+import mmap
+import os
+import struct
+import time
+from os import walk
+from os.path import join
+
+from constantes import *
+from utils import resource_path
+
+ASSINATURA = b'SBPK'
+VERSAO_FORMATO = 1
+FORMATO_CABECALHO = '<4sHI'
+TAMANHO_CABECALHO = struct.calcsize(FORMATO_CABECALHO)
+ALINHAMENTO = 16
+
+# Pastas empacotadas e níveis que entram já compilados no pacote
+PASTAS_PACOTE = ('assets', 'data')
+NIVEIS_PACOTE = (join('data', 'mapa_teste.tmx'),)
+
+_pacote = None
+_pacote_procurado = False
+
+
+def nome_recurso(caminho_relativo):
+    """Normaliza um caminho relativo para a chave usada no índice do pacote."""
+    return os.path.normpath(caminho_relativo).replace(os.sep, '/')
+
+
+class ArquivoPacote(io.RawIOBase):
+    """Arquivo somente leitura sobre um buffer (uma fatia do pacote mapeado).
+
+    Pode ser passado ao pygame onde ele aceita um objeto de arquivo
+    (`pygame.image.load`, `pygame.mixer.Sound`, `pygame.font.Font`,
+    `pygame.mixer.music.load`).
+
+    Attributes:
+        name (str): Caminho relativo do recurso.
+        dados (memoryview): Conteúdo do recurso (sem cópia).
+    """
+
+    def __init__(self, dados, nome=''):
+        """Cria o arquivo.
+
+        Args:
+            dados (bytes | memoryview): Conteúdo do recurso.
+            nome (str): Caminho relativo do recurso.
+        """
+        super().__init__()
+        self.dados = memoryview(dados)
+        self.name = nome
+        self._posicao = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, destino):
+        """Copia até `len(destino)` bytes a partir da posição atual."""
+        inicio = self._posicao
+        fim = min(inicio + len(destino), len(self.dados))
+        quantidade = max(fim - inicio, 0)
+        destino[:quantidade] = self.dados[inicio:inicio + quantidade]
+        self._posicao += quantidade
+        return quantidade
+
+    def seek(self, deslocamento, referencia=io.SEEK_SET):
+        if referencia == io.SEEK_CUR:
+            deslocamento += self._posicao
+        elif referencia == io.SEEK_END:
+            deslocamento += len(self.dados)
+        if deslocamento < 0:
+            raise ValueError("posição negativa")
+        self._posicao = deslocamento
+        return self._posicao
+
+    def tell(self):
+        return self._posicao
+
+
+class PacoteAssets:
+    """Leitor de um pacote de assets mapeado em memória.
+
+    Attributes:
+        caminho (str): Caminho do arquivo do pacote.
+        indice (dict): Mapeia o nome de cada recurso para (deslocamento, tamanho).
+    """
+
+    def __init__(self, caminho):
+        """Mapeia o pacote e lê o índice.
+
+        Args:
+            caminho (str): Caminho do arquivo do pacote.
+
+        Raises:
+            ValueError: Se a assinatura ou a versão do formato não conferirem.
+        """
+        self.caminho = caminho
+        with open(caminho, 'rb') as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._memoria = memoryview(self._mapa)
+
+        if len(self._mapa) < TAMANHO_CABECALHO:
+            raise ValueError("pacote de assets inválido")
+        assinatura, versao, tamanho_indice = struct.unpack_from(FORMATO_CABECALHO, self._mapa)
+        if assinatura != ASSINATURA or versao != VERSAO_FORMATO:
+            raise ValueError("pacote de assets inválido ou de outra versão")
+        indice = json.loads(bytes(self._memoria[TAMANHO_CABECALHO:TAMANHO_CABECALHO + tamanho_indice]))
+        self.indice = {nome: tuple(posicao) for nome, posicao in indice.items()}
+
+    def __contains__(self, caminho_relativo):
+        return nome_recurso(caminho_relativo) in self.indice
+
+    def __len__(self):
+        return len(self.indice)
+
+    def dados(self, caminho_relativo):
+        """Retorna o conteúdo de um recurso como fatia da memória mapeada (sem cópia).
+
+        Raises:
+            FileNotFoundError: Se o recurso não estiver no pacote.
+        """
+        nome = nome_recurso(caminho_relativo)
+        if nome not in self.indice:
+            raise FileNotFoundError(f"{nome} não está em {self.caminho}")
+        deslocamento, tamanho = self.indice[nome]
+        return self._memoria[deslocamento:deslocamento + tamanho]
+
+    def abrir(self, caminho_relativo):
+        """Abre um recurso do pacote como arquivo somente leitura (ver `ArquivoPacote`)."""
+        return ArquivoPacote(self.dados(caminho_relativo), nome_recurso(caminho_relativo))
+
+
+def pacote_ativo():
+    """Retorna o pacote de assets do jogo, ou None se não houver pacote.
+
+    O pacote é procurado (com `resource_path`) e mapeado uma única vez.
+    """
+    global _pacote, _pacote_procurado
+    if not _pacote_procurado:
+        _pacote_procurado = True
+        caminho = resource_path(ARQUIVO_PACOTE)
+        if os.path.exists(caminho):
+            try:
+                _pacote = PacoteAssets(caminho)
+                print(f"[PACOTE] {ARQUIVO_PACOTE}: {len(_pacote)} recursos")
+            except (OSError, ValueError) as e:
+                print(f"[PACOTE] Ignorando {caminho}: {e}")
+    return _pacote
+
+
+def criar_pacote(destino=ARQUIVO_PACOTE, pastas=PASTAS_PACOTE, niveis=NIVEIS_PACOTE):
+    """Gera o pacote com os arquivos das pastas e os níveis compilados.
+
+    Args:
+        destino (str): Caminho do pacote gerado.
+        pastas (tuple[str]): Pastas (relativas à raiz do jogo) incluídas por inteiro.
+        niveis (tuple[str]): Mapas TMX cujo artefato compilado entra no pacote
+            (com o nome de `compilador_nivel.caminho_artefato`).
+
+    Returns:
+        int: Número de recursos empacotados.
+    """
+    from compilador_nivel import caminho_artefato, ler_artefato
+
+    # o pacote é sempre gerado a partir dos arquivos soltos, nunca de um pacote antigo
+    global _pacote, _pacote_procurado
+    _pacote, _pacote_procurado = None, True
+
+    inicio = time.perf_counter()
+    conteudos = {}
+    for pasta in pastas:
+        for raiz, _, arquivos in walk(pasta, followlinks=True):
+            for arquivo in sorted(arquivos):
+                caminho = join(raiz, arquivo)
+                with open(caminho, 'rb') as f:
+                    conteudos[nome_recurso(caminho)] = f.read()
+    for mapa_relativo in niveis:
+        conteudos[nome_recurso(caminho_artefato(mapa_relativo))] = bytes(ler_artefato(mapa_relativo))
+
+    # o índice guarda deslocamentos absolutos, então o seu tamanho precisa ser fixado antes
+    def montar_indice(base):
+        indice = {}
+        posicao = base
+        for nome, conteudo in conteudos.items():
+            posicao += -posicao % ALINHAMENTO
+            indice[nome] = [posicao, len(conteudo)]
+            posicao += len(conteudo)
+        return indice
+
+    tamanho_indice = 0
+    while True:
+        texto = json.dumps(montar_indice(TAMANHO_CABECALHO + tamanho_indice)).encode()
+        if len(texto) <= tamanho_indice:
+            break
+        tamanho_indice = len(texto) + 64
+    texto = texto.ljust(tamanho_indice)
+
+    temporario = destino + '.tmp'
+    with open(temporario, 'wb') as f:
+        f.write(struct.pack(FORMATO_CABECALHO, ASSINATURA, VERSAO_FORMATO, tamanho_indice))
+        f.write(texto)
+        for nome, conteudo in conteudos.items():
+            f.write(b'\0' * (-f.tell() % ALINHAMENTO))
+            f.write(conteudo)
+    os.replace(temporario, destino)
+
+    duracao_ms = (time.perf_counter() - inicio) * 1000
+    print(f"[PACOTE] {destino}: {len(conteudos)} recursos, "
+          f"{os.path.getsize(destino) // 1024} KiB em {duracao_ms:.1f} ms")
+    return len(conteudos)
+
+
+if __name__ == '__main__':
+    # usa o módulo importado (o mesmo que `compilador_nivel` enxerga), não o __main__
+    from pacote_assets import criar_pacote
+    criar_pacote()
@@ -0,0 +1,107 @@
+"""
+Painel do inventário (overlay) do jogo SWITCH BACK.
+
+O painel é um widget retido: a superfície semitransparente com o título e as
+miniaturas dos itens é montada uma vez e guardada, e só é montada de novo
+quando o inventário muda. As miniaturas são geradas uma única vez por imagem
+de item (a tile do atlas do nível, compartilhada por todos os itens iguais).
+Com o inventário aberto, desenhar o painel custa um único blit por frame.
+"""
+
+from constantes import *
+from cache_texto import renderizar_texto
+
+
+class PainelInventario:
+    """Overlay com as miniaturas dos itens coletados.
+
+    O inventário é uma lista de dicionários {'tipo', 'image'} que só recebe
+    itens no fim; o painel percebe os itens novos pelo tamanho da lista.
+    Qualquer outra alteração (inclusive esvaziar a lista, que pode voltar ao
+    mesmo tamanho com outros itens antes do próximo desenho) deve chamar
+    `invalidar()`.
+
+    Attributes:
+        fonte (pygame.font.Font): Fonte do título.
+        largura (int): Largura do painel.
+        altura (int): Altura do painel.
+        miniaturas (dict): Mapeia a imagem de cada item (ou o tipo, se não houver imagem) para a miniatura.
+    """
+
+    PADDING = 10
+    TAMANHO_MINIATURA = 48
+
+    def __init__(self, fonte, largura=400, altura=200):
+        """Cria o painel (a superfície é montada no primeiro desenho).
+
+        Args:
+            fonte (pygame.font.Font): Fonte do título.
+            largura (int): Largura do painel em pixels.
+            altura (int): Altura do painel em pixels.
+        """
+        self.fonte = fonte
+        self.largura = largura
+        self.altura = altura
+        self.miniaturas = {}
+        self._superficie = None
+        self._quantidade = None
+
+    def invalidar(self):
+        """Força a montagem do painel no próximo desenho."""
+        self._quantidade = None
+
+    def miniatura(self, tipo, imagem):
+        """Retorna a miniatura de um item, gerando-a na primeira vez para cada imagem.
+
+        Itens do mesmo tipo podem usar tiles diferentes, por isso a chave é a
+        própria imagem (as tiles do nível são compartilhadas, não copiadas).
+
+        Args:
+            tipo (str | None): Tipo do item (ex.: 'shield'), usado como chave quando não há imagem.
+            imagem (pygame.Surface | None): Imagem do item; sem imagem, a miniatura é um quadrado cinza.
+        """
+        chave = imagem if isinstance(imagem, pygame.Surface) else tipo
+        miniatura = self.miniaturas.get(chave)
+        if miniatura is None:
+            lado = self.TAMANHO_MINIATURA
+            if isinstance(imagem, pygame.Surface):
+                miniatura = pygame.transform.scale(imagem, (lado, lado))
+            else:
+                miniatura = pygame.Surface((lado, lado))
+                miniatura.fill((100, 100, 100))
+            self.miniaturas[chave] = miniatura
+        return miniatura
+
+    def montar(self, inventario):
+        """Monta a superfície do painel com o título e as miniaturas dos itens."""
+        superficie = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
+        superficie.fill((0, 0, 0, 180))
+
+        titulo = renderizar_texto(self.fonte, 'INVENTARIO', True, (255, 255, 255))
+        superficie.blit(titulo, (10, 10))
+
+        padding = self.PADDING
+        lado = self.TAMANHO_MINIATURA
+        x = padding
+        y = 40
+        for entry in inventario:
+            superficie.blit(self.miniatura(entry.get('tipo'), entry.get('image')), (x, y))
+            x += lado + padding
+            if x + lado + padding > self.largura:
+                x = padding
+                y += lado + padding
+
+        self._superficie = superficie
+        self._quantidade = len(inventario)
+
+    def desenhar(self, destino, inventario):
+        """Desenha o painel centralizado em `destino`, remontando-o se o inventário mudou.
+
+        Args:
+            destino (pygame.Surface): Superfície onde o painel é desenhado (a janela).
+            inventario (list[dict]): Itens coletados.
+        """
+        if len(inventario) != self._quantidade:
+            self.montar(inventario)
+        destino.blit(self._superficie, (destino.get_width() // 2 - self.largura // 2,
+                                        destino.get_height() // 2 - self.altura // 2))
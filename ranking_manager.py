@@ -5,14 +5,36 @@ Este módulo define funções utilitárias para:
     - Carregar e salvar o ranking de tempos (em milissegundos);
     - Adicionar novos resultados e manter apenas os 10 melhores tempos;
     - Garantir recuperação segura em caso de arquivo corrompido ou ausente.
+
+A tela de ranking lê os dados pelo `REPOSITORIO_RANKING`, que guarda o
+ranking já interpretado em memória e só lê o arquivo de novo quando o
+tamanho ou a data de modificação mudam (ou após `adicionar_tempo`).
+
+Com ``BACKEND_RANKING = 'sqlite'``, todas as corridas ficam guardadas num banco
+SQLite indexado (ver `ranking_sqlite`); `carregar_ranking` e `adicionar_tempo`
+continuam retornando o Top 10, e `melhor_tempo` e `posicao_do_tempo`
+consultam o histórico completo. Na criação do banco, os registros do JSON
+existente são importados.
 """
 
 import json
 import os
+import time
+
+from ranking_sqlite import RankingSQLite
+
+# Armazenamento do ranking: 'json' (Top 10 em ARQUIVO_RANKING) ou 'sqlite' (todas as corridas)
+BACKEND_RANKING = 'json'
 
 # Caminho padrão do arquivo de ranking
 ARQUIVO_RANKING = 'ranking.json'
 
+# Caminho do banco usado pelo backend 'sqlite'
+ARQUIVO_RANKING_SQLITE = 'ranking.db'
+
+# Mapa atribuído às corridas quando nenhum é informado (e aos registros importados do JSON)
+MAPA_PADRAO = 'data/mapa_teste.tmx'
+
 # Número máximo de registros mantidos
 MAX_REGISTROS = 10  # Limite o ranking ao Top 10
 
@@ -23,35 +45,75 @@ RANKING_PADRAO = [
     {"nome": "GHOST", "tempo_ms": 240000} # 4m 00s
 ]
 
+# Intervalo mínimo (s) entre verificações do arquivo pelo repositório
+INTERVALO_VERIFICACAO = 1.0
 
-def carregar_ranking():
-    """Carrega o ranking do arquivo JSON.
+# Banco do backend 'sqlite' (aberto sob demanda por banco_ranking)
+_banco = None
+
+
+def _id_mapa(mapa):
+    """Normaliza o identificador do mapa (None = MAPA_PADRAO; separadores '/')."""
+    return (mapa or MAPA_PADRAO).replace(os.sep, '/')
+
+
+def banco_ranking():
+    """Retorna o banco do backend 'sqlite', abrindo-o na primeira chamada.
+
+    Se o banco acabou de ser criado, os registros de ``ARQUIVO_RANKING``
+    (ou o ``RANKING_PADRAO``) são importados para ele.
+    """
+    global _banco
+    if _banco is None:
+        _banco = RankingSQLite(ARQUIVO_RANKING_SQLITE)
+        if _banco.novo:
+            importados = _banco.importar(_carregar_json(), _id_mapa(None))
+            print(f"[RANKING] {ARQUIVO_RANKING_SQLITE} criado; {importados} registros importados de {ARQUIVO_RANKING}")
+    return _banco
 
-    Lê o conteúdo de ``ARQUIVO_RANKING`` e retorna uma lista de dicionários,
-    cada um contendo ``nome`` e ``tempo_ms``.  
-    Caso o arquivo não exista, esteja vazio ou corrompido, retorna
-    o ``RANKING_PADRAO``.
+
+def carregar_ranking(mapa=None):
+    """Carrega o ranking (Top ``MAX_REGISTROS``).
+
+    No backend 'json', lê o conteúdo de ``ARQUIVO_RANKING``; no 'sqlite',
+    consulta os melhores tempos do mapa no banco.
+    Retorna uma lista de dicionários, cada um contendo ``nome`` e ``tempo_ms``.
+
+    Args:
+        mapa (str | None): Mapa consultado (só no backend 'sqlite'; None = ``MAPA_PADRAO``).
 
     Returns:
         list[dict]: Lista de registros do ranking, onde cada item contém:
             - ``nome`` (str): Nome do jogador.
             - ``tempo_ms`` (int): Tempo em milissegundos.
     """
+    if BACKEND_RANKING == 'sqlite':
+        return banco_ranking().melhores(MAX_REGISTROS, _id_mapa(mapa))
+    return _carregar_json()
+
+
+def _carregar_json():
+    """Lê o ranking de ``ARQUIVO_RANKING``.
+
+    Caso o arquivo não exista, esteja vazio ou corrompido, retorna
+    uma cópia do ``RANKING_PADRAO``.
+    """
+    # cópia: quem recebe a lista pode alterá-la (ex.: adicionar_tempo) sem tocar no padrão
     if not os.path.exists(ARQUIVO_RANKING):
-        return RANKING_PADRAO
+        return list(RANKING_PADRAO)
     
     try:
         with open(ARQUIVO_RANKING, 'r', encoding='utf-8') as f:
             conteudo = f.read()
             if not conteudo:
-                return RANKING_PADRAO
+                return list(RANKING_PADRAO)
             return json.loads(conteudo)
     except json.JSONDecodeError:
         print(f"[ERRO RANKING] Conteúdo de {ARQUIVO_RANKING} inválido. Usando ranking padrão.")
-        return RANKING_PADRAO
+        return list(RANKING_PADRAO)
     except Exception as e:
         print(f"[ERRO RANKING] Erro ao carregar: {e}. Usando ranking padrão.")
-        return RANKING_PADRAO
+        return list(RANKING_PADRAO)
 
 
 def salvar_ranking(dados):
@@ -67,20 +129,28 @@ def salvar_ranking(dados):
         print(f"[ERRO RANKING] Erro ao salvar: {e}")
 
 
-def adicionar_tempo(nome, tempo_ms):
+def adicionar_tempo(nome, tempo_ms, mapa=None):
     """Adiciona um novo tempo ao ranking e mantém apenas os melhores resultados.
 
     O novo registro é adicionado à lista atual, que é então ordenada em ordem
     crescente de ``tempo_ms`` (menores tempos primeiro).  
     Apenas os ``MAX_REGISTROS`` melhores tempos são mantidos.
+    No backend 'sqlite', a corrida é inserida no histórico (nada é descartado).
 
     Args:
         nome (str): Nome do jogador a ser adicionado no ranking.
         tempo_ms (int): Tempo total do jogador em milissegundos.
+        mapa (str | None): Mapa da corrida (só no backend 'sqlite'; None = ``MAPA_PADRAO``).
 
     Returns:
         list[dict]: Lista atualizada dos melhores tempos (Top 10).
     """
+    if BACKEND_RANKING == 'sqlite':
+        banco = banco_ranking()
+        banco.adicionar(nome.strip().upper(), tempo_ms, _id_mapa(mapa))
+        REPOSITORIO_RANKING.invalidar()
+        return banco.melhores(MAX_REGISTROS, _id_mapa(mapa))
+
     ranking = carregar_ranking()
     
     # Adiciona o novo registro
@@ -94,5 +164,104 @@ def adicionar_tempo(nome, tempo_ms):
     ranking = ranking[:MAX_REGISTROS]
     
     salvar_ranking(ranking)
+    REPOSITORIO_RANKING.invalidar()
     
     return ranking
+
+
+def melhor_tempo(nome, mapa=None):
+    """Retorna o melhor tempo de um jogador, ou None se ele não tiver registros.
+
+    No backend 'json' só os registros do Top 10 são considerados.
+
+    Args:
+        nome (str): Nome do jogador (comparado como é gravado: sem espaços nas pontas, em maiúsculas).
+        mapa (str | None): Mapa consultado (só no backend 'sqlite'; None = ``MAPA_PADRAO``).
+    """
+    nome = nome.strip().upper()
+    if BACKEND_RANKING == 'sqlite':
+        return banco_ranking().melhor_tempo(nome, _id_mapa(mapa))
+    tempos = [r['tempo_ms'] for r in carregar_ranking() if r.get('nome') == nome]
+    return min(tempos, default=None)
+
+
+def posicao_do_tempo(tempo_ms, mapa=None):
+    """Retorna a posição (a partir de 1) que um tempo ocuparia no ranking.
+
+    No backend 'sqlite' a posição é relativa a todas as corridas do mapa;
+    no 'json', ao Top 10.
+
+    Args:
+        tempo_ms (int): Tempo em milissegundos.
+        mapa (str | None): Mapa consultado (só no backend 'sqlite'; None = ``MAPA_PADRAO``).
+    """
+    if BACKEND_RANKING == 'sqlite':
+        return banco_ranking().posicao(tempo_ms, _id_mapa(mapa))
+    return sum(1 for r in carregar_ranking() if r['tempo_ms'] < tempo_ms) + 1
+
+
+class RepositorioRanking:
+    """Ranking mantido em memória, recarregado só quando o arquivo muda.
+
+    A cada `obter()` o arquivo é verificado no máximo uma vez por
+    `intervalo` segundos, e apenas com `os.stat` (tamanho e data de
+    modificação); a leitura e o parse do JSON só acontecem se algum dos
+    dois mudou ou após `invalidar()`. No backend 'sqlite', a verificação
+    usa o PRAGMA data_version do banco, que muda quando outro processo
+    grava nele.
+
+    Attributes:
+        intervalo (float): Intervalo mínimo entre verificações do arquivo, em segundos.
+        dados (list[dict] | None): Ranking carregado (None até a primeira leitura).
+        leituras (int): Quantas vezes o arquivo foi lido e interpretado.
+    """
+
+    def __init__(self, intervalo=INTERVALO_VERIFICACAO):
+        """Cria o repositório vazio (o arquivo é lido no primeiro `obter`).
+
+        Args:
+            intervalo (float): Intervalo mínimo entre verificações do arquivo, em segundos.
+        """
+        self.intervalo = intervalo
+        self.dados = None
+        self.leituras = 0
+        self._assinatura = None
+        self._verificado_em = None
+
+    def _assinatura_arquivo(self):
+        """Retorna (mtime em ns, tamanho) do arquivo de ranking, ou None se ele não existir."""
+        if BACKEND_RANKING == 'sqlite':
+            return ('sqlite', banco_ranking().versao_dados())
+        try:
+            info = os.stat(ARQUIVO_RANKING)
+        except OSError:
+            return None
+        return (info.st_mtime_ns, info.st_size)
+
+    def invalidar(self):
+        """Descarta os dados em memória; o próximo `obter` lê o arquivo."""
+        self.dados = None
+        self._verificado_em = None
+
+    def obter(self):
+        """Retorna o ranking atual, lendo o arquivo apenas se ele mudou.
+
+        Returns:
+            list[dict]: Registros do ranking (compartilhados: não devem ser modificados).
+        """
+        agora = time.monotonic()
+        if self.dados is not None and agora - self._verificado_em < self.intervalo:
+            return self.dados
+
+        # a assinatura é tomada antes da leitura: uma escrita durante a leitura é vista na próxima verificação
+        assinatura = self._assinatura_arquivo()
+        self._verificado_em = agora
+        if self.dados is None or assinatura != self._assinatura:
+            self.dados = carregar_ranking()
+            self._assinatura = assinatura
+            self.leituras += 1
+        return self.dados
+
+
+# repositório único, compartilhado pelas telas
+REPOSITORIO_RANKING = RepositorioRanking()
@@ -0,0 +1,135 @@
+"""
+Armazenamento do ranking em SQLite para o jogo SWITCH BACK.
+
+Alternativa ao arquivo JSON do `ranking_manager` (escolhida com
+`BACKEND_RANKING = 'sqlite'`): em vez de uma lista com os 10 melhores tempos,
+reescrita por inteiro a cada corrida, todas as corridas ficam guardadas numa
+tabela indexada, com nome, tempo, data e mapa. Inserir uma corrida é um único
+INSERT, e as consultas usam os índices:
+
+    - melhores tempos (top N) de um mapa: índice (mapa, tempo_ms);
+    - melhor tempo de um jogador: índice (nome, mapa, tempo_ms);
+    - posição que um tempo ocuparia: contagem no índice (mapa, tempo_ms).
+
+Usa apenas o módulo `sqlite3` da biblioteca padrão.
+"""
+
+import sqlite3
+import time
+
+# Versão do esquema, guardada em PRAGMA user_version (0 = banco novo)
+VERSAO_ESQUEMA = 1
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS corridas (
+    id            INTEGER PRIMARY KEY,
+    nome          TEXT    NOT NULL,
+    tempo_ms      INTEGER NOT NULL,
+    registrado_em REAL,
+    mapa          TEXT    NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_corridas_mapa_tempo ON corridas (mapa, tempo_ms);
+CREATE INDEX IF NOT EXISTS idx_corridas_nome ON corridas (nome, mapa, tempo_ms);
+"""
+
+
+class RankingSQLite:
+    """Histórico completo de corridas num banco SQLite.
+
+    Attributes:
+        caminho (str): Caminho do arquivo do banco.
+        conexao (sqlite3.Connection): Conexão aberta com o banco.
+        novo (bool): True se o esquema foi criado ao abrir (banco ainda sem dados importados).
+    """
+
+    def __init__(self, caminho):
+        """Abre (ou cria) o banco e garante o esquema.
+
+        Args:
+            caminho (str): Caminho do arquivo do banco (':memory:' para um banco temporário).
+        """
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho)
+        versao = self.conexao.execute('PRAGMA user_version').fetchone()[0]
+        self.novo = versao == 0
+        if self.novo:
+            with self.conexao:
+                self.conexao.executescript(ESQUEMA)
+                self.conexao.execute(f'PRAGMA user_version = {VERSAO_ESQUEMA}')
+
+    def fechar(self):
+        """Fecha a conexão com o banco."""
+        self.conexao.close()
+
+    def adicionar(self, nome, tempo_ms, mapa='', registrado_em=None):
+        """Registra uma corrida.
+
+        Args:
+            nome (str): Nome do jogador.
+            tempo_ms (int): Tempo da corrida em milissegundos.
+            mapa (str): Identificador do mapa.
+            registrado_em (float | None): Data da corrida (segundos desde a época); None = agora.
+        """
+        if registrado_em is None:
+            registrado_em = time.time()
+        with self.conexao:
+            self.conexao.execute(
+                'INSERT INTO corridas (nome, tempo_ms, registrado_em, mapa) VALUES (?, ?, ?, ?)',
+                (nome, int(tempo_ms), registrado_em, mapa))
+
+    def importar(self, registros, mapa=''):
+        """Importa registros no formato do ranking JSON ({'nome', 'tempo_ms'}), sem data.
+
+        Args:
+            registros (list[dict]): Registros a importar.
+            mapa (str): Mapa atribuído aos registros importados.
+
+        Returns:
+            int: Quantidade de registros importados.
+        """
+        linhas = [(r.get('nome', 'N/A'), int(r['tempo_ms']), None, mapa)
+                  for r in registros if isinstance(r, dict) and 'tempo_ms' in r]
+        with self.conexao:
+            self.conexao.executemany(
+                'INSERT INTO corridas (nome, tempo_ms, registrado_em, mapa) VALUES (?, ?, ?, ?)', linhas)
+        return len(linhas)
+
+    def melhores(self, quantidade, mapa=''):
+        """Retorna os melhores tempos de um mapa (empates: a corrida mais antiga primeiro).
+
+        Args:
+            quantidade (int): Número máximo de registros.
+            mapa (str): Identificador do mapa.
+
+        Returns:
+            list[dict]: Registros com ``nome`` e ``tempo_ms``, do menor tempo para o maior.
+        """
+        cursor = self.conexao.execute(
+            'SELECT nome, tempo_ms FROM corridas WHERE mapa = ? ORDER BY tempo_ms, id LIMIT ?',
+            (mapa, quantidade))
+        return [{"nome": nome, "tempo_ms": tempo_ms} for nome, tempo_ms in cursor]
+
+    def melhor_tempo(self, nome, mapa=''):
+        """Retorna o melhor tempo de um jogador num mapa, ou None se ele não tiver corridas."""
+        return self.conexao.execute(
+            'SELECT MIN(tempo_ms) FROM corridas WHERE nome = ? AND mapa = ?', (nome, mapa)).fetchone()[0]
+
+    def posicao(self, tempo_ms, mapa=''):
+        """Retorna a posição (a partir de 1) que um tempo ocuparia no ranking completo do mapa.
+
+        A contagem percorre apenas o trecho do índice (mapa, tempo_ms) com
+        tempos menores, sem ler a tabela.
+        """
+        menores = self.conexao.execute(
+            'SELECT COUNT(*) FROM corridas WHERE mapa = ? AND tempo_ms < ?', (mapa, int(tempo_ms))).fetchone()[0]
+        return menores + 1
+
+    def total(self, mapa=None):
+        """Retorna o número de corridas guardadas (de um mapa, ou de todos se `mapa` for None)."""
+        if mapa is None:
+            return self.conexao.execute('SELECT COUNT(*) FROM corridas').fetchone()[0]
+        return self.conexao.execute('SELECT COUNT(*) FROM corridas WHERE mapa = ?', (mapa,)).fetchone()[0]
+
+    def versao_dados(self):
+        """Retorna o PRAGMA data_version, que muda quando outra conexão altera o banco."""
+        return self.conexao.execute('PRAGMA data_version').fetchone()[0]
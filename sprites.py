@@ -1,4 +1,5 @@
 from constantes import *
+from componente_animacao import ComponenteAnimacao
 
 
 """
@@ -17,18 +18,25 @@ class Sprite(pygame.sprite.Sprite):
     Gerencia a escala da imagem com `SCALE_FACTOR` e a criação do rect.
     Aceita um número variável de grupos (`*groups`) que serão adicionados via
     `super().__init__(*groups)` (comportamento padrão do pygame).
+
+    O atributo de classe `dinamico` indica se a sprite é desenhada individualmente
+    (porque se move ou pode sumir do mapa) em vez de fazer parte do cenário estático.
     """
 
-    def __init__(self, pos, surf, *groups):
+    dinamico = False
+
+    def __init__(self, pos, surf, *groups, escalar=True):
         """Inicializa a sprite base.
 
         Args:
             pos (tuple): Posição (x, y) do canto superior esquerdo onde a sprite será colocada.
             surf (pygame.Surface): Surface original que será escalada.
             *groups: Grupos do pygame.sprite.Group aos quais esta sprite será adicionada.
+            escalar (bool): Se False, `surf` já está no tamanho final (ex.: vinda do
+                            `CacheTiles`) e é usada diretamente, sem cópia.
         """
         super().__init__(*groups)
-        self.image = pygame.transform.scale_by(surf, SCALE_FACTOR)
+        self.image = pygame.transform.scale_by(surf, SCALE_FACTOR) if escalar else surf
         self.rect = self.image.get_rect(topleft = pos)
 
     def draw(self, surface, offset=(0,0)):
@@ -38,10 +46,44 @@ class Sprite(pygame.sprite.Sprite):
             surface (pygame.Surface): Superfície onde desenhar a sprite.
             offset (tuple|pygame.math.Vector2): Deslocamento da câmera (x, y).
         """
-        # Garante que offset seja Vector2 para subtração
-        off = pygame.math.Vector2(int(offset[0]), int(offset[1])) if not isinstance(offset, pygame.math.Vector2) else offset
-        pos = pygame.math.Vector2(self.rect.topleft) - off
-        surface.blit(self.image, (int(pos.x), int(pos.y)))
+        # aritmética inteira direta, sem criar vetores a cada blit (offsets Vector2 não são
+        # arredondados antes da subtração, como na versão com vetores)
+        if isinstance(offset, pygame.math.Vector2):
+            surface.blit(self.image, (int(self.rect.x - offset.x), int(self.rect.y - offset.y)))
+        else:
+            surface.blit(self.image, (self.rect.x - int(offset[0]), self.rect.y - int(offset[1])))
+
+    def capturar_estado(self):
+        """Retorna uma cópia dos atributos da sprite, para restaurá-la depois.
+
+        Rects e vetores são copiados; as demais referências (imagens, assets,
+        grupos de colisão) são compartilhadas. A participação em grupos não
+        faz parte do estado.
+
+        Returns:
+            dict: Atributos da sprite.
+        """
+        return {nome: _copiar_valor(valor) for nome, valor in vars(self).items() if nome != '_Sprite__g'}
+
+    def restaurar_estado(self, estado):
+        """Restaura os atributos capturados por `capturar_estado`, no próprio objeto.
+
+        Atributos criados depois da captura (ex.: `prev_rect`) são removidos.
+
+        Args:
+            estado (dict): Estado retornado por `capturar_estado`.
+        """
+        for nome in [nome for nome in vars(self) if nome not in estado and nome != '_Sprite__g']:
+            delattr(self, nome)
+        for nome, valor in estado.items():
+            setattr(self, nome, _copiar_valor(valor))
+
+
+def _copiar_valor(valor):
+    """Copia rects, vetores e o estado da animação (alterados a cada frame); o resto é compartilhado."""
+    if isinstance(valor, (pygame.Rect, pygame.math.Vector2, ComponenteAnimacao)):
+        return valor.copy()
+    return valor
 
 
 class Item(Sprite):
@@ -49,7 +91,10 @@ class Item(Sprite):
 
     Guarda o tipo (ex.: 'shield') e reutiliza a lógica de escala/rect da classe Sprite.
     """
-    def __init__(self, pos, surf, tipo, *groups):
+
+    dinamico = True
+
+    def __init__(self, pos, surf, tipo, *groups, escalar=True):
         """Inicializa um item.
 
         Args:
@@ -57,9 +102,10 @@ class Item(Sprite):
             surf (pygame.Surface): Imagem do tile/item.
             tipo (str): Identificador do tipo de item (ex.: 'shield').
             *groups: Grupos aos quais o item será adicionado.
+            escalar (bool): Se False, `surf` já está no tamanho final.
         """
         # surf deve ser uma Surface (normalmente obtida via pytmx)
-        super().__init__(pos, surf, *groups)
+        super().__init__(pos, surf, *groups, escalar=escalar)
         self.tipo = tipo
 
 class Jogador(Sprite):
@@ -73,7 +119,10 @@ class Jogador(Sprite):
     - animação por frames dependendo do estado;
     - armazenamento de estado para respawn.
     """
-    def __init__(self, window, assets, pos, groups, collision_sprites, mundo_w, mundo_h, grupo_escadas):
+
+    dinamico = True
+
+    def __init__(self, window, assets, pos, groups, collision_sprites, mundo_w, mundo_h, grupo_escadas, grade_colisao=None):
         """Inicializa o jogador.
 
         Args:
@@ -85,9 +134,11 @@ class Jogador(Sprite):
             mundo_w (int): Largura do mundo em pixels.
             mundo_h (int): Altura do mundo em pixels.
             grupo_escadas (Group): Grupo contendo sprites de escada.
+            grade_colisao (GradeColisao, optional): Grade com os retângulos sólidos mesclados do nível.
+                Se None, o jogador testa todos os `collision_sprites`.
         """
-        surf = pygame.Surface((10,10)) # O surf inicial não importa muito, pois a imagem é substituída
-        super().__init__(pos, surf, groups)
+        # começa com o primeiro frame (compartilhado, sem cópia); a imagem é trocada pela animação
+        super().__init__(pos, assets['animacoes_jogador']['right'][0], groups, escalar=False)
 
         self.window = window
         self.assets = assets
@@ -97,22 +148,15 @@ class Jogador(Sprite):
 
         self.vidas = assets['vidas_max']
 
-        # receber dicionario de animacoes
-        self.animacoes = assets['animacoes_jogador']
-        
-        self.animacoes_invertidas = {}
-        for key, frames in self.animacoes.items():
-            # cria lista de frames virados de cabeça para baixo (flip vertical)
-            self.animacoes_invertidas[key] = [pygame.transform.flip(f, False, True) for f in frames]
+        # animação: frames compartilhados pelo banco de animações (os invertidos são
+        # os mesmos frames virados de cabeça para baixo), 0.1 s por quadro
+        self.animacao = ComponenteAnimacao(assets['animacoes_jogador'], assets['animacoes_jogador_invertidas'], 0.1)
 
         self.direcao_atual = 'right' # inicial
         self.movendo = False
-        self.frame_index = 0
-        self.animacao_timer = 0.0
-        self.VELOCIDADE_ANIMACAO = 0.1 # troca de quadros
 
         # usa o frame inicial normal (gravidade inicial é definida abaixo)
-        self.image = self.animacoes[self.direcao_atual][self.frame_index]
+        self.image = self.animacao.quadro_inicial(self.direcao_atual)
 
         # rect do jogador
         self.rect = self.image.get_rect(center = pos)
@@ -120,6 +164,7 @@ class Jogador(Sprite):
         # movimento & colisao
         self.direcao = pygame.Vector2()
         self.collision_sprites = collision_sprites
+        self.grade_colisao = grade_colisao
         self.velocidade = 400
         
         # NOVO: Gravidade e velocidade de pulo são atributos do jogador
@@ -156,8 +201,7 @@ class Jogador(Sprite):
         self.subindo_escada = False
         self.alvo_escada_x = None
         self.movendo = False
-        self.frame_index = 0
-        self.animacao_timer = 0.0
+        self.animacao.reiniciar()
         self.no_chao = False # Garante que ao resetar, não está no chão
         # A gravidade será redefinida pela TelaJogo no método alternar_gravidade
     
@@ -206,6 +250,19 @@ class Jogador(Sprite):
             self.alvo_escada_x = None
             self.direcao.y = self.velocidade_y
     
+    def solidos_proximos(self):
+        """Retorna os retângulos sólidos que podem colidir com o jogador neste frame.
+
+        Com uma `grade_colisao`, consulta apenas as células cobertas pelo rect
+        varrido no frame (posição anterior unida à atual), com uma tile de folga
+        para os ajustes feitos pela própria resolução de colisão, e recebe os
+        retângulos já mesclados da camada `Principal`.
+        """
+        if self.grade_colisao is None:
+            return [sprite.rect for sprite in self.collision_sprites]
+        varrido = self.rect.union(getattr(self, 'prev_rect', self.rect))
+        return self.grade_colisao.consultar(varrido.inflate(TILE_SIZE * 2, TILE_SIZE * 2))
+
     def verificar_tocando_escada(self):
         """Retorna a escada (sprite) com a qual o jogador está em contato, se houver."""
         if not self.grupo_escadas:
@@ -255,13 +312,13 @@ class Jogador(Sprite):
                 self.rect.y -= int(self.velocidade_subida * dt)
                 self.movendo = True
                 # verificação de colisão com o teto ao subir:
-                for sprite in self.collision_sprites:
-                    if sprite.rect.colliderect(self.rect):
+                for solido in self.solidos_proximos():
+                    if solido.colliderect(self.rect):
                         # Se a gravidade é normal, o "teto" é top. Se invertida, o "chão" é top.
                         if self.gravidade_valor > 0: # Gravidade normal
-                            self.rect.top = sprite.rect.bottom
+                            self.rect.top = solido.bottom
                         else: # Gravidade negativa
-                            self.rect.bottom = sprite.rect.top 
+                            self.rect.bottom = solido.top 
                         self.subindo_escada = False
                         self.alvo_escada_x = None
                         
@@ -273,13 +330,13 @@ class Jogador(Sprite):
             
             # verificação de colisão com o chão (apenas ao descer a escada)
             if self.descer_tecla: 
-                for sprite in self.collision_sprites:
-                    if sprite.rect.colliderect(self.rect):
+                for solido in self.solidos_proximos():
+                    if solido.colliderect(self.rect):
                         # Se a gravidade é normal, o "chão" é bottom. Se invertida, o "teto" é bottom.
                         if self.gravidade_valor > 0: # Gravidade normal
-                            self.rect.bottom = sprite.rect.top
+                            self.rect.bottom = solido.top
                         else: # Gravidade negativa
-                            self.rect.top = sprite.rect.bottom
+                            self.rect.top = solido.bottom
 
                         self.direcao.y = 0
                         self.no_chao = True
@@ -300,13 +357,13 @@ class Jogador(Sprite):
         Args:
             direcao (str): 'horizontal' ou 'vertical'.
         """
-        for sprite in self.collision_sprites:
-            if sprite.rect.colliderect(self.rect):
+        for solido in self.solidos_proximos():
+            if solido.colliderect(self.rect):
                 if direcao == 'horizontal':
                     if self.direcao.x > 0:
-                        self.rect.right = sprite.rect.left
+                        self.rect.right = solido.left
                     if self.direcao.x < 0:
-                        self.rect.left = sprite.rect.right
+                        self.rect.left = solido.right
                 if direcao == 'vertical':
                     if self.subindo_escada: # Já tratada na lógica da escada
                         continue
@@ -317,9 +374,9 @@ class Jogador(Sprite):
 
                     if is_falling:
                         if self.gravidade_valor > 0: 
-                            self.rect.bottom = sprite.rect.top
+                            self.rect.bottom = solido.top
                         else: 
-                            self.rect.top = sprite.rect.bottom
+                            self.rect.top = solido.bottom
                             
                         self.direcao.y = 0
                         self.no_chao = True
@@ -331,9 +388,9 @@ class Jogador(Sprite):
                     if is_jumping:
                         # batendo no teto/obstáculo:
                         if self.gravidade_valor > 0: # gravidade normal: bateu no teto
-                            self.rect.top = sprite.rect.bottom
+                            self.rect.top = solido.bottom
                         else: # gravidade negativa: bateu no  "teto" (chao)
-                            self.rect.bottom = sprite.rect.top 
+                            self.rect.bottom = solido.top 
 
                         self.direcao.y = 0
 
@@ -376,41 +433,22 @@ class Jogador(Sprite):
         self.move(dt)
         self.limitar_mundo()
 
-        # animacao
-        if self.movendo:
-            self.animacao_timer += dt
-            if self.animacao_timer >= self.VELOCIDADE_ANIMACAO:
-                self.animacao_timer = 0.0
-                # escolhe a lista de frames (normal ou invertida) dependendo do sinal da gravidade
-                if self.gravidade_valor < 0:
-                    num_frames = len(self.animacoes_invertidas[self.direcao_atual])
-                else:
-                    num_frames = len(self.animacoes[self.direcao_atual])
-                self.frame_index = (self.frame_index + 1) % num_frames
-        else:
-            self.frame_index = 0
-            self.animacao_timer = 0.0
-        if self.gravidade_valor < 0:
-            frames_list = self.animacoes_invertidas[self.direcao_atual]
-        else:
-            frames_list = self.animacoes[self.direcao_atual]
-
-        # garante que frame_index está dentro do limite da lista escolhida
-        if self.frame_index >= len(frames_list):
-            self.frame_index = 0
-
-        # preserva o centro do rect ao trocar a imagem (evita "pulos")
-        old_center = self.rect.center
-        self.image = frames_list[self.frame_index]
-        self.rect = self.image.get_rect(center=old_center)
+        # animacao: frames normais ou invertidos dependendo do sinal da gravidade; parada no
+        # primeiro quadro quando o jogador não se move
+        self.animacao.atualizar(self, dt, self.direcao_atual, self.gravidade_valor < 0, self.movendo)
 
 class Monstro(Sprite):
     """Entidade inimiga com comportamento de patrulha e perseguição.
 
-    Considera água (não atravessa), aplica gravidade e tem pequenas rotinas
-    de IA (patrulha/perseguição).
+    Pode considerar água (não atravessa), aplica gravidade e tem pequenas
+    rotinas de IA (patrulha/perseguição). Com um `IndiceNivel`, as sondas de
+    água e terreno consultam o índice compartilhado do nível em vez de
+    percorrer todas as tiles.
     """
-    def __init__(self, pos, groups, assets, collision_sprites, limites_patrulha, jogador_ref, grupo_monstros, water_sprites=None):
+
+    dinamico = True
+
+    def __init__(self, pos, groups, assets, collision_sprites, limites_patrulha, jogador_ref, grupo_monstros, water_sprites=None, indice_nivel=None, evitar_agua=False):
         """Inicializa o monstro.
 
         Args:
@@ -422,30 +460,31 @@ class Monstro(Sprite):
             jogador_ref (Jogador): Referência ao objeto jogador para perseguição.
             grupo_monstros (Group): Grupo de monstros.
             water_sprites (Group | list | None): Sprites/rects representando água.
+            indice_nivel (IndiceNivel, optional): Índice de água e terreno compartilhado pelo nível.
+                Quando fornecido, substitui `water_sprites` e `collision_sprites` nas consultas.
+            evitar_agua (bool): Se True, o monstro desvia da água do `indice_nivel`. A água é
+                evitada também sempre que `water_sprites` for passado; sem nenhum dos dois, o
+                monstro ignora a água.
         """
-        surf = pygame.Surface((32, 32)) 
-        super().__init__(pos, surf, groups)
+        # começa com o primeiro frame (compartilhado, sem cópia); a imagem é trocada pela animação
+        super().__init__(pos, assets['animacoes_monstro']['right'][0], groups, escalar=False)
         
         self.assets = assets
         self.collision_sprites = collision_sprites
+        self.indice_nivel = indice_nivel
         self.jogador_ref = jogador_ref
         self.grupo_monstros = grupo_monstros
 
         # water_sprites pode ser None, um pygame.sprite.Group, ou uma lista de sprites/rects
         self.water_sprites = water_sprites
+        self.evitar_agua = bool(water_sprites) or (evitar_agua and indice_nivel is not None)
 
-        # animações (pré-invertidas como você já fez antes, se quiser)
-        self.animacoes = assets['animacoes_monstro']
-        self.animacoes_invertidas = {}
-        for key, frames in self.animacoes.items():
-            self.animacoes_invertidas[key] = [pygame.transform.flip(f, False, True) for f in frames]
+        # animações normais e invertidas, compartilhadas por todos os monstros (banco de animações)
+        self.animacao = ComponenteAnimacao(assets['animacoes_monstro'], assets['animacoes_monstro_invertidas'], 0.15)
 
         self.direcao_atual = 'right' 
         self.movendo = True
-        self.frame_index = 0
-        self.animacao_timer = 0.0
-        self.VELOCIDADE_ANIMACAO = 0.15
-        self.image = self.animacoes[self.direcao_atual][self.frame_index]
+        self.image = self.animacao.quadro_inicial(self.direcao_atual)
         self.rect = self.image.get_rect(topleft = pos)
 
         self.direcao = pygame.math.Vector2(1, 0)
@@ -459,6 +498,11 @@ class Monstro(Sprite):
         self.raio_de_visao = 400
         self.modo_ia = 'patrulha'
 
+        # nível de simulação (definido pela TelaJogo conforme a distância da câmera)
+        self.estado_lod = 'ativo'
+        self.dt_acumulado = 0.0
+        self.frames_lod = 0
+
     def set_gravidade(self, nova_gravidade):
         """Define a gravidade do monstro."""
         self.gravidade_valor = nova_gravidade
@@ -483,6 +527,10 @@ class Monstro(Sprite):
 
         Aceita self.water_sprites sendo None, Group, list de sprites, ou list de rects.
         """
+        if not self.evitar_agua:
+            return False
+        if self.indice_nivel is not None:
+            return self.indice_nivel.na_agua(self.rect)
         if not self.water_sprites:
             return False
         # group de sprites
@@ -503,7 +551,7 @@ class Monstro(Sprite):
 
         Usa uma pequena caixa (probe) na borda inferior na direção do movimento.
         """
-        if not self.water_sprites:
+        if not self.evitar_agua:
             return False
         # determina onde fica 'pé' dependendo da gravidade
         if self.gravidade_valor > 0:
@@ -525,7 +573,9 @@ class Monstro(Sprite):
             else:
                 return False
 
-        # checa colisão do probe com water_sprites
+        # checa colisão do probe com a água
+        if self.indice_nivel is not None:
+            return self.indice_nivel.na_agua(probe_rect)
         if isinstance(self.water_sprites, pygame.sprite.Group):
             for w in self.water_sprites:
                 if probe_rect.colliderect(w.rect):
@@ -537,16 +587,27 @@ class Monstro(Sprite):
                     return True
         return False
 
+    def solidos_proximos(self):
+        """Retorna os retângulos sólidos que podem colidir com o monstro neste frame.
+
+        Mesmo critério de `Jogador.solidos_proximos`: rect varrido desde o início
+        do frame, com uma tile de folga, consultado no `indice_nivel`.
+        """
+        if self.indice_nivel is None:
+            return [sprite.rect for sprite in self.collision_sprites]
+        varrido = self.rect.union(getattr(self, 'prev_rect', self.rect))
+        return self.indice_nivel.solidos_proximos(varrido.inflate(TILE_SIZE * 2, TILE_SIZE * 2))
+
     def collision(self, direcao):
         """Trata colisões do monstro com o ambiente nas direções horizontal/vertical."""
-        for sprite in self.collision_sprites:
-            if sprite.rect.colliderect(self.rect):
+        for solido in self.solidos_proximos():
+            if solido.colliderect(self.rect):
                 if direcao == 'horizontal':
                     if self.direcao.x > 0:
-                        self.rect.right = sprite.rect.left
+                        self.rect.right = solido.left
                         self.direcao.x *= -1
                     if self.direcao.x < 0:
-                        self.rect.left = sprite.rect.right
+                        self.rect.left = solido.right
                         self.direcao.x *= -1
                         
                 if direcao == 'vertical':
@@ -555,9 +616,9 @@ class Monstro(Sprite):
 
                     if is_falling:
                         if self.gravidade_valor > 0:
-                            self.rect.bottom = sprite.rect.top
+                            self.rect.bottom = solido.top
                         else:
-                            self.rect.top = sprite.rect.bottom
+                            self.rect.top = solido.bottom
                         self.direcao.y = 0
                         self.no_chao = True
                     else:
@@ -565,9 +626,9 @@ class Monstro(Sprite):
                                      (self.gravidade_valor < 0 and self.direcao.y > 0)
                         if is_jumping:
                             if self.gravidade_valor > 0:
-                                self.rect.top = sprite.rect.bottom
+                                self.rect.top = solido.bottom
                             else:
-                                self.rect.bottom = sprite.rect.top
+                                self.rect.bottom = solido.top
                             self.direcao.y = 0
 
     def ia_patrulha(self, dt):
@@ -600,12 +661,62 @@ class Monstro(Sprite):
             self.modo_ia = 'patrulha'
             self.velocidade = self.velocidade_patrulha
 
+    def definir_lod(self, estado):
+        """Define o nível de simulação do monstro.
+
+        Estados:
+            - 'ativo': atualização completa a cada frame (IA, física e animação);
+            - 'reduzido': IA e física a cada `INTERVALO_LOD_MONSTRO` frames, sem animação;
+            - 'dormindo': nenhuma atualização.
+
+        Ao mudar de estado o acumulador de tempo é zerado, então o monstro sempre
+        acorda da mesma forma para a mesma sequência de posições da câmera.
+
+        Args:
+            estado (str): 'ativo', 'reduzido' ou 'dormindo'.
+        """
+        if estado != self.estado_lod:
+            self.estado_lod = estado
+            self.dt_acumulado = 0.0
+            self.frames_lod = 0
+
     def update(self, dt):
-        """Atualiza o comportamento e animação do monstro.
+        """Atualiza o monstro de acordo com seu nível de simulação (`estado_lod`).
 
         Args:
             dt (float): Delta time em segundos.
         """
+        if self.estado_lod == 'dormindo':
+            return
+
+        if self.estado_lod == 'reduzido':
+            self.dt_acumulado += dt
+            self.frames_lod += 1
+            if self.frames_lod < INTERVALO_LOD_MONSTRO:
+                return
+            dt_passo = self.dt_acumulado
+            passos = self.frames_lod
+            self.dt_acumulado = 0.0
+            self.frames_lod = 0
+            self.simular(dt_passo, passos)
+            return
+
+        self.simular(dt)
+        self.animar(dt)
+
+    def simular(self, dt, passos=1):
+        """Executa IA, movimento horizontal, sondas de água e gravidade.
+
+        O movimento horizontal é proporcional a `dt`, então um único passo
+        cobre o intervalo todo. A gravidade move o monstro uma vez por frame
+        (`direcao.y` é um deslocamento por frame), por isso é integrada
+        `passos` vezes, cada uma com `dt / passos`.
+
+        Args:
+            dt (float): Delta time em segundos (no modo reduzido, o tempo acumulado do intervalo).
+            passos (int): Quantos frames o intervalo `dt` representa.
+        """
+        self.prev_rect = self.rect.copy()
         self.verifica_modo_ia()
 
         if self.modo_ia == 'patrulha':
@@ -628,27 +739,16 @@ class Monstro(Sprite):
                 self.rect = old_rect
                 self.direcao.x *= -1
 
-        # aplica gravidade/movimento vertical
-        self.aplicar_gravidade(dt)
-        
-        # animacao (mantendo inversão como antes)
-        self.animacao_timer += dt
-        if self.animacao_timer >= self.VELOCIDADE_ANIMACAO:
-            self.animacao_timer = 0.0
-            if self.gravidade_valor < 0:
-                num_frames = len(self.animacoes_invertidas[self.direcao_atual])
-            else:
-                num_frames = len(self.animacoes[self.direcao_atual])
-            self.frame_index = (self.frame_index + 1) % num_frames
+        # aplica gravidade/movimento vertical, um passo por frame do intervalo
+        dt_frame = dt / passos
+        for _ in range(passos):
+            self.aplicar_gravidade(dt_frame)
 
-        if self.gravidade_valor < 0:
-            frames_list = self.animacoes_invertidas[self.direcao_atual]
-        else:
-            frames_list = self.animacoes[self.direcao_atual]
-
-        if self.frame_index >= len(frames_list):
-            self.frame_index = 0
+    def animar(self, dt):
+        """Avança a animação do monstro, escolhendo os frames pela gravidade atual.
 
-        old_center = self.rect.center
-        self.image = frames_list[self.frame_index]
-        self.rect = self.image.get_rect(center=old_center)
+        Args:
+            dt (float): Delta time em segundos.
+        """
+        # animacao (mantendo inversão como antes)
+        self.animacao.atualizar(self, dt, self.direcao_atual, self.gravidade_valor < 0)
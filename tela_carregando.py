@@ -0,0 +1,69 @@
+"""
+Tela de carregamento do jogo SWITCH BACK.
+
+Exibida quando o jogador entra no jogo antes de o nível terminar de carregar.
+A cada frame ela avança a montagem do nível por um tempo limitado e desenha o
+progresso, mantendo a janela respondendo a eventos.
+"""
+
+import pygame
+from constantes import *
+from cache_texto import renderizar_texto
+
+
+class TelaCarregando:
+    """Tela com a barra de progresso do carregamento do nível.
+
+    Attributes:
+        tela_jogo (TelaJogo): Tela cujo nível está sendo carregado.
+        orcamento_ms (float): Tempo máximo de carregamento por frame, em milissegundos.
+    """
+
+    def __init__(self, window, assets, tela_jogo, orcamento_ms=8):
+        """Inicializa a tela de carregamento.
+
+        Args:
+            window (pygame.Surface): Superfície principal onde a tela é desenhada.
+            assets (dict): Dicionário de recursos (usa a fonte 'fonte').
+            tela_jogo (TelaJogo): Tela de jogo que está carregando o nível.
+            orcamento_ms (float): Tempo de carregamento gasto em cada frame.
+        """
+        self.window = window
+        self.assets = assets
+        self.tela_jogo = tela_jogo
+        self.orcamento_ms = orcamento_ms
+
+    def handle_event(self, event):
+        """Permite sair do jogo durante o carregamento (ESC / Q)."""
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_q):
+            return 'SAIR'
+        return None
+
+    def update(self, dt):
+        """Avança o carregamento do nível.
+
+        Args:
+            dt (float): Delta time em segundos (não utilizado aqui).
+
+        Returns:
+            str: 'JOGO' quando o nível estiver pronto, caso contrário 'CARREGANDO'.
+        """
+        if self.tela_jogo.avancar_carregamento(self.orcamento_ms):
+            return 'JOGO'
+        return 'CARREGANDO'
+
+    def draw(self):
+        """Desenha o texto e a barra de progresso no centro da tela."""
+        self.window.fill(PRETO)
+
+        largura, altura = self.window.get_size()
+        texto = renderizar_texto(self.assets['fonte'], "CARREGANDO...", True, (255, 255, 255))
+        self.window.blit(texto, (largura // 2 - texto.get_width() // 2, altura // 2 - 60))
+
+        barra = pygame.Rect(0, 0, largura // 2, 24)
+        barra.center = (largura // 2, altura // 2 + 10)
+        preenchida = barra.copy()
+        preenchida.width = int(barra.width * self.tela_jogo.progresso)
+
+        pygame.draw.rect(self.window, AZUL, preenchida)
+        pygame.draw.rect(self.window, (255, 255, 255), barra, 2)
@@ -6,6 +6,8 @@ para sair, reiniciar ou acessar o ranking, e desenha a tela com instruções.
 """
 
 import pygame
+from cache_texto import renderizar_texto
+from composicao_tela import ComposicaoTela
 
 
 class TelaGameOver:
@@ -26,6 +28,12 @@ class TelaGameOver:
         """
         self.window = window
         self.assets = assets
+        # a tela é toda estática: composta uma vez, desenhada só quando invalidada
+        self.composicao = ComposicaoTela(window, self._compor)
+
+    def invalidar(self):
+        """Descarta a tela composta (chamado pelo `Jogo` na troca de tela)."""
+        self.composicao.invalidar()
 
     def handle_event(self, event):
         """Processa eventos de teclado relevantes para a tela de Game Over.
@@ -64,20 +72,26 @@ class TelaGameOver:
         """
         return 'GAMEOVER'
 
-    def draw(self):
-        """Desenha a tela de Game Over na janela.
-
-        Exibe o fundo, a imagem de game over e instruções centrais.
-        """
-        self.window.fill((0, 100, 100))
-        self.window.blit(self.assets['game_over'], (0, 0))
+    def _compor(self, superficie):
+        """Compõe a tela: fundo, imagem de game over e instruções centrais."""
+        superficie.fill((0, 100, 100))
+        superficie.blit(self.assets['game_over'], (0, 0))
 
-        txt = self.assets['fonte2'].render("PRESSIONE SPACE PARA RECOMEÇAR", True, (255, 255, 255))
-        pos_x_txt = self.window.get_width() // 2 - txt.get_width() // 2
+        txt = renderizar_texto(self.assets['fonte2'], "PRESSIONE SPACE PARA RECOMEÇAR", True, (255, 255, 255))
+        pos_x_txt = superficie.get_width() // 2 - txt.get_width() // 2
 
-        rank = self.assets['fonte2'].render("PRESSIONE R PARA VER RANKING", True, (255, 255, 255))
-        pos_x_rank = self.window.get_width() // 2 - rank.get_width() // 2
+        rank = renderizar_texto(self.assets['fonte2'], "PRESSIONE R PARA VER RANKING", True, (255, 255, 255))
+        pos_x_rank = superficie.get_width() // 2 - rank.get_width() // 2
 
         # posições fixas próximas à base da tela (preservando seu layout original)
-        self.window.blit(txt, (pos_x_txt, 750))
-        self.window.blit(rank, (pos_x_rank, 800))
+        superficie.blit(txt, (pos_x_txt, 750))
+        superficie.blit(rank, (pos_x_rank, 800))
+
+    def draw(self):
+        """Desenha a tela de Game Over na janela.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a tela inteira só após uma invalidação).
+        """
+        self.composicao.comecar()
+        return self.composicao.concluir()
@@ -6,6 +6,8 @@ fade in/out. Também trata eventos de teclado para iniciar o jogo ou sair.
 """
 
 import pygame 
+from cache_texto import renderizar_texto
+from composicao_tela import ComposicaoTela
 
 
 class TelaInicio:
@@ -27,7 +29,15 @@ class TelaInicio:
         self.alpha = 0                 # Valor atual de transparência do texto
         self.fade_speed = 600          # Velocidade do fade (quanto maior, mais rápido)
         self.fade_direction = 1        # 1 para aumentar alpha, -1 para diminuir
-        
+
+        # fundo composto uma vez; a cada frame só a área do texto piscante é redesenhada
+        self.composicao = ComposicaoTela(window, self._compor)
+        self.alpha_desenhado = None
+
+    def invalidar(self):
+        """Descarta o fundo composto (chamado pelo `Jogo` na troca de tela)."""
+        self.composicao.invalidar()
+
     def handle_event(self, event):
         """Processa eventos de teclado para esta tela.
 
@@ -69,13 +79,27 @@ class TelaInicio:
             self.fade_direction = 1 
         return 'INICIO'
     
+    def _compor(self, superficie):
+        """Compõe a parte estática da tela (cor de fundo e imagem)."""
+        superficie.fill((0, 100, 100))
+        superficie.blit(self.assets['fundo_inicial'], (0, 0))
+
     def draw(self):
-        """Desenha o fundo e o texto piscante na tela."""
-        self.window.fill((0, 100, 100))
-        self.window.blit(self.assets['fundo_inicial'], (0, 0))
-
-        # Texto com efeito de fade
-        img_tempo = self.assets['fonte2'].render("PRESSIONE SPACE PARA JOGAR", True, (255, 255, 255))
-        img_tempo.set_alpha(int(self.alpha))
-        pos_x = self.window.get_width() // 2 - img_tempo.get_width() // 2
-        self.window.blit(img_tempo, (pos_x, 720))
+        """Desenha o fundo e o texto piscante na tela.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a do texto, ou a tela inteira após uma invalidação).
+        """
+        completo = self.composicao.comecar()
+        alpha = int(self.alpha)
+        if completo or alpha != self.alpha_desenhado:
+            # Texto com efeito de fade
+            # superfície compartilhada pela cache: o alpha é definido a cada frame, antes do blit
+            img_tempo = renderizar_texto(self.assets['fonte2'], "PRESSIONE SPACE PARA JOGAR", True, (255, 255, 255))
+            img_tempo.set_alpha(alpha)
+            pos_x = self.window.get_width() // 2 - img_tempo.get_width() // 2
+            # apaga o texto do frame anterior antes de desenhá-lo com o novo alpha
+            self.composicao.restaurar(img_tempo.get_rect(topleft=(pos_x, 720)))
+            self.composicao.desenhar(img_tempo, (pos_x, 720))
+            self.alpha_desenhado = alpha
+        return self.composicao.concluir()
@@ -6,6 +6,7 @@ e informações iniciais sobre o funcionamento do jogo.
 """
 
 import pygame
+from composicao_tela import ComposicaoTela
 
 
 class TelaInstrucoes1:
@@ -24,6 +25,12 @@ class TelaInstrucoes1:
         """
         self.window = window
         self.assets = assets    
+        # a tela é toda estática: composta uma vez, desenhada só quando invalidada
+        self.composicao = ComposicaoTela(window, self._compor)
+
+    def invalidar(self):
+        """Descarta a tela composta (chamado pelo `Jogo` na troca de tela)."""
+        self.composicao.invalidar()
 
     def handle_event(self, event):
         """Processa eventos de teclado para navegação entre telas.
@@ -60,7 +67,16 @@ class TelaInstrucoes1:
         """
         return 'INSTRUCOES1'
 
+    def _compor(self, superficie):
+        """Compõe a tela de instruções 1."""
+        superficie.fill((0, 100, 100))
+        superficie.blit(self.assets['tela_instrucoes1'], (0, 0))
+
     def draw(self):
-        """Desenha a tela de instruções 1 na janela."""
-        self.window.fill((0, 100, 100))
-        self.window.blit(self.assets['tela_instrucoes1'], (0, 0))
+        """Desenha a tela de instruções 1 na janela.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a tela inteira só após uma invalidação).
+        """
+        self.composicao.comecar()
+        return self.composicao.concluir()
@@ -8,12 +8,18 @@ Responsabilidades:
 - Atualizar e desenhar todos os componentes do jogo, incluindo HUD (vidas, timer).
 """
 
+import threading
+import time
 import pygame
-from pytmx.util_pygame import load_pygame
 from os.path import join
 from sprites import *
 from cameras import *
+from colisao import IndiceNivel
+from mundo_streaming import MundoStreaming
+from compilador_nivel import CAMADAS_TILES, NivelCompilado, carregar_nivel, ler_artefato
 from constantes import *
+from cache_texto import RotuloTexto
+from painel_inventario import PainelInventario
 from utils import resource_path
 
 
@@ -36,16 +42,38 @@ class TelaJogo:
         self.window = window
         self.assets = assets
 
+        # HUD: os rótulos só são renderizados de novo quando o texto exibido muda
+        self.rotulo_vidas = RotuloTexto(self.assets['fonte'], (255, 0, 0))
+        self.rotulo_tempo = RotuloTexto(self.assets['fonte'], (255, 255, 255))
+        # overlay do inventário, montado só quando o inventário muda
+        self.painel_inventario = PainelInventario(self.assets['fonte2'])
+
         # Grupos de sprites
         self.collision_sprites = pygame.sprite.Group()
         self.grupo_escadas = pygame.sprite.Group()
         self.grupo_monstros = pygame.sprite.Group()
         self.grupo_items = pygame.sprite.Group()
 
+        # Entidades que precisam de update (jogador, monstros); o CameraGroup só desenha
+        self.grupo_entidades = pygame.sprite.Group()
+
+        # Instrumentação: chamadas de update por frame com o grupo dedicado e
+        # quantas seriam feitas atualizando o grupo inteiro da câmera
+        self.chamadas_update = 0
+        self.chamadas_update_grupo_camera = 0
+
         self.jogador = None
         self.spawn_point = None
+        self.indice_nivel = None
         self.grupo_agua = pygame.sprite.Group()
 
+        # Modo streaming (mapas grandes): só os chunks próximos ficam instanciados
+        self.nivel = None
+        self.mundo = None
+
+        # Estado inicial do nível, capturado após o carregamento (usado pelo restart)
+        self.estado_inicial = None
+
         # Ciclo de gravidade
         self.gravidade_invertida = False
         self.tempo_inicio_estado = None
@@ -64,12 +92,17 @@ class TelaJogo:
         self.total_shields = 0
         self.shields_coletados = 0
 
-        # Carrega o nível
-        self.setup()
-
-        # Se jogador foi criado, define gravidade inicial
-        if self.jogador:
-            self.jogador.set_gravidade(gravidade_normal, velocidade_y)
+        # Carregamento do nível: o artefato é lido numa thread e as sprites são
+        # montadas em etapas pelo loop principal (ver avancar_carregamento)
+        self.mapa_relativo = join('data', 'mapa_teste.tmx')
+        self.pronto = False
+        self.progresso = 0.0
+        self._thread_leitura = None
+        self._leitura = {}
+        self._etapas_setup = None
+        self._total_etapas = 1
+        self._etapas_feitas = 0
+        self.iniciar_carregamento()
 
     def iniciar_tempo_gravidade(self):
         """Inicia o temporizador usado para alternância de gravidade e o cronômetro do speedrun."""
@@ -77,71 +110,154 @@ class TelaJogo:
         self.tempo_inicio_jogo = pygame.time.get_ticks()
         self.tempo_conclusao = 0
 
+    def iniciar_carregamento(self):
+        """Começa a carregar o nível sem bloquear o loop principal.
+
+        A leitura (e, se preciso, a compilação) do artefato do nível roda numa
+        thread. A criação das sprites, que usa superfícies da tela, é feita
+        depois no loop principal, em etapas (`avancar_carregamento`).
+        """
+        self.pronto = False
+        self.progresso = 0.0
+        self._leitura = {}
+        self._etapas_setup = None
+        self._thread_leitura = threading.Thread(target=self._ler_nivel, daemon=True)
+        self._thread_leitura.start()
+
+    def _ler_nivel(self):
+        """Corpo da thread de carregamento: lê o artefato compilado do nível."""
+        try:
+            self._leitura['dados'] = ler_artefato(self.mapa_relativo)
+        except Exception as e:
+            self._leitura['erro'] = e
+
+    def avancar_carregamento(self, orcamento_ms=8):
+        """Executa etapas da montagem do nível por até `orcamento_ms` milissegundos.
+
+        Chamado a cada frame pela tela de carregamento, para que a janela
+        continue respondendo enquanto o nível é montado.
+
+        Args:
+            orcamento_ms (float): Tempo máximo gasto nesta chamada.
+
+        Returns:
+            bool: True quando o nível estiver pronto.
+        """
+        if self.pronto:
+            return True
+
+        if self._etapas_setup is None:
+            if self._thread_leitura is not None and self._thread_leitura.is_alive():
+                return False
+            if 'erro' in self._leitura:
+                raise self._leitura['erro']
+            self._etapas_setup = self.etapas_setup(self._leitura.pop('dados', None))
+
+        limite = time.perf_counter() + orcamento_ms / 1000
+        for _ in self._etapas_setup:
+            self._etapas_feitas += 1
+            self.progresso = min(self._etapas_feitas / self._total_etapas, 1.0)
+            if time.perf_counter() >= limite:
+                return False
+
+        self._etapas_setup = None
+        self.pronto = True
+        self.progresso = 1.0
+
+        # Se jogador foi criado, define gravidade inicial
+        if self.jogador:
+            self.jogador.set_gravidade(gravidade_normal, velocidade_y)
+        return True
+
+    def concluir_carregamento(self):
+        """Termina o carregamento de uma vez, bloqueando até o nível ficar pronto."""
+        if self._thread_leitura is not None:
+            self._thread_leitura.join()
+        while not self.avancar_carregamento(orcamento_ms=float('inf')):
+            pass
+
     def setup(self):
-        """Carrega o mapa TMX e instancia sprites e entidades.
+        """Carrega o nível e instancia todas as sprites de uma vez (ver `etapas_setup`)."""
+        for _ in self.etapas_setup():
+            pass
+
+    def etapas_setup(self, dados=None):
+        """Carrega o nível compilado do mapa TMX e instancia sprites e entidades.
 
-        - Lê camadas do TMX: Principal, Decoracao2, Entities, Agua, Escada, Items.
+        - Lê camadas do nível: Principal, Decoracao2, Entities, Agua, Escada, Items.
         - Cria CameraGroup com dimensões do mapa.
         - Instancia Jogador, Monstro(s), Item(s) e sprites de colisão.
+
+        É um gerador: devolve o controle após cada sprite criada, para que a
+        montagem possa ser distribuída entre frames.
+
+        Args:
+            dados (bytes | None): Artefato já lido (ver `compilador_nivel.ler_artefato`).
+                                  Se None, o nível é lido agora.
         """
-        mapa_relativo = join('data', 'mapa_teste.tmx')
-        mapa_absoluto = resource_path(mapa_relativo)
-        tmx_mapa = load_pygame(mapa_absoluto)
-        # LINHA ORIGINAL (load_pygame(join('data', 'mapa_teste.tmx'))) FOI REMOVIDA/SUBSTITUÍDA
+        mapa_relativo = self.mapa_relativo
+        # Nível compilado (grades, entidades e tiles já escaladas); só relê o TMX se ele mudar
+        nivel = NivelCompilado(dados) if dados is not None else carregar_nivel(mapa_relativo)
 
-        map_pixel_width = tmx_mapa.width * TILE_SIZE
-        map_pixel_height = tmx_mapa.height * TILE_SIZE
+        self._etapas_feitas = 0
+        # uma etapa por sprite e por chunk da camada estática
+        chunks = ((nivel.largura * TILE_SIZE + TAMANHO_CHUNK - 1) // TAMANHO_CHUNK) * \
+                 ((nivel.altura * TILE_SIZE + TAMANHO_CHUNK - 1) // TAMANHO_CHUNK)
+        self._total_etapas = max(1, sum(nivel.contar_tiles(nome) for nome in CAMADAS_TILES)
+                                 + len(nivel.entidades) + len(nivel.itens) + chunks)
+
+        map_pixel_width = nivel.largura * TILE_SIZE
+        map_pixel_height = nivel.altura * TILE_SIZE
 
         self.all_sprites = CameraGroup(map_pixel_width, map_pixel_height)
 
-        # Camada principal e decoração
-        for x, y, imagem in tmx_mapa.get_layer_by_name('Principal').tiles():
-            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, (self.all_sprites, self.collision_sprites))
-        for x, y, imagem in tmx_mapa.get_layer_by_name('Decoracao2').tiles():
-            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, self.all_sprites)
+        # Índice de terreno e água compartilhado por jogador e monstros
+        self.indice_nivel = IndiceNivel(nivel.largura, nivel.altura)
+
+        if nivel.largura * nivel.altura >= TILES_MINIMOS_STREAMING:
+            yield from self.etapas_setup_streaming(nivel)
+            return
+        self.nivel = None
+        self.mundo = None
+
+        # Camada principal (sólida) e decoração
+        for x, y, imagem in nivel.tiles('Principal'):
+            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, (self.all_sprites, self.collision_sprites), escalar=False)
+            self.indice_nivel.colisao.adicionar(x, y)
+            yield
+
+        # Funde as tiles sólidas em retângulos maiores para a colisão
+        self.indice_nivel.colisao.mesclar()
+        for x, y, imagem in nivel.tiles('Decoracao2'):
+            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, self.all_sprites, escalar=False)
+            yield
 
         player_data = None
         monster_data = []
         self.final_pos = None
 
-        limites_por_tipo = {}
-
-        # Processa objects layer "Entities"
-        for objeto in tmx_mapa.get_layer_by_name('Entities'):
-            obj_name = objeto.name
-
-            x_scaled = objeto.x * SCALE_FACTOR
-            y_scaled = objeto.y * SCALE_FACTOR
-            width_scaled = objeto.width * SCALE_FACTOR
+        # Entidades (camada "Entities"); os limites de patrulha já vêm do compilador
+        for entidade in nivel.entidades:
+            obj_name = entidade['nome']
+            pos = (entidade['x'], entidade['y'])
 
             if obj_name == 'Player':
-                player_data = ((x_scaled, y_scaled), map_pixel_width, map_pixel_height)
+                player_data = (pos, map_pixel_width, map_pixel_height)
 
             elif obj_name == 'final':
-                tile_img = tmx_mapa.get_tile_image_by_gid(objeto.gid)
+                tile_img = nivel.superficie(entidade['tile'])
                 if tile_img:
-                    self.final_pos = Sprite((x_scaled, y_scaled), tile_img, self.all_sprites)
+                    # o objetivo final é desenhado por cima do cenário, fora da camada estática
+                    self.final_pos = Sprite(pos, tile_img, escalar=False)
+                    self.final_pos.dinamico = True
+                    self.all_sprites.add(self.final_pos)
+                    yield
 
             elif obj_name == 'Monstro':
-                # limites de patrulha (compartilhados por tipo)
-                min_x_limite = x_scaled
-                max_x_limite = x_scaled + width_scaled
-                limites_patrulha = (min_x_limite, max_x_limite)
-
-                spawn_pos = (x_scaled, y_scaled)
-
-                if obj_name not in limites_por_tipo:
-                    min_x_limite = x_scaled
-                    max_x_limite = x_scaled + width_scaled
-                    limites_patrulha_compartilhados = (min_x_limite, max_x_limite)
-                    limites_por_tipo[obj_name] = limites_patrulha_compartilhados
-
-                limites_usados = limites_por_tipo[obj_name]
-
                 monster_data.append({
                     'name': obj_name,
-                    'pos': spawn_pos,
-                    'limites': limites_usados
+                    'pos': pos,
+                    'limites': tuple(entidade['limites'])
                 })
 
         # Instancia jogador
@@ -150,55 +266,204 @@ class TelaJogo:
             self.spawn_point = player_pos
             self.jogador = Jogador(
                 self.window, self.assets, player_pos,
-                self.all_sprites, self.collision_sprites,
+                (self.all_sprites, self.grupo_entidades), self.collision_sprites,
                 map_w, map_h,
-                self.grupo_escadas
+                self.grupo_escadas,
+                grade_colisao=self.indice_nivel.colisao
             )
+            yield
 
         # Instancia monstros
         if self.jogador:
             for data in monster_data:
                 monstro = Monstro(
                     data['pos'],
-                    (self.all_sprites, self.grupo_monstros),
+                    (self.all_sprites, self.grupo_monstros, self.grupo_entidades),
                     self.assets,
                     self.collision_sprites,
                     data['limites'],
                     self.jogador,
-                    self.grupo_monstros
+                    self.grupo_monstros,
+                    indice_nivel=self.indice_nivel
                 )
                 monstro.set_gravidade(gravidade_normal)
+                yield
 
         # Água
-        for x, y, imagem in tmx_mapa.get_layer_by_name('Agua').tiles():
-            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, (self.all_sprites, self.grupo_agua))
+        for x, y, imagem in nivel.tiles('Agua'):
+            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, (self.all_sprites, self.grupo_agua), escalar=False)
+            self.indice_nivel.agua.adicionar(x, y)
+            yield
 
         # Escadas
-        for x, y, imagem in tmx_mapa.get_layer_by_name('Escada').tiles():
-            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, self.all_sprites, self.grupo_escadas)
+        for x, y, imagem in nivel.tiles('Escada'):
+            Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, self.all_sprites, self.grupo_escadas, escalar=False)
+            yield
 
         # Itens (opcional)
-        layer_items = None
-        layer_names = [getattr(layer, 'name', None) for layer in tmx_mapa.layers]
-        if 'Items' in layer_names:
-            layer_items = tmx_mapa.get_layer_by_name('Items')
-
-        if layer_items:
-            for objeto in layer_items:
-                nome = getattr(objeto, 'name', None)
-                gid = getattr(objeto, 'gid', None)
-                if gid is None:
-                    continue
-                imagem = tmx_mapa.get_tile_image_by_gid(gid)
-                if imagem is None:
-                    continue
+        for item in nivel.itens:
+            imagem = nivel.superficie(item['tile'])
+            if imagem is None:
+                continue
+
+            nome = item['nome']
+            Item((item['x'], item['y']), imagem, nome, self.all_sprites, self.grupo_items, escalar=False)
+            if nome == 'shield':
+                self.total_shields += 1
+            yield
+
+        # Pré-renderiza as camadas de tiles em chunks
+        yield from self.all_sprites.etapas_assar_camada_estatica()
+
+        self.capturar_estado_inicial()
 
-                x_scaled = objeto.x * SCALE_FACTOR
-                y_scaled = objeto.y * SCALE_FACTOR
+    def etapas_setup_streaming(self, nivel):
+        """Monta um nível grande no modo streaming (ver `mundo_streaming`).
 
-                Item((x_scaled, y_scaled), imagem, nome, self.all_sprites, self.grupo_items)
-                if nome == 'shield':
-                    self.total_shields += 1
+        As grades de colisão e água são preenchidas para o mapa inteiro e o
+        jogador é criado; tiles, itens, monstros e o objetivo final são
+        instanciados por chunk, a partir daqui e durante o jogo.
+
+        Args:
+            nivel (NivelCompilado): Nível carregado.
+        """
+        self.nivel = nivel
+
+        for x, y, _ in nivel.tiles('Principal'):
+            self.indice_nivel.colisao.adicionar(x, y)
+        for x, y, _ in nivel.tiles('Agua'):
+            self.indice_nivel.agua.adicionar(x, y)
+        self.indice_nivel.colisao.mesclar()
+
+        self.final_pos = None
+        for entidade in nivel.entidades:
+            if entidade['nome'] == 'Player':
+                self.spawn_point = (entidade['x'], entidade['y'])
+                self.jogador = Jogador(
+                    self.window, self.assets, self.spawn_point,
+                    (self.all_sprites, self.grupo_entidades), self.collision_sprites,
+                    self.all_sprites.mundo_w, self.all_sprites.mundo_h,
+                    self.grupo_escadas,
+                    grade_colisao=self.indice_nivel.colisao
+                )
+                break
+
+        self.total_shields = sum(1 for item in nivel.itens if item['nome'] == 'shield' and item['tile'])
+
+        self.mundo = MundoStreaming(nivel, self._criar_tiles, self._criar_entidade, self._reativar_entidade)
+        self.all_sprites.assar_camada_estatica()
+        yield from self.mundo.etapas_carregar(self.area_streaming())
+
+        self.capturar_estado_inicial()
+
+    def area_streaming(self):
+        """Área em torno da qual os chunks são mantidos: câmera e jogador."""
+        area = self.all_sprites.retangulo_camera()
+        if self.jogador:
+            area = area.union(self.jogador.rect)
+        return area
+
+    def _criar_tiles(self, area):
+        """Cria as sprites das tiles de uma região do mapa (callback do streaming).
+
+        Args:
+            area (tuple[int, int, int, int]): (x0, y0, x1, y1) em tiles, com x1 e y1 exclusivos.
+
+        Returns:
+            list[Sprite]: Sprites criadas.
+        """
+        grupos_por_camada = (
+            ('Principal', (self.all_sprites, self.collision_sprites)),
+            ('Decoracao2', (self.all_sprites,)),
+            ('Agua', (self.all_sprites, self.grupo_agua)),
+            ('Escada', (self.all_sprites, self.grupo_escadas)),
+        )
+        sprites = []
+        for nome, grupos in grupos_por_camada:
+            for x, y, imagem in self.nivel.tiles(nome, area):
+                sprites.append(Sprite((x * TILE_SIZE, y * TILE_SIZE), imagem, grupos, escalar=False))
+        return sprites
+
+    def _criar_entidade(self, tipo, dados):
+        """Cria a sprite de uma entidade do nível (callback do streaming).
+
+        Args:
+            tipo (str): 'item' (camada Items) ou 'entidade' (camada Entities).
+            dados (dict): Linha da tabela do nível compilado.
+
+        Returns:
+            Sprite | None: Sprite criada, ou None se a entidade não tiver sprite.
+        """
+        pos = (dados['x'], dados['y'])
+        imagem = self.nivel.superficie(dados['tile'])
+
+        if tipo == 'item':
+            if imagem is None:
+                return None
+            return Item(pos, imagem, dados['nome'], self.all_sprites, self.grupo_items, escalar=False)
+
+        if dados['nome'] == 'final' and imagem:
+            self.final_pos = Sprite(pos, imagem, escalar=False)
+            self.final_pos.dinamico = True
+            self.all_sprites.add(self.final_pos)
+            return self.final_pos
+
+        if dados['nome'] == 'Monstro' and self.jogador:
+            monstro = Monstro(
+                pos,
+                (self.all_sprites, self.grupo_monstros, self.grupo_entidades),
+                self.assets,
+                self.collision_sprites,
+                tuple(dados['limites']),
+                self.jogador,
+                self.grupo_monstros,
+                indice_nivel=self.indice_nivel
+            )
+            self._reativar_entidade(monstro)
+            return monstro
+
+        return None
+
+    def _reativar_entidade(self, sprite):
+        """Aplica a gravidade atual a um monstro que (re)entrou no mapa."""
+        if isinstance(sprite, Monstro):
+            sprite.set_gravidade(gravidade_invertida if self.gravidade_invertida else gravidade_normal)
+
+    def capturar_estado_inicial(self):
+        """Guarda o estado inicial das sprites dinâmicas do nível (jogador, monstros, itens, final).
+
+        Para cada sprite são guardados seus atributos (`Sprite.capturar_estado`)
+        e os grupos a que pertence, na ordem de criação. As tiles não mudam
+        durante o jogo e não precisam ser capturadas.
+        """
+        # o grupo percorre as sprites na ordem em que foram adicionadas; no modo
+        # streaming as entidades dos chunks são recriadas pelo próprio mundo
+        dinamicas = [sprite for sprite in self.all_sprites if getattr(sprite, 'dinamico', False)
+                     and not (self.mundo and self.mundo.gerencia(sprite))]
+        self.estado_inicial = {
+            'sprites': [(sprite, sprite.capturar_estado(), tuple(sprite.groups())) for sprite in dinamicas],
+            'total_shields': self.total_shields,
+            'offset': self.all_sprites.offset.copy(),
+        }
+
+    def restaurar_estado_inicial(self):
+        """Volta o nível ao estado capturado em `capturar_estado_inicial`, sem recarregá-lo.
+
+        As sprites dinâmicas são restauradas no próprio objeto e readicionadas
+        aos seus grupos na ordem original (itens coletados e monstros mortos
+        voltam ao mapa). Tiles, camada estática e índices de colisão são reaproveitados.
+        """
+        for sprite, estado, grupos in self.estado_inicial['sprites']:
+            # sai e volta aos grupos para manter a ordem de desenho da primeira carga
+            sprite.kill()
+            sprite.restaurar_estado(estado)
+            sprite.add(*grupos)
+
+        self.total_shields = self.estado_inicial['total_shields']
+        self.all_sprites.offset = self.estado_inicial['offset'].copy()
+
+        if self.mundo is not None:
+            self.mundo.reiniciar()
 
     def jogador_vivo(self):
         """Reduz vida do jogador; trata respawn ou game over.
@@ -210,6 +475,7 @@ class TelaJogo:
 
         if self.jogador.vidas <= 0:
             self.inventario.clear()
+            self.painel_inventario.invalidar()
             return 'GAMEOVER'
         else:
             self.jogador.rect.topleft = self.spawn_point
@@ -247,6 +513,27 @@ class TelaJogo:
         if force_state is None:
             self.tempo_inicio_estado = pygame.time.get_ticks()
 
+    def atualizar_lod_monstros(self):
+        """Ajusta o nível de simulação de cada monstro pela distância até a câmera.
+
+        Monstros a até `RAIO_ATIVACAO_MONSTRO` px da área visível são
+        simulados por completo; até `RAIO_SONO_MONSTRO` px recebem uma
+        atualização simplificada a cada `INTERVALO_LOD_MONSTRO` frames; os
+        demais dormem. A decisão depende só da posição da câmera e do monstro,
+        então eles acordam sempre da mesma forma ao se aproximar.
+        """
+        camera = self.all_sprites.retangulo_camera()
+        area_ativa = camera.inflate(RAIO_ATIVACAO_MONSTRO * 2, RAIO_ATIVACAO_MONSTRO * 2)
+        area_reduzida = camera.inflate(RAIO_SONO_MONSTRO * 2, RAIO_SONO_MONSTRO * 2)
+
+        for monstro in self.grupo_monstros:
+            if area_ativa.colliderect(monstro.rect):
+                monstro.definir_lod('ativo')
+            elif area_reduzida.colliderect(monstro.rect):
+                monstro.definir_lod('reduzido')
+            else:
+                monstro.definir_lod('dormindo')
+
     def handle_event(self, event):
         """Processa eventos globais do jogo (janela e teclas rápidas).
 
@@ -273,8 +560,17 @@ class TelaJogo:
         Returns:
             str | tuple: Estado atual do jogo (ex: 'JOGO') ou ('VITORIA', tempo_ms).
         """
-        # Atualiza todos os sprites (Jogador, Monstros, etc.)
-        self.all_sprites.update(dt)
+        # Streaming: instancia os chunks próximos e descarrega os distantes
+        if self.mundo is not None:
+            self.mundo.atualizar(self.area_streaming())
+
+        # Define quais monstros são simulados por completo, de forma reduzida ou dormem
+        self.atualizar_lod_monstros()
+
+        # Atualiza apenas as entidades (Jogador, Monstros); tiles não têm update
+        self.grupo_entidades.update(dt)
+        self.chamadas_update = len(self.grupo_entidades)
+        self.chamadas_update_grupo_camera = len(self.all_sprites)
 
         # Verifica temporizador para alternar gravidade
         if self.tempo_inicio_estado is not None:
@@ -292,14 +588,15 @@ class TelaJogo:
                     return 'VITORIA', self.tempo_conclusao
 
             # Colisão com água
-            if pygame.sprite.spritecollideany(self.jogador, self.grupo_agua):
+            if self.indice_nivel.na_agua(self.jogador.rect):
                 estado_atual = self.jogador_vivo()
 
             # Coleta de itens
             itens_coletados = pygame.sprite.spritecollide(self.jogador, self.grupo_items, dokill=False)
             for item in itens_coletados:
                 tipo = getattr(item, 'tipo', None)
-                imagem_item = item.image.copy() if hasattr(item, 'image') and item.image is not None else None
+                # a imagem é compartilhada com a tile do item (não é alterada); a miniatura é feita pelo painel
+                imagem_item = getattr(item, 'image', None)
 
                 pickup = self.assets.get('pickup_sound')
                 if pickup:
@@ -362,7 +659,7 @@ class TelaJogo:
             # Vidas (corações)
             vidas_restantes = self.jogador.vidas
             texto_coracoes = chr(9829) * vidas_restantes
-            img_cor = self.assets['fonte'].render(texto_coracoes, True, (255, 0, 0))
+            img_cor = self.rotulo_vidas.definir(texto_coracoes)
             self.window.blit(img_cor, (10, 10))
 
             # Timer de mudança de gravidade (HUD central superior)
@@ -370,40 +667,13 @@ class TelaJogo:
                 tempo_decorrido_ms = pygame.time.get_ticks() - self.tempo_inicio_estado
                 tempo_restante_s = max(0, (self.intervalo_mudanca - tempo_decorrido_ms) / 1000)
                 texto_tempo = f"MUDANÇA EM: {tempo_restante_s:.1f}s"
-                img_tempo = self.assets['fonte'].render(texto_tempo, True, (255, 255, 255))
+                img_tempo = self.rotulo_tempo.definir(texto_tempo)
                 pos_x = self.window.get_width() // 2 - img_tempo.get_width() // 2
                 self.window.blit(img_tempo, (pos_x, 10))
 
             # Desenho do inventário (overlay)
             if self.mostrar_inventario:
-                inv_w, inv_h = 400, 200
-                inv_surf = pygame.Surface((inv_w, inv_h), pygame.SRCALPHA)
-                inv_surf.fill((0, 0, 0, 180))
-                inv_x = self.window.get_width() // 2 - inv_w // 2
-                inv_y = self.window.get_height() // 2 - inv_h // 2
-
-                titulo = self.assets['fonte2'].render('INVENTARIO', True, (255, 255, 255))
-                inv_surf.blit(titulo, (10, 10))
-
-                padding = 10
-                thumb_size = 48
-                x = padding
-                y = 40
-                for entry in self.inventario:
-                    img = entry.get('image')
-                    if isinstance(img, pygame.Surface):
-                        thumb = pygame.transform.scale(img, (thumb_size, thumb_size))
-                    else:
-                        thumb = pygame.Surface((thumb_size, thumb_size))
-                        thumb.fill((100, 100, 100))
-
-                    inv_surf.blit(thumb, (x, y))
-                    x += thumb_size + padding
-                    if x + thumb_size + padding > inv_w:
-                        x = padding
-                        y += thumb_size + padding
-
-                self.window.blit(inv_surf, (inv_x, inv_y))
+                self.painel_inventario.desenhar(self.window, self.inventario)
         else:
             # Caso não haja jogador (fallback), desenha sprites normalmente
             self.all_sprites.draw(self.window)
@@ -411,20 +681,17 @@ class TelaJogo:
     def restart(self):
         """Reinicia o estado do nível para começar um novo jogo.
 
-        Esvazia grupos, reseta inventário e contadores, zera cronômetros e
-        reinstancia o mapa (setup).
+        Reseta inventário e contadores, zera cronômetros e restaura as
+        entidades a partir do estado inicial capturado no carregamento. Se
+        ainda não houver estado capturado, esvazia os grupos e reinstancia o
+        mapa (setup).
         """
-        if hasattr(self, 'all_sprites'):
-            self.all_sprites.empty()
-
-        self.collision_sprites.empty()
-        self.grupo_escadas.empty()
-        self.grupo_monstros.empty()
-        self.grupo_agua.empty()
-        self.grupo_items.empty()
+        # o restart pode chegar antes de a tela de carregamento terminar
+        if not self.pronto:
+            self.concluir_carregamento()
 
         self.inventario.clear()
-        self.total_shields = 0
+        self.painel_inventario.invalidar()
         self.shields_coletados = 0
 
         self.tempo_inicio_estado = None
@@ -435,9 +702,27 @@ class TelaJogo:
         self.tempo_inicio_jogo = 0
         self.tempo_conclusao = 0
 
-        self.setup()
+        if self.estado_inicial is not None:
+            self.restaurar_estado_inicial()
+        else:
+            if hasattr(self, 'all_sprites'):
+                self.all_sprites.empty()
+
+            self.collision_sprites.empty()
+            self.grupo_escadas.empty()
+            self.grupo_monstros.empty()
+            self.grupo_entidades.empty()
+            self.grupo_agua.empty()
+            self.grupo_items.empty()
+            self.total_shields = 0
+
+            self.setup()
 
         if self.jogador:
             self.jogador.vidas = self.assets.get('vidas_max', self.jogador.vidas)
             self.jogador.set_gravidade(gravidade_normal, velocidade_y)
-            self.jogador.rect.topleft = self.spawn_point
\ No newline at end of file
+            self.jogador.rect.topleft = self.spawn_point
+
+        if self.mundo is not None:
+            for _ in self.mundo.etapas_carregar(self.area_streaming()):
+                pass
@@ -10,6 +10,9 @@ import os
 # Importação da correção: Usar o módulo que realmente gerencia o ranking
 import ranking_manager 
 from constantes import * 
+from utils import existe_recurso
+from cache_texto import renderizar_texto
+from composicao_tela import ComposicaoTela
 
 class TelaRanking:
     """Tela que exibe o ranking de speedrun e oferece ações ao jogador."""
@@ -18,8 +21,8 @@ class TelaRanking:
         """Inicializa a tela de ranking."""
         self.window = window
         self.assets = assets
-        # CORREÇÃO: Carrega os dados usando a função segura do manager
-        self.ranking_data = ranking_manager.carregar_ranking()
+        # CORREÇÃO: Carrega os dados usando a função segura do manager (via repositório em memória)
+        self.ranking_data = ranking_manager.REPOSITORIO_RANKING.obter()
         self.font = self.assets['fonte']
         self.pequena_font = self.assets['fonte2']
 
@@ -27,29 +30,44 @@ class TelaRanking:
         self.opcoes = ['REINICIAR', 'MENU PRINCIPAL', 'SAIR']
         self.indice_selecionado = 0
 
-        # ---- Novo: carrega imagem de fundo ----
+        # ---- Novo: imagem de fundo (chave no gerenciador de assets, carregada sob demanda) ----
         caminho_fundo = os.path.join('assets', 'new.png')
-        if os.path.exists(caminho_fundo):
-            self.fundo = pygame.transform.scale(
-                pygame.image.load(caminho_fundo).convert(),
-                (WINDOWWIDHT, WINDOWHEIGHT)
-            )
+        if existe_recurso(caminho_fundo):
+            self.assets.registrar_imagem('fundo_ranking', caminho_fundo, (WINDOWWIDHT, WINDOWHEIGHT), alpha=False)
+            self.fundo = 'fundo_ranking'
         else:
             self.fundo = None
 
+        # fundo, título e cabeçalho compostos uma vez; lista e menu só são
+        # redesenhados quando os dados ou a opção selecionada mudam
+        self.composicao = ComposicaoTela(window, self._compor)
+        self.ranking_desenhado = None
+        self.indice_desenhado = None
+        self.area_lista = None
+        self.area_menu = None
+
+    def invalidar(self):
+        """Descarta a tela composta (chamado pelo `Jogo` na troca de tela)."""
+        self.composicao.invalidar()
+
     # REMOVIDO: _carregar_ranking e _salvar_ranking (Lógica duplicada e falha)
 
-    def add_result(self, nome, tempo_ms):
+    def add_result(self, nome, tempo_ms, mapa=None):
         """Adicionar um novo resultado ao ranking, ordenar e salvar (máx 10).
         
         CORREÇÃO: Chama a função única de salvamento do ranking_manager.
+
+        Args:
+            nome (str | None): Nome do jogador.
+            tempo_ms (int): Tempo da corrida em milissegundos.
+            mapa (str | None): Mapa da corrida (guardado no backend 'sqlite').
         """
         if nome is None:
             nome = "Player"
         
         # A função do manager faz o carregamento, adição, ordenação e salvamento.
         # Ela retorna a lista atualizada.
-        novo_ranking = ranking_manager.adicionar_tempo(nome, tempo_ms)
+        novo_ranking = ranking_manager.adicionar_tempo(nome, tempo_ms, mapa)
 
         # Atualiza cache local para desenho imediato
         self.ranking_data = novo_ranking
@@ -85,37 +103,65 @@ class TelaRanking:
     def update(self, dt):
         """Atualiza o estado da tela.
 
-        CORREÇÃO: Recarrega o ranking do arquivo usando a função segura do manager.
+        O ranking vem do repositório em memória, que só lê o arquivo de novo
+        quando ele muda (tamanho ou data de modificação).
         """
-        self.ranking_data = ranking_manager.carregar_ranking()
+        self.ranking_data = ranking_manager.REPOSITORIO_RANKING.obter()
         return 'RANKING'
 
-    def draw(self):
-        """Desenha a tela de ranking na janela, incluindo fundo, título, lista e menu."""
-        # ... (código inalterado) ...
+    def _compor(self, superficie):
+        """Compõe a parte estática da tela: fundo, título e cabeçalho."""
         # fundo (imagem opcional)
         if self.fundo:
-            self.window.blit(self.fundo, (0, 0))
+            superficie.blit(self.assets[self.fundo], (0, 0))
         else:
-            self.window.fill(PRETO)
+            superficie.fill(PRETO)
 
         # título
         texto_titulo = "RANKING SPEEDRUN"
-        img_titulo = self.font.render(texto_titulo, True, (255, 255, 255))
+        img_titulo = renderizar_texto(self.font, texto_titulo, True, (255, 255, 255))
         rect_titulo = img_titulo.get_rect(center=(WINDOWWIDHT // 2, 50))
-        self.window.blit(img_titulo, rect_titulo)
+        superficie.blit(img_titulo, rect_titulo)
 
         # cabeçalho
         header_text = "POS.   NOME            TEMPO"
-        img_header = self.pequena_font.render(header_text, True, AZUL)
-        self.window.blit(img_header, (WINDOWWIDHT // 2 - img_header.get_width() // 2, 120))
+        img_header = renderizar_texto(self.pequena_font, header_text, True, AZUL)
+        superficie.blit(img_header, (WINDOWWIDHT // 2 - img_header.get_width() // 2, 120))
+
+    def draw(self):
+        """Desenha a tela de ranking na janela, incluindo fundo, título, lista e menu.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a tela inteira só após uma invalidação).
+        """
+        completo = self.composicao.comecar()
+
+        if completo or self.ranking_data != self.ranking_desenhado:
+            if self.area_lista and not completo:
+                self.composicao.restaurar(self.area_lista)
+            self.area_lista = self._desenhar_lista()
+            self.ranking_desenhado = list(self.ranking_data or [])
+
+        if completo or self.indice_selecionado != self.indice_desenhado:
+            if self.area_menu and not completo:
+                self.composicao.restaurar(self.area_menu)
+            self.area_menu = self._desenhar_menu()
+            self.indice_desenhado = self.indice_selecionado
+
+        return self.composicao.concluir()
 
-        # resultados
+    def _desenhar_lista(self):
+        """Desenha a lista de resultados.
+
+        Returns:
+            pygame.Rect: Área ocupada pela lista.
+        """
+        areas = []
         y_start = 180
         if not self.ranking_data:
             texto_vazio = "Nenhum recorde encontrado!"
-            img_vazio = self.pequena_font.render(texto_vazio, True, (255, 255, 255))
-            self.window.blit(img_vazio, (WINDOWWIDHT // 2 - img_vazio.get_width() // 2, y_start))
+            img_vazio = renderizar_texto(self.pequena_font, texto_vazio, True, (255, 255, 255))
+            areas.append(self.composicao.desenhar(img_vazio, (WINDOWWIDHT // 2 - img_vazio.get_width() // 2, y_start)))
         else:
             for i, record in enumerate(self.ranking_data):
                 posicao = f"{i + 1:02d}"
@@ -133,14 +179,22 @@ class TelaRanking:
                 else:
                     cor = (255, 255, 255)
 
-                img_linha = self.pequena_font.render(linha_ranking, True, cor)
+                img_linha = renderizar_texto(self.pequena_font, linha_ranking, True, cor)
                 x_pos = WINDOWWIDHT // 2 - img_linha.get_width() // 2
-                self.window.blit(img_linha, (x_pos, y_start + i * 40))
+                areas.append(self.composicao.desenhar(img_linha, (x_pos, y_start + i * 40)))
+        return areas[0].unionall(areas[1:])
 
-        # menu de ações (inferior)
+    def _desenhar_menu(self):
+        """Desenha o menu de ações (inferior), destacando a opção selecionada.
+
+        Returns:
+            pygame.Rect: Área ocupada pelo menu.
+        """
+        areas = []
         y_opcoes = WINDOWHEIGHT - 140
         for i, opcao in enumerate(self.opcoes):
             cor = VERMELHO if i == self.indice_selecionado else (200, 200, 200)
-            img_opcao = self.pequena_font.render(opcao, True, cor)
+            img_opcao = renderizar_texto(self.pequena_font, opcao, True, cor)
             rect_opcao = img_opcao.get_rect(center=(WINDOWWIDHT // 2, y_opcoes + i * 40 - 20))
-            self.window.blit(img_opcao, rect_opcao)
\ No newline at end of file
+            areas.append(self.composicao.desenhar(img_opcao, rect_opcao))
+        return areas[0].unionall(areas[1:])
\ No newline at end of file
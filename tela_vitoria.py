@@ -7,6 +7,8 @@ O jogador pode pressionar 'R' para registrar o tempo e visualizar o ranking.
 
 import pygame
 from constantes import *  # PRETO, VERMELHO, AZUL, WINDOWWIDHT, WINDOWHEIGHT
+from cache_texto import renderizar_texto
+from composicao_tela import ComposicaoTela
 
 
 class TelaVitoria:
@@ -26,6 +28,12 @@ class TelaVitoria:
         self.assets = assets
         self.tempo_final_ms = 0
         self.nome_jogador = ""
+        # a tela é toda estática: composta uma vez por resultado
+        self.composicao = ComposicaoTela(window, self._compor)
+
+    def invalidar(self):
+        """Descarta a tela composta (chamado pelo `Jogo` na troca de tela)."""
+        self.composicao.invalidar()
 
     def set_tempo_final(self, tempo_ms, nome):
         """Define o tempo final e o nome do jogador para exibição.
@@ -36,6 +44,7 @@ class TelaVitoria:
         """
         self.tempo_final_ms = tempo_ms
         self.nome_jogador = nome
+        self.composicao.invalidar()
 
     def handle_event(self, event):
         """Processa eventos de teclado na tela de vitória.
@@ -68,10 +77,10 @@ class TelaVitoria:
         """
         return 'VITORIA'
 
-    def draw(self):
-        """Desenha o fundo, o tempo final e a instrução para o jogador."""
-        self.window.fill(PRETO)
-        self.window.blit(self.assets['tela_vitoria'], (0, 0))
+    def _compor(self, superficie):
+        """Compõe o fundo, o tempo final e a instrução para o jogador."""
+        superficie.fill(PRETO)
+        superficie.blit(self.assets['tela_vitoria'], (0, 0))
 
         # Tempo formatado (MM:SS:CC)
         total_segundos = self.tempo_final_ms // 1000
@@ -81,12 +90,21 @@ class TelaVitoria:
         tempo_formatado = f"{minutos:02}:{segundos:02}:{ms//10:02}"
 
         texto_tempo = f"TEMPO: {tempo_formatado}"
-        img_tempo = self.assets['fonte2'].render(texto_tempo, True, (0, 255, 0))
+        img_tempo = renderizar_texto(self.assets['fonte2'], texto_tempo, True, (0, 255, 0))
         rect_tempo = img_tempo.get_rect(center=(WINDOWWIDHT // 2, WINDOWHEIGHT - 100))
-        self.window.blit(img_tempo, rect_tempo)
+        superficie.blit(img_tempo, rect_tempo)
 
         # Instrução
         texto_instrucao = "PRESSIONE R PARA ACESSAR O RANKING"
-        img_instrucao = self.assets['fonte2'].render(texto_instrucao, True, (255, 255, 255))
+        img_instrucao = renderizar_texto(self.assets['fonte2'], texto_instrucao, True, (255, 255, 255))
         rect_instrucao = img_instrucao.get_rect(center=(WINDOWWIDHT // 2, WINDOWHEIGHT - 50))
-        self.window.blit(img_instrucao, rect_instrucao)
+        superficie.blit(img_instrucao, rect_instrucao)
+
+    def draw(self):
+        """Desenha a tela de vitória.
+
+        Returns:
+            list[pygame.Rect]: Áreas alteradas (a tela inteira só após uma invalidação).
+        """
+        self.composicao.comecar()
+        return self.composicao.concluir()
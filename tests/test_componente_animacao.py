@@ -0,0 +1,85 @@
+"""
+Teste do componente de animação: em regime, animar e desenhar não aloca memória.
+
+Roda sem janela (SDL_VIDEODRIVER=dummy). Depois de um aquecimento, executa
+vários frames de `Monstro.animar` + `Sprite.draw` e compara dois snapshots do
+tracemalloc, filtrados para `sprites.py` e `componente_animacao.py`.
+"""
+
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import componente_animacao
+import sprites
+from banco_animacoes import BancoAnimacoes
+from constantes import gravidade_invertida, gravidade_normal
+from sprites import Monstro, Sprite
+
+FRAMES = 600
+
+
+def _folha():
+    """Folha de animação sintética (frames de tamanhos diferentes, como nas folhas reais)."""
+    folha = {}
+    for direcao in ('left', 'right'):
+        frames = []
+        for i in range(4):
+            frame = pygame.Surface((40 + 2 * i, 48), pygame.SRCALPHA)
+            frame.fill((60 * i, 100, 200 if direcao == 'left' else 50, 255))
+            frames.append(frame)
+        folha[direcao] = frames
+    return folha
+
+
+def _criar_monstro():
+    banco = BancoAnimacoes()
+    banco.registrar('monstro_teste', _folha())
+    assets = {
+        'animacoes_monstro': banco.obter('monstro_teste'),
+        'animacoes_monstro_invertidas': banco.obter('monstro_teste', invertida=True),
+    }
+    jogador = pygame.sprite.Sprite()
+    jogador.rect = pygame.Rect(0, 0, 50, 50)
+    grupo_monstros = pygame.sprite.Group()
+    monstro = Monstro((100, 100), grupo_monstros, assets, pygame.sprite.Group(),
+                      (0, 400), jogador, grupo_monstros)
+    return monstro
+
+
+def _frame(monstro, destino, f, offsets):
+    # troca direção e gravidade de tempos em tempos, para passar por todas as tabelas de frames
+    monstro.direcao_atual = 'right' if (f // 45) % 2 == 0 else 'left'
+    monstro.gravidade_valor = gravidade_normal if (f // 150) % 2 == 0 else gravidade_invertida
+    monstro.animar(1 / 60)
+    Sprite.draw(monstro, destino, offsets[f % len(offsets)])
+
+
+def test_animar_e_desenhar_nao_alocam():
+    pygame.display.init()
+    destino = pygame.Surface((320, 240))
+    monstro = _criar_monstro()
+    # offsets da câmera como chegam no jogo: tupla de ints e Vector2
+    offsets = ((0, 0), (30, 12), pygame.math.Vector2(25.5, 7.25))
+
+    for f in range(FRAMES):
+        _frame(monstro, destino, f, offsets)
+
+    filtros = [tracemalloc.Filter(True, sprites.__file__), tracemalloc.Filter(True, componente_animacao.__file__)]
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot().filter_traces(filtros)
+        for f in range(FRAMES):
+            _frame(monstro, destino, f, offsets)
+        depois = tracemalloc.take_snapshot().filter_traces(filtros)
+    finally:
+        tracemalloc.stop()
+
+    crescimento = [estat for estat in depois.compare_to(antes, 'lineno') if estat.size_diff > 0]
+    assert not crescimento, [str(estat) for estat in crescimento]
@@ -1,6 +1,8 @@
 import sys
 import os
 
+from constantes import PASTA_CACHE
+
 def resource_path(relative_path):
     """ Obtém o caminho absoluto do recurso, verificando se o código está sendo executado pelo PyInstaller. """
     
@@ -12,4 +14,51 @@ def resource_path(relative_path):
         # Se não, usa o caminho atual (modo de desenvolvimento)
         base_path = os.path.abspath(".")
 
-    return os.path.join(base_path, relative_path)
\ No newline at end of file
+    return os.path.join(base_path, relative_path)
+
+def caminho_cache(relative_path):
+    """ Obtém o caminho absoluto de um arquivo em `PASTA_CACHE`, na pasta do jogo e não no diretório de execução.
+
+    No executável do PyInstaller a cache fica ao lado do executável, já que a
+    pasta temporária de `resource_path` é apagada ao fim de cada execução.
+    """
+    if getattr(sys, 'frozen', False):
+        base_path = os.path.dirname(sys.executable)
+    else:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+
+    return os.path.join(base_path, PASTA_CACHE, relative_path)
+
+def abrir_recurso(relative_path):
+    """ Abre um recurso para leitura binária, do pacote de assets (se houver) ou do arquivo solto.
+
+    O objeto retornado pode ser passado ao pygame no lugar do caminho
+    (`pygame.image.load`, `pygame.mixer.Sound`, `pygame.font.Font`, `pygame.mixer.music.load`).
+    """
+    from pacote_assets import pacote_ativo
+
+    pacote = pacote_ativo()
+    if pacote is not None and relative_path in pacote:
+        return pacote.abrir(relative_path)
+    return open(resource_path(relative_path), 'rb')
+
+
+def ler_recurso(relative_path):
+    """ Retorna o conteúdo de um recurso (fatia sem cópia do pacote de assets, se houver). """
+    from pacote_assets import pacote_ativo
+
+    pacote = pacote_ativo()
+    if pacote is not None and relative_path in pacote:
+        return pacote.dados(relative_path)
+    with open(resource_path(relative_path), 'rb') as f:
+        return f.read()
+
+
+def existe_recurso(relative_path):
+    """ Retorna True se o recurso existe no pacote de assets ou como arquivo solto. """
+    from pacote_assets import pacote_ativo
+
+    pacote = pacote_ativo()
+    if pacote is not None and relative_path in pacote:
+        return True
+    return os.path.exists(resource_path(relative_path))